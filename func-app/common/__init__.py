@@ -14,7 +14,7 @@ __author__ = "Confluence Q&A Team"
 from .config import GraphConfig, SearchConfig, ContainerNames, NodeTypes, EdgeTypes
 from .graph_models import (
     BaseNode, BaseEdge, PageNode, SpaceNode, LinkNode,
-    GraphModelFactory, validate_node_data
+    GraphModelFactory, validate_node_data, compute_content_hash, link_id_for_url
 )
 from .graph_operations import GraphOperations
 
@@ -34,6 +34,8 @@ __all__ = [
     "LinkNode",
     "GraphModelFactory",
     "validate_node_data",
+    "compute_content_hash",
+    "link_id_for_url",
     
     # Operations
     "GraphOperations",
@@ -6,10 +6,17 @@ Handles environment variables, connection strings, and settings validation
 
 import os
 from typing import Dict, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
+# Blob client tuning: enough pooled HTTPS connections for concurrent page
+# downloads, and page-sized blobs fetched in a single GET
+BLOB_CONNECTION_POOL_SIZE = 200
+BLOB_MAX_SINGLE_GET_SIZE = 4 * 1024 * 1024
+BLOB_MAX_CHUNK_GET_SIZE = 1 * 1024 * 1024
+
+
 @dataclass
 class SearchConfig:
     """Configuration for Azure AI Search and Function App integration"""
@@ -102,6 +109,7 @@ class GraphConfig:
     storage_account: str
     storage_key: str
     storage_connection_string: str
+    storage_use_aad: bool = False
     
     # Processing options
     batch_size: int = 50
@@ -109,6 +117,7 @@ class GraphConfig:
     track_versions: bool = True
     max_retries: int = 3
     timeout_seconds: int = 30
+    gremlin_serializer: str = 'graphson-v2'  # graphson-v2 | graphson-v3 | graphbinary-v1
     
     # Content options
     preserve_html: bool = True
@@ -120,6 +129,9 @@ class GraphConfig:
     enable_image_analysis: bool = False
     enhanced_link_resolution: bool = False
     
+    # Shared sync blob client, created on first use
+    _blob_service_client: Any = field(default=None, init=False, repr=False, compare=False)
+    
     @classmethod
     def from_environment(cls, env_file: Optional[str] = None) -> 'GraphConfig':
         """Create configuration from environment variables"""
@@ -184,11 +196,13 @@ class GraphConfig:
             storage_account=storage_account,
             storage_key=storage_key,
             storage_connection_string=storage_connection_string,
+            storage_use_aad=os.environ.get('STORAGE_USE_AAD', 'false').lower() == 'true',
             batch_size=int(os.environ.get('GRAPH_BATCH_SIZE', '50')),
             enable_rich_content=os.environ.get('GRAPH_ENABLE_RICH_CONTENT', 'true').lower() == 'true',
             track_versions=os.environ.get('GRAPH_TRACK_VERSIONS', 'true').lower() == 'true',
             max_retries=int(os.environ.get('GRAPH_MAX_RETRIES', '3')),
             timeout_seconds=int(os.environ.get('GRAPH_TIMEOUT_SECONDS', '30')),
+            gremlin_serializer=os.environ.get('GRAPH_GREMLIN_SERIALIZER', 'graphson-v2').lower(),
             preserve_html=os.environ.get('GRAPH_PRESERVE_HTML', 'true').lower() == 'true',
             create_link_nodes=os.environ.get('GRAPH_CREATE_LINK_NODES', 'true').lower() == 'true',
             bidirectional_relationships=os.environ.get('GRAPH_BIDIRECTIONAL_RELATIONSHIPS', 'true').lower() == 'true',
@@ -215,6 +229,58 @@ class GraphConfig:
                         except ValueError:
                             continue
     
+    def get_storage_account_url(self) -> str:
+        """Get the blob endpoint URL for the storage account"""
+        return f"https://{self.storage_account}.blob.core.windows.net"
+    
+    def get_blob_service_client(self):
+        """Get the shared, connection-pooled sync BlobServiceClient"""
+        if self._blob_service_client is None:
+            import requests
+            from azure.core.pipeline.transport import RequestsTransport
+            
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=BLOB_CONNECTION_POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            
+            self._blob_service_client = self._build_blob_service_client(
+                asynchronous=False, transport=RequestsTransport(session=session)
+            )
+        return self._blob_service_client
+    
+    def create_async_blob_service_client(self):
+        """Create a connection-pooled async BlobServiceClient (call from a running event loop)"""
+        import aiohttp
+        from azure.core.pipeline.transport import AioHttpTransport
+        
+        # The transport owns the session and closes it with the client
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=BLOB_CONNECTION_POOL_SIZE))
+        return self._build_blob_service_client(asynchronous=True, transport=AioHttpTransport(session=session))
+    
+    def _build_blob_service_client(self, asynchronous: bool, transport: Any):
+        """Build a BlobServiceClient using AAD when enabled, else the connection string"""
+        if asynchronous:
+            from azure.storage.blob.aio import BlobServiceClient
+        else:
+            from azure.storage.blob import BlobServiceClient
+        
+        options = {
+            'transport': transport,
+            'max_single_get_size': BLOB_MAX_SINGLE_GET_SIZE,
+            'max_chunk_get_size': BLOB_MAX_CHUNK_GET_SIZE,
+        }
+        
+        if self.storage_use_aad:
+            # Managed identity / az login token instead of shared-key signing per request
+            if asynchronous:
+                from azure.identity.aio import DefaultAzureCredential
+            else:
+                from azure.identity import DefaultAzureCredential
+            return BlobServiceClient(self.get_storage_account_url(), credential=DefaultAzureCredential(), **options)
+        
+        return BlobServiceClient.from_connection_string(self.storage_connection_string, **options)
+    
     def validate(self) -> Dict[str, Any]:
         """Validate configuration and return status"""
         validation_results = {
@@ -241,6 +307,10 @@ class GraphConfig:
         if self.timeout_seconds < 5:
             validation_results['warnings'].append("Very short timeout may cause failures")
         
+        # Check Gremlin wire format
+        if self.gremlin_serializer != 'graphson-v2':
+            validation_results['warnings'].append("Cosmos DB Gremlin API only accepts the graphson-v2 serializer")
+        
         return validation_results
     
     def get_cosmos_connection_string(self) -> str:
@@ -254,11 +324,13 @@ class GraphConfig:
             'cosmos_database': self.cosmos_database,
             'cosmos_container': self.cosmos_container,
             'storage_account': self.storage_account,
+            'storage_use_aad': self.storage_use_aad,
             'batch_size': self.batch_size,
             'enable_rich_content': self.enable_rich_content,
             'track_versions': self.track_versions,
             'max_retries': self.max_retries,
             'timeout_seconds': self.timeout_seconds,
+            'gremlin_serializer': self.gremlin_serializer,
             'preserve_html': self.preserve_html,
             'create_link_nodes': self.create_link_nodes,
             'bidirectional_relationships': self.bidirectional_relationships,
@@ -129,8 +129,7 @@ class GraphMetrics:
         """
         Writes properties back to the graph in batched parallel requests.
         """
-        updates = 0
-        batch = []
+        queries = []
         for pid, depth in depth_map.items():
             child_ids = child_ids_map.get(pid, [])
             child_count = len(child_ids)
@@ -142,27 +141,18 @@ class GraphMetrics:
                 f".property('children_ids', '{json.dumps(child_ids)}')"
                 f".property('child_count', {child_count})"
             )
-            batch.append(stmt)
-            
-            if len(batch) == self.batch_size:
-                # Execute batch
-                for query in batch:
-                    try:
-                        if self.ops.client:
-                            self.ops.client.submit(query).all().result()
-                            updates += 1
-                    except Exception as e:
-                        logger.error(f"Failed to update node: {e}")
-                batch = []
-                
-        if batch:   # leftover
-            for query in batch:
-                try:
-                    if self.ops.client:
-                        self.ops.client.submit(query).all().result()
-                        updates += 1
-                except Exception as e:
-                    logger.error(f"Failed to update node: {e}")
+            queries.append(stmt)
+
+        if not self.ops.client:
+            return 0
+
+        updates = 0
+        for start in range(0, len(queries), self.batch_size):
+            for _, _, error in self.ops.submit_many(queries[start:start + self.batch_size]):
+                if error is None:
+                    updates += 1
+                else:
+                    logger.error(f"Failed to update node: {error}")
         return updates
 
 
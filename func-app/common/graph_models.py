@@ -7,9 +7,26 @@ Defines node and edge structures, data validation, and serialization
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 from datetime import datetime
+import hashlib
 import json
 
 
+# Page fields that change without the page content changing
+_UNHASHED_PAGE_FIELDS = ('processing', 'content_hash')
+
+
+def link_id_for_url(url: str) -> str:
+    """Stable 16-hex-char vertex id for an external link URL (dedup key, not crypto)"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def compute_content_hash(page_data: Dict[str, Any]) -> str:
+    """Hash a processed page's content (canonical JSON, processing metadata excluded)"""
+    content = {key: value for key, value in page_data.items() if key not in _UNHASHED_PAGE_FIELDS}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
 @dataclass
 class BaseNode:
     """Base class for all graph nodes"""
@@ -18,6 +35,11 @@ class BaseNode:
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     version: int = 1
+    partition_key: Optional[str] = None  # Cosmos DB partition; the space key, so a space's traversals stay in one partition
+    
+    def partition_value(self) -> str:
+        """Value stored in the container's partition key property"""
+        return self.partition_key or self.id
     
     def to_gremlin_properties(self) -> Dict[str, Any]:
         """Convert to Gremlin-compatible properties"""
@@ -65,6 +87,7 @@ class PageNode(BaseNode):
     processing_timestamp: Optional[str] = None
     pipeline_version: str = "1.0"
     phase: str = "1_comprehensive"
+    content_hash: str = ""
     
     # Phase 2 placeholders
     image_analysis_complete: bool = False
@@ -90,6 +113,7 @@ class PageNode(BaseNode):
         return cls(
             id=page_data.get('page_id', ''),
             label='Page',
+            partition_key=page_data.get('space_key') or None,
             title=page_data.get('title', ''),
             space_key=page_data.get('space_key', ''),
             space_name=space_name,
@@ -110,6 +134,7 @@ class PageNode(BaseNode):
             processing_timestamp=processing_info.get('timestamp'),
             pipeline_version=processing_info.get('pipeline_version', '1.0'),
             phase=processing_info.get('phase', '1_comprehensive'),
+            content_hash=page_data.get('content_hash') or compute_content_hash(page_data),
             updated_at=datetime.fromisoformat(page_data.get('updated', datetime.utcnow().isoformat()).replace('Z', '+00:00'))
         )
     
@@ -137,6 +162,7 @@ class PageNode(BaseNode):
             'processing_timestamp': self.processing_timestamp,
             'pipeline_version': self.pipeline_version,
             'phase': self.phase,
+            'content_hash': self.content_hash,
             'image_analysis_complete': self.image_analysis_complete,
             'parent_page_id': self.ancestors[-1] if self.ancestors else None,
             'hierarchy_depth': len(self.ancestors)
@@ -163,6 +189,7 @@ class SpaceNode(BaseNode):
         return cls(
             id=space_key,
             label='Space',
+            partition_key=space_key or None,
             key=space_key,
             name=space_name,
             description=description
@@ -195,8 +222,8 @@ class LinkNode(BaseNode):
     referenced_by_count: int = 0
     
     @classmethod
-    def from_link_data(cls, url: str, title: str, link_type: str) -> 'LinkNode':
-        """Create LinkNode from link information"""
+    def from_link_data(cls, url: str, title: str, link_type: str, space_key: str = "") -> 'LinkNode':
+        """Create LinkNode from link information (space_key: space of a page that links to it)"""
         # Extract domain from URL
         domain = ""
         if url.startswith(('http://', 'https://')):
@@ -207,12 +234,12 @@ class LinkNode(BaseNode):
                 domain = "unknown"
         
         # Always hash URL for ID to avoid invalid characters in Cosmos DB
-        import hashlib
-        link_id = hashlib.md5(url.encode()).hexdigest()
+        link_id = link_id_for_url(url)
         
         return cls(
             id=link_id,
             label='Link',
+            partition_key=space_key or None,
             url=url,
             title=title or url,
             link_type=link_type,
@@ -305,9 +332,9 @@ class GraphModelFactory:
         return SpaceNode.from_space_info(space_key, space_name, description)
     
     @staticmethod
-    def create_link_node(url: str, title: str, link_type: str) -> LinkNode:
+    def create_link_node(url: str, title: str, link_type: str, space_key: str = "") -> LinkNode:
         """Create a link node"""
-        return LinkNode.from_link_data(url, title, link_type)
+        return LinkNode.from_link_data(url, title, link_type, space_key)
     
     @staticmethod
     def create_hierarchy_edges(page_node: PageNode) -> List[HierarchyEdge]:
@@ -349,8 +376,7 @@ class GraphModelFactory:
             for link_url in external_links:
                 if link_url and link_url.startswith(('http://', 'https://')):
                     # Always hash URL for target ID to avoid invalid characters in Cosmos DB
-                    import hashlib
-                    target_id = hashlib.md5(link_url.encode()).hexdigest()
+                    target_id = link_id_for_url(link_url)
                     
                     # Forward link
                     forward_edge = LinkEdge(
@@ -7,7 +7,8 @@ Handles all Gremlin database operations with Azure Cosmos DB
 
 import time
 import asyncio
-from typing import Dict, List, Optional, Any, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Any, Union, Tuple
 from datetime import datetime
 import json
 
@@ -18,6 +19,13 @@ from gremlin_python.process.anonymous_traversal import traversal
 from gremlin_python.process.graph_traversal import __
 from gremlin_python.process.traversal import T, Order, Scope
 
+# asyncio-native driver for concurrent submits (optional; falls back to the
+# thread-backed gremlin_python client when not installed)
+try:
+    from aiogremlin import Cluster
+except ImportError:
+    Cluster = None
+
 from common.config import GraphConfig, NodeTypes, EdgeTypes
 from common.graph_models import BaseNode, BaseEdge, PageNode, SpaceNode, LinkNode
 
@@ -26,7 +34,8 @@ __all__ = [
     'get_children_ids',
     'get_sibling_ids',
     'get_adjacent_ids',
-    'get_graph_props'
+    'get_graph_props',
+    'build_upsert_query'
 ]
 
 # Export helper functions for Flask/FastAPI
@@ -46,6 +55,105 @@ def get_graph_props(graph_ops: GraphOperations, page_id: str) -> dict[str, Any]:
     """Helper function wrapper for get_graph_props"""
     return graph_ops.get_graph_props(page_id)
 
+# Gremlin message serializers by GraphConfig.gremlin_serializer name (attribute on
+# gremlin_python.driver.serializer); Cosmos DB only accepts GraphSON v2
+_MESSAGE_SERIALIZERS = {
+    'graphson-v2': 'GraphSONSerializersV2d0',
+    'graphson-v3': 'GraphSONSerializersV3d0',
+    'graphbinary-v1': 'GraphBinarySerializersV1',  # gremlinpython >= 3.5
+}
+
+def _message_serializer(name: str) -> Any:
+    """Instantiate the message serializer configured as ``name``"""
+    try:
+        return getattr(serializer, _MESSAGE_SERIALIZERS[name])()
+    except (KeyError, AttributeError):
+        raise ValueError(f"Unsupported Gremlin serializer: {name!r} (choose from {', '.join(_MESSAGE_SERIALIZERS)})")
+
+# Hard cap on concurrent submits per GraphOperations instance
+MAX_CONCURRENT_SUBMITS = 32
+
+# Characters escaped inside single-quoted Gremlin string literals, applied in one C-level pass
+_GREMLIN_ESCAPE = str.maketrans({
+    "'": "\\'",
+    '"': '\\"',
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+def _escape_gremlin_string(value: str) -> str:
+    """Escape string for Gremlin query"""
+    return value.translate(_GREMLIN_ESCAPE)
+
+def _format_property_value(value: Any) -> str:
+    """Render a property value as a Gremlin literal"""
+    if isinstance(value, str):
+        return f"'{_escape_gremlin_string(value)}'"
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    # Convert complex types to JSON strings
+    return f"'{_escape_gremlin_string(json.dumps(value, default=str))}'"
+
+def build_upsert_query(node_id: str, label: str, keys: Tuple[str, ...], vals: Tuple[Any, ...],
+                       partition_value: Optional[str] = None) -> str:
+    """Build the vertex upsert query for already-flattened property keys/values"""
+    # PARTITION_KEY_FIX: pageId holds the partition (the node's space key, else its id);
+    # the has() hint keeps the lookup in that partition
+    partition_value = _escape_gremlin_string(partition_value or node_id)
+    query_parts = [
+        f"g.V('{node_id}').has('pageId', '{partition_value}').fold()",
+        f".coalesce(unfold(), addV('{label}').property('id', '{node_id}').property('pageId', '{partition_value}'))"
+    ]
+    query_parts.extend(
+        f".property('{key}', {_format_property_value(value)})"
+        for key, value in zip(keys, vals)
+    )
+    return "".join(query_parts)
+
+class RateController:
+    """AIMD controller for the number of in-flight Gremlin submits
+    
+    Doubles the window after a run of successful submits and halves it when
+    Cosmos DB reports throttling (HTTP 429 / TooManyRequests).
+    """
+    
+    def __init__(self, initial_inflight: int = 8, min_inflight: int = 1,
+                 max_inflight: int = 64, increase_after: int = 50):
+        self.window = initial_inflight  # current number of submits allowed in flight
+        self.min_inflight = min_inflight
+        self.max_inflight = max_inflight
+        self.increase_after = increase_after
+        self._success_run = 0
+    
+    def on_success(self) -> None:
+        """Record a successful submit; grow the window after a clean run"""
+        self._success_run += 1
+        if self._success_run >= self.increase_after:
+            self.window = min(self.window * 2, self.max_inflight)
+            self._success_run = 0
+    
+    def on_throttle(self) -> None:
+        """Record a throttled submit; shrink the window"""
+        self.window = max(self.window // 2, self.min_inflight)
+        self._success_run = 0
+    
+    @staticmethod
+    def throttle_delay(error: Exception) -> Optional[float]:
+        """Return the retry delay in seconds if ``error`` is a throttle, else None"""
+        attributes = getattr(error, 'status_attributes', None) or {}
+        status = attributes.get('x-ms-status-code') or getattr(error, 'status_code', None)
+        if str(status) != '429' and 'TooManyRequests' not in str(error):
+            return None
+        retry_after_ms = attributes.get('x-ms-retry-after-ms')
+        try:
+            return float(retry_after_ms) / 1000 if retry_after_ms is not None else 0.1
+        except (TypeError, ValueError):
+            return 0.1
+
+
 class GraphOperations:
     """Core graph operations for Azure Cosmos DB Gremlin API"""
     
@@ -64,6 +172,13 @@ class GraphOperations:
             'queries_executed': 0,
             'errors_count': 0
         }
+        self._rate_controller = RateController(max_inflight=MAX_CONCURRENT_SUBMITS)
+        self._message_serializer = None
+        self._cluster = None
+        self._async_client = None
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._async_disabled = Cluster is None
+        self._executor: Optional[ThreadPoolExecutor] = None  # for submit_many, created on first use
     
     def connect(self) -> bool:
         """Establish connection to Cosmos DB Gremlin API"""
@@ -74,6 +189,9 @@ class GraphOperations:
                 f"/gremlin"
             )
             
+            # Wire format from config (GraphSON v2 by default, the only one Cosmos DB accepts)
+            message_serializer = _message_serializer(self.config.gremlin_serializer)
+            
             # Initialize Gremlin client without explicit event loop
             # This should use the default event loop from the current context
             self.client = client.Client(
@@ -81,13 +199,15 @@ class GraphOperations:
                 'g',
                 username=f"/dbs/{self.config.cosmos_database}/colls/{self.config.cosmos_container}",
                 password=self.config.cosmos_key,
-                message_serializer=serializer.GraphSONSerializersV2d0()
+                message_serializer=message_serializer,
+                pool_size=MAX_CONCURRENT_SUBMITS
             )
             
             # Test connection using synchronous method to avoid event loop conflicts
             test_result = self.client.submit("g.V().limit(1).count()").all().result()
-            print(f"✅ Connected to Cosmos DB. Current vertex count: {test_result[0] if test_result else 0}")
             
+            self._message_serializer = message_serializer
+            print(f"✅ Connected to Cosmos DB ({self.config.gremlin_serializer}). Current vertex count: {test_result[0] if test_result else 0}")
             return True
             
         except Exception as e:
@@ -97,6 +217,9 @@ class GraphOperations:
     
     def disconnect(self) -> None:
         """Close connection to Cosmos DB"""
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         if self.client:
             try:
                 self.client.close()
@@ -104,6 +227,96 @@ class GraphOperations:
             except Exception as e:
                 print(f"⚠️ Error during disconnect: {e}")
     
+    async def disconnect_async(self) -> None:
+        """Close the asyncio driver (if opened) and the legacy client"""
+        if self._cluster:
+            try:
+                await self._cluster.close()
+            except Exception as e:
+                print(f"⚠️ Error closing async Gremlin cluster: {e}")
+            self._cluster = None
+            self._async_client = None
+        self.disconnect()
+    
+    async def _get_async_client(self) -> Optional[Any]:
+        """Lazily open an aiogremlin client on the running event loop"""
+        if self._async_client is not None or self._async_disabled:
+            return self._async_client
+        
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if self._async_client is not None or self._async_disabled:
+                return self._async_client
+            
+            host = self.config.cosmos_endpoint.replace('https://', '').rstrip('/').split(':')[0]
+            try:
+                self._cluster = await Cluster.open(
+                    asyncio.get_running_loop(),
+                    hosts=[host],
+                    port=443,
+                    scheme='wss',
+                    username=f"/dbs/{self.config.cosmos_database}/colls/{self.config.cosmos_container}",
+                    password=self.config.cosmos_key,
+                    message_serializer=type(self._message_serializer or serializer.GraphSONSerializersV2d0()),
+                    max_conns=MAX_CONCURRENT_SUBMITS
+                )
+                self._async_client = await self._cluster.connect()
+            except Exception as e:
+                print(f"⚠️ aiogremlin unavailable, using threaded client: {e}")
+                self._cluster = None
+                self._async_disabled = True
+        return self._async_client
+    
+    async def submit_async(self, query: str, bindings: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Submit a query (with optional parameter bindings), backing off and retrying while Cosmos DB throttles"""
+        async_client = await self._get_async_client()
+        attempt = 0
+        while True:
+            try:
+                if async_client is not None:
+                    result = await (await async_client.submit(gremlin=query, bindings=bindings)).all()
+                else:
+                    result = await asyncio.wrap_future(self.client.submit(query, bindings).all())
+            except Exception as e:
+                delay = RateController.throttle_delay(e)
+                if delay is None or attempt >= self.config.max_retries:
+                    raise
+                self._rate_controller.on_throttle()
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            self._rate_controller.on_success()
+            return result
+    
+    def _submit_blocking(self, query: str, bindings: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Submit a query and wait for it, backing off and retrying while Cosmos DB throttles"""
+        attempt = 0
+        while True:
+            try:
+                result = self.client.submit(query, bindings).all().result()
+            except Exception as e:
+                delay = RateController.throttle_delay(e)
+                if delay is None or attempt >= self.config.max_retries:
+                    raise
+                self._rate_controller.on_throttle()
+                attempt += 1
+                time.sleep(delay)
+                continue
+            self._rate_controller.on_success()
+            return result
+    
+    def submit_many(self, queries: List[str]) -> Iterator[Tuple[str, Optional[List[Any]], Optional[Exception]]]:
+        """Submit queries concurrently from synchronous code, yielding (query, result, error) as each completes"""
+        # Threads only wait on network I/O here; one per pooled connection
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SUBMITS, thread_name_prefix='gremlin-submit')
+        
+        futures = {self._executor.submit(self._submit_blocking, query): query for query in queries}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], (None if error else future.result()), error
+    
     async def create_node(self, node: BaseNode) -> bool:
         """Create or update a single node"""
         try:
@@ -115,36 +328,18 @@ class GraphOperations:
             # TODO: PARTITION_KEY_FIX - Current workaround for Cosmos DB partition key requirements
             # Future improvement: Recreate Cosmos DB without partition key constraints for simpler graph operations
             # This is a temporary fix to handle the "Cannot add vertex with null partition key" error
+            # PARTITION_KEY_FIX: pageId (the partition key) is set once, from node.partition_value(), in the addV clause
             
-            # PARTITION_KEY_FIX: Set pageId as partition key property for Cosmos DB compatibility
-            if 'pageId' not in props:
-                props['pageId'] = node_id  # Use vertex ID as partition key value
+            # Drop unset values
+            items = [(key, value) for key, value in props.items() if value is not None]
+            keys = tuple(key for key, _ in items)
+            vals = tuple(value for _, value in items)
             
             # Build Gremlin query for upsert with proper partition key handling
-            query_parts = [f"g.V('{node_id}').fold()"]
-            # PARTITION_KEY_FIX: Use addV without explicit partition key property setting
-            query_parts.append(f".coalesce(unfold(), addV('{label}').property('id', '{node_id}').property('pageId', '{node_id}'))")
-            
-            # Add properties with proper type handling
-            for key, value in props.items():
-                if value is not None and key != 'pageId':  # PARTITION_KEY_FIX: Skip pageId as it's already set
-                    if isinstance(value, str):
-                        escaped_value = self._escape_string(value)
-                        query_parts.append(f".property('{key}', '{escaped_value}')")
-                    elif isinstance(value, bool):
-                        query_parts.append(f".property('{key}', {str(value).lower()})")
-                    elif isinstance(value, (int, float)):
-                        query_parts.append(f".property('{key}', {value})")
-                    else:
-                        # Convert complex types to JSON strings
-                        json_value = json.dumps(value, default=str)
-                        escaped_json = self._escape_string(json_value)
-                        query_parts.append(f".property('{key}', '{escaped_json}')")
-            
-            query = "".join(query_parts)
+            query = build_upsert_query(node_id, label, keys, vals, node.partition_value())
             
             # Execute query
-            result = await self.client.submit(query).all()
+            result = await self.submit_async(query)
             
             self._stats['operations_count'] += 1
             if result:
@@ -189,7 +384,7 @@ class GraphOperations:
             query = "".join(query_parts)
             
             # Execute query
-            result = await self.client.submit(query).all()
+            await self.submit_async(query)
             
             self._stats['operations_count'] += 1
             self._stats['edges_created'] += 1
@@ -205,19 +400,21 @@ class GraphOperations:
         batch_size = batch_size or self.config.batch_size
         results = {'success': 0, 'failed': 0}
         
+        # Drop duplicate ids, then group identical query shapes together so
+        # consecutive submits reuse the server's cached query plan
+        seen: set[str] = set()
+        unique_nodes = []
+        for node in nodes:
+            if node.id not in seen:
+                seen.add(node.id)
+                unique_nodes.append(node)
+        nodes = sorted(unique_nodes, key=self._node_shape)
+        
         for i in range(0, len(nodes), batch_size):
             batch = nodes[i:i + batch_size]
             print(f"📦 Processing node batch {i//batch_size + 1}/{(len(nodes) + batch_size - 1)//batch_size}")
             
-            for node in batch:
-                if await self.create_node(node):
-                    results['success'] += 1
-                else:
-                    results['failed'] += 1
-            
-            # Small delay between batches to avoid throttling
-            if i + batch_size < len(nodes):
-                time.sleep(0.1)
+            await self._run_windowed(batch, self.create_node, results)
         
         return results
     
@@ -230,22 +427,34 @@ class GraphOperations:
             batch = edges[i:i + batch_size]
             print(f"🔗 Processing edge batch {i//batch_size + 1}/{(len(edges) + batch_size - 1)//batch_size}")
             
-            for edge in batch:
-                if await self.create_edge(edge):
+            await self._run_windowed(batch, self.create_edge, results)
+        
+        return results
+    
+    @staticmethod
+    def _node_shape(node: BaseNode) -> Tuple[str, Tuple[str, ...]]:
+        """Sort key grouping nodes by label and set property names"""
+        props = node.to_gremlin_properties()
+        return (props['label'], tuple(sorted(key for key, value in props.items() if value is not None)))
+    
+    async def _run_windowed(self, items: List[Any], create, results: Dict[str, int]) -> None:
+        """Submit items concurrently, sized by the rate controller's window"""
+        position = 0
+        while position < len(items):
+            window = items[position:position + self._rate_controller.window]
+            position += len(window)
+            
+            for ok in await asyncio.gather(*(create(item) for item in window)):
+                if ok:
                     results['success'] += 1
                 else:
                     results['failed'] += 1
-            
-            # Small delay between batches
-            if i + batch_size < len(edges):
-                time.sleep(0.1)
-        
-        return results
     
     async def find_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Find a node by ID"""
         try:
-            result = await self.client.submit(query).all()
+            query = f"g.V('{node_id}').elementMap()"
+            result = await self.submit_async(query)
             
             self._stats['queries_executed'] += 1
             
@@ -261,8 +470,8 @@ class GraphOperations:
     async def find_nodes_by_label(self, label: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Find nodes by label"""
         try:
-            query = f"g.V().hasLabel('{label}').limit({limit}).valueMap()"
-            result = await self.client.submit(query).all()
+            query = f"g.V().hasLabel('{label}').limit({limit}).elementMap()"
+            result = await self.submit_async(query)
             
             self._stats['queries_executed'] += 1
             return result
@@ -276,11 +485,11 @@ class GraphOperations:
         """Find all edges from a specific node"""
         try:
             if edge_label:
-                query = f"g.V('{node_id}').outE('{edge_label}').valueMap()"
+                query = f"g.V('{node_id}').outE('{edge_label}').elementMap()"
             else:
-                query = f"g.V('{node_id}').outE().valueMap()"
+                query = f"g.V('{node_id}').outE().elementMap()"
             
-            result = await self.client.submit(query).all()
+            result = await self.submit_async(query)
             
             self._stats['queries_executed'] += 1
             return result
@@ -293,28 +502,21 @@ class GraphOperations:
     async def get_node_hierarchy(self, node_id: str, max_depth: int = 5) -> Dict[str, Any]:
         """Get the complete hierarchy for a node (parents and children)"""
         try:
-            # Get parents (recursive up)
-            parent_query = f"""
-            g.V('{node_id}').repeat(
-                out('ChildOf')
-            ).until(
-                outE('ChildOf').count().is(0)
-            ).limit({max_depth}).path().by(elementMap())
+            # Parents (recursive up) and children (recursive down) in one round-trip
+            hierarchy_query = f"""
+            g.V('{node_id}').project('parents', 'children')
+            .by(repeat(out('ChildOf')).until(outE('ChildOf').count().is(0))
+                .limit({max_depth}).path().by(elementMap()).fold())
+            .by(repeat(out('ParentOf')).until(outE('ParentOf').count().is(0))
+                .limit({max_depth}).path().by(elementMap()).fold())
             """
             
-            # Get children (recursive down)
-            children_query = f"""
-            g.V('{node_id}').repeat(
-                out('ParentOf')
-            ).until(
-                outE('ParentOf').count().is(0)
-            ).limit({max_depth}).path().by(elementMap())
-            """
-            
-            parents = await self.client.submit(parent_query).all()
-            children = await self.client.submit(children_query).all()
+            result = await self.submit_async(hierarchy_query)
+            hierarchy = result[0] if result else {}
+            parents = hierarchy.get('parents', [])
+            children = hierarchy.get('children', [])
             
-            self._stats['queries_executed'] += 2
+            self._stats['queries_executed'] += 1
             
             return {
                 'node_id': node_id,
@@ -337,7 +539,7 @@ class GraphOperations:
             ).times({depth}).dedup().hasLabel('Page').limit(50).elementMap()
             """
             
-            result = await self.client.submit(query).all()
+            result = await self.submit_async(query)
             
             self._stats['queries_executed'] += 1
             return result
@@ -385,21 +587,25 @@ class GraphOperations:
     async def get_graph_statistics(self) -> Dict[str, Any]:
         """Get overall graph statistics"""
         try:
-            # Node counts by type
-            pages_count = await self.client.submit("g.V().hasLabel('Page').count()").all()
-            spaces_count = await self.client.submit("g.V().hasLabel('Space').count()").all()
-            links_count = await self.client.submit("g.V().hasLabel('Link').count()").all()
-            
-            # Edge counts by type
-            hierarchy_edges = await self.client.submit("g.E().hasLabel('ParentOf').count()").all()
-            link_edges = await self.client.submit("g.E().hasLabel('LinksTo').count()").all()
-            space_edges = await self.client.submit("g.E().hasLabel('BelongsTo').count()").all()
-            
-            # Total counts
-            total_nodes = await self.client.submit("g.V().count()").all()
-            total_edges = await self.client.submit("g.E().count()").all()
+            # All node/edge counts in one round-trip, returned positionally
+            stats_query = """
+            g.inject(0).union(
+                V().hasLabel('Page').count(),
+                V().hasLabel('Space').count(),
+                V().hasLabel('Link').count(),
+                E().hasLabel('ParentOf').count(),
+                E().hasLabel('LinksTo').count(),
+                E().hasLabel('BelongsTo').count(),
+                V().count(),
+                E().count()
+            ).fold()
+            """
+            result = await self.submit_async(stats_query)
+            (pages_count, spaces_count, links_count,
+             hierarchy_edges, link_edges, space_edges,
+             total_nodes, total_edges) = result[0]
             
-            self._stats['queries_executed'] += 7
+            self._stats['queries_executed'] += 1
             
             return {
                 'nodes': {
@@ -429,25 +635,23 @@ class GraphOperations:
         
         try:
             # Find orphaned nodes (nodes without any edges)
-            orphaned_query = "g.V().where(bothE().count().is(0)).elementMap()"
-            orphaned_nodes = await self.client.submit(orphaned_query).all()
-            
-            # Find dangling edges (edges pointing to non-existent nodes)
-            dangling_edges_query = """
-            g.E().as('e').inV().as('in').select('e').outV().as('out')
-            .select('e').where(
-                select('in').count().is(0).or().select('out').count().is(0)
-            ).elementMap()
-            """
+            orphaned_query = "g.V().not(bothE()).elementMap()"
+            orphaned_nodes = await self.submit_async(orphaned_query)
+            
+            # Find pages not contained in any space. TinkerPop edges cannot
+            # dangle, so a missing space edge is the integrity gap to look for
+            unowned_pages_query = "g.V().hasLabel('Page').not(inE('Contains')).limit(100).elementMap()"
+            unowned_pages = await self.submit_async(unowned_pages_query)
             
             # Find duplicate edges (same from, to, label)
             duplicate_edges_query = """
             g.E().group().by(
                 project('from', 'to', 'label').by(outV().id()).by(inV().id()).by(label())
-            ).unfold().where(select(values).count(local).is(gt(1)))
+            ).unfold().filter(select(values).count(local).is(gt(1)))
             """
+            duplicate_edges = await self.submit_async(duplicate_edges_query)
             
-            self._stats['queries_executed'] += 2
+            self._stats['queries_executed'] += 3
             
             if orphaned_nodes:
                 issues.append({
@@ -456,6 +660,20 @@ class GraphOperations:
                     'samples': orphaned_nodes[:5]
                 })
             
+            if unowned_pages:
+                issues.append({
+                    'type': 'pages_without_space',
+                    'count': len(unowned_pages),
+                    'samples': unowned_pages[:5]
+                })
+            
+            if duplicate_edges:
+                issues.append({
+                    'type': 'duplicate_edges',
+                    'count': len(duplicate_edges),
+                    'samples': duplicate_edges[:5]
+                })
+            
             return {
                 'valid': len(issues) == 0,
                 'issues_found': len(issues),
@@ -475,14 +693,15 @@ class GraphOperations:
     def cleanup_orphaned_nodes(self) -> int:
         """Remove orphaned nodes (nodes with no relationships)"""
         try:
-            # Find and delete orphaned nodes
-            query = "g.V().where(bothE().count().is(0)).drop()"
+            # Find and delete orphaned nodes in one pass, returning how many were dropped
+            query = "g.V().not(bothE()).sideEffect(drop()).count()"
             result = self.client.submit(query).all().result()
+            removed = result[0] if result else 0
             
             self._stats['operations_count'] += 1
-            print(f"🧹 Cleaned up orphaned nodes")
+            print(f"🧹 Cleaned up {removed} orphaned nodes")
             
-            return len(result) if result else 0
+            return removed
             
         except Exception as e:
             print(f"❌ Error cleaning up orphaned nodes: {e}")
@@ -505,7 +724,7 @@ class GraphOperations:
     
     def _escape_string(self, value: str) -> str:
         """Escape string for Gremlin query"""
-        return value.replace("'", "\\'").replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+        return _escape_gremlin_string(value)
     
     def get_operations_stats(self) -> Dict[str, Any]:
         """Get current operations statistics"""
@@ -537,7 +756,8 @@ class GraphOperations:
             
             print(f"Found {len(pages)} pages to update with metrics")
             
-            for i, page in enumerate(pages):
+            update_queries = {}
+            for page in pages:
                 # Get id (direct value) and title (in list)
                 page_id = page.get('id')
                 title_value = page.get('title', [])
@@ -558,19 +778,19 @@ class GraphOperations:
                  .property('child_count', {child_count})
                  .property('graph_centrality_score', {centrality})
                 """
-                
-                try:
-                    self.client.submit(update_query).all().result()
+                update_queries[update_query] = title
+            
+            for i, (update_query, _, error) in enumerate(self.submit_many(list(update_queries))):
+                if error is None:
                     results['updated'] += 1
                     self._stats['nodes_updated'] += 1
-                    
-                    if (i + 1) % 5 == 0:  # Progress indicator
-                        print(f"  Progress: {i + 1}/{len(pages)} pages updated...")
-                        
-                except Exception as e:
-                    print(f"  ⚠️ Failed to update '{title[:30]}...': {e}")
+                else:
+                    print(f"  ⚠️ Failed to update '{update_queries[update_query][:30]}...': {error}")
                     results['failed'] += 1
                     self._stats['errors_count'] += 1
+                
+                if (i + 1) % 5 == 0:  # Progress indicator
+                    print(f"  Progress: {i + 1}/{len(update_queries)} pages updated...")
             
             # Verify metrics were added
             verify_query = """
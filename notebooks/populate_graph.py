@@ -9,24 +9,80 @@ import sys
 import json
 import time
 import asyncio
+import gzip
+import logging
 from typing import Dict, List, Optional, Any, Set, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import traceback
+from collections import OrderedDict, defaultdict, deque
 
+# orjson parses the page blobs straight from bytes, noticeably faster than json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-# Azure Storage
-from azure.storage.blob import BlobServiceClient
+# Filter of page ids written by this populator, so incremental validation only
+# looks up pages that may exist (optional; every page is looked up without it)
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
 
 # Local imports
 from common.config import GraphConfig, ContainerNames, NodeTypes, EdgeTypes
 from common.graph_models import (
     PageNode, SpaceNode, LinkNode, 
-    GraphModelFactory, validate_node_data
+    GraphModelFactory, validate_node_data, compute_content_hash, link_id_for_url
 )
-from common.graph_operations import GraphOperations
+from common.graph_operations import GraphOperations, MAX_CONCURRENT_SUBMITS
 from common.graph_metrics import GraphMetrics
-from notebooks.utils import ProgressTracker, DataValidator, GraphAnalyzer
+from notebooks.utils import ProgressTracker, DataValidator, GraphAnalyzer, batch_items
+
+# Progress, summary and cleanup output; one logging call per block instead of a
+# print (and stdout flush) per line. Shared with notebooks.utils.ProgressTracker,
+# which gives it its default stdout handler.
+logger = logging.getLogger('graph_populator')
+
+# A Gremlin upsert template (binding names prefixed with "{s}"), its bindings,
+# and how many nodes/edges it upserts
+Statement = Tuple[str, Dict[str, Any], int]
+
+# Upserts per Gremlin round-trip, and a cap on the combined script length
+SUBMIT_BATCH_SIZE = 50
+MAX_BATCH_SCRIPT_CHARS = 60_000
+
+# Concurrent blob downloads when loading processed pages
+BLOB_DOWNLOAD_CONCURRENCY = 100
+LIST_BLOBS_PAGE_SIZE = 5000
+
+# Per-item failures kept for the end-of-run summary (oldest dropped beyond this)
+MAX_RECORDED_ERRORS = 100
+
+# Elements dropped per cleanup round-trip
+CLEANUP_DROP_CHUNK_SIZE = 5000
+
+# Page ids per bulk vertex lookup (stored content hashes, existence checks)
+HASH_LOOKUP_BATCH_SIZE = 100
+
+# False-positive rate of the written-page-ids filter
+KNOWN_IDS_ERROR_RATE = 0.001
+
+# Results kept for the read APIs (find_page, get_space_statistics, ...), and for how long;
+# writes through this populator clear them
+READ_CACHE_SIZE = 2048
+READ_CACHE_TTL_SECONDS = 300
+
+# processing/process.py gzips processed blobs when COMPRESS_PROCESSED=true
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _decode_page_blob(data: bytes) -> Dict[str, Any]:
+    """Parse a processed page blob, plain or gzip-compressed JSON"""
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return _json_loads(data)
 
 
 class GraphPopulator:
@@ -36,7 +92,7 @@ class GraphPopulator:
         """Initialize graph populator with configuration"""
         self.config = config
         self.graph_ops = GraphOperations(config)
-        self.blob_service = BlobServiceClient.from_connection_string(config.storage_connection_string)
+        self.blob_service = config.get_blob_service_client()
         self.factory = GraphModelFactory()
         
         # Tracking and statistics
@@ -48,12 +104,22 @@ class GraphPopulator:
         self.spaces_cache: Dict[str, SpaceNode] = {}
         self.processed_pages: Set[str] = set()
         self.link_nodes_cache: Dict[str, LinkNode] = {}
+        self._page_nodes: Dict[str, PageNode] = {}  # page_id -> model, reused by _update_relationships
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # shared by every async phase
+        self._node_templates: Dict[Tuple[str, Tuple[str, ...]], str] = {}  # (label, property keys) -> upsert template
+        self._partitions: Dict[str, str] = {}  # vertex id -> partition value, for edge traversal hints
+        self._partition_key = getattr(config, "partition_key", "pageId")  # Configurable partition key property
+        self._errors: deque = deque(maxlen=MAX_RECORDED_ERRORS)  # reported once by _finalize_stats
+        self._known_page_ids = None  # ScalableBloomFilter created by a full population, see _remember_written_pages
+        self._start_ns: Optional[int] = None  # monotonic start of the current run, for processing_time_seconds
+        self._read_cache: OrderedDict = OrderedDict()  # (method, args) -> (expires at, result), see _cached_read
         
         # Statistics
         self.stats = {
             'start_time': None,
             'end_time': None,
             'pages_processed': 0,
+            'pages_unchanged': 0,
             'spaces_created': 0,
             'links_created': 0,
             'edges_created': 0,
@@ -74,6 +140,7 @@ class GraphPopulator:
         print("=" * 60)
         
         self.stats['start_time'] = datetime.utcnow()
+        self._start_ns = time.monotonic_ns()
         
         try:
             # Connect to graph database
@@ -81,24 +148,26 @@ class GraphPopulator:
                 return self._create_error_result("Failed to connect to graph database")
             
             # Load all processed pages
-            processed_pages = self._load_processed_pages(container_name)
+            processed_pages = self._run(self._load_processed_pages(container_name))
             if not processed_pages:
                 return self._create_error_result("No processed pages found")
             
             print(f"📊 Found {len(processed_pages)} processed pages")
             
             # Phase 1: Create space nodes
-            self._create_space_nodes(processed_pages)
+            self._run(self._create_space_nodes(processed_pages))
             
-            # Phase 2: Create page nodes
-            self._create_page_nodes(processed_pages)
-            
-            # Phase 3: Create link nodes (for external links)
+            # Phase 2: Create link nodes (for external links), so page traversals can reach them
             if self.config.create_link_nodes:
-                self._create_link_nodes(processed_pages)
+                self._run(self._create_link_nodes(processed_pages))
+            
+            # Phase 3: Create page nodes together with their space, hierarchy and external link edges
+            # (consumes processed_pages)
+            deferred_edges = self._run(self._create_page_nodes(processed_pages))
             
-            # Phase 4: Create relationships
-            self._create_relationships(processed_pages)
+            # Phase 4: Create remaining relationships (page-to-page links)
+            self._run(self._create_relationships(deferred_edges))
+            del deferred_edges
 
             # Phase 5: Compute metrics
             if os.getenv("GRAPH_COMPUTE_METRICS", "true").lower() == "true":
@@ -106,30 +175,25 @@ class GraphPopulator:
                 gm.run_all()            
             
             # Phase 5: Validate and analyze
-            # Create fresh event loop for async validation
             try:
-                import asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self._validate_graph())
-                loop.close()
+                self._run(self._validate_graph())
             except Exception as e:
                 print(f"⚠️ Graph validation failed: {e}")
                 print("Continuing without validation...")
             
             # Final statistics
-            self._finalize_stats()
+            self._run(self._finalize_stats())
             
             return self._create_success_result()
             
         except Exception as e:
-            self.stats['errors_count'] += 1
+            self._record_error('populate_all', e, details=traceback.format_exc())
             print(f"❌ Critical error during graph population: {e}")
-            traceback.print_exc()
             return self._create_error_result(str(e))
         
         finally:
-            self.graph_ops.disconnect()
+            self._read_cache.clear()
+            self._close_loop()
     
     def populate_incremental(self, since: Optional[str] = None, container_name: str = ContainerNames.PROCESSED) -> Dict[str, Any]:
         """Populate graph with only changed pages since specified time"""
@@ -137,13 +201,14 @@ class GraphPopulator:
         print("=" * 60)
         
         self.stats['start_time'] = datetime.utcnow()
+        self._start_ns = time.monotonic_ns()
         
         # Determine cutoff time
         if since:
             cutoff_time = datetime.fromisoformat(since.replace('Z', '+00:00'))
         else:
             # Default to last 24 hours
-            cutoff_time = datetime.utcnow() - timedelta(hours=24)
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
         
         print(f"📅 Processing changes since: {cutoff_time.isoformat()}")
         
@@ -153,176 +218,356 @@ class GraphPopulator:
                 return self._create_error_result("Failed to connect to graph database")
             
             # Load only changed pages
-            changed_pages = self._load_changed_pages(container_name, cutoff_time)
+            changed_pages = self._run(self._load_changed_pages(container_name, cutoff_time))
             if not changed_pages:
                 print("ℹ️ No changed pages found")
                 return self._create_success_result()
             
             print(f"📊 Found {len(changed_pages)} changed pages")
             
+            # Skip pages whose content the graph already holds
+            changed_pages = self._run(self._drop_unchanged_pages(changed_pages))
+            if not changed_pages:
+                print("ℹ️ No page content changed")
+                self._run(self._finalize_stats())
+                return self._create_success_result()
+            
             # Process changed pages
-            self._process_changed_pages(changed_pages)
+            self._run(self._process_changed_pages(changed_pages))
             
             # Update relationships for affected pages
-            self._update_relationships(changed_pages)
+            self._run(self._update_relationships(changed_pages))
+            self._page_nodes.clear()
             
             # Validate changes
-            self._validate_incremental_changes(changed_pages)
+            self._run(self._validate_incremental_changes(changed_pages))
             
-            self._finalize_stats()
+            self._run(self._finalize_stats())
             
             return self._create_success_result()
             
         except Exception as e:
-            self.stats['errors_count'] += 1
+            self._record_error('populate_incremental', e, details=traceback.format_exc())
             print(f"❌ Critical error during incremental population: {e}")
             return self._create_error_result(str(e))
         
         finally:
+            self._read_cache.clear()
+            self._close_loop()
+    
+    def _run(self, coro):
+        """Run a coroutine on the populator's event loop, opening it on first use"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+        return self._loop.run_until_complete(coro)
+    
+    def _close_loop(self) -> None:
+        """Disconnect from the graph and close the event loop"""
+        if self._loop is None or self._loop.is_closed():
             self.graph_ops.disconnect()
+            return
+        try:
+            self._loop.run_until_complete(self.graph_ops.disconnect_async())
+        finally:
+            self._loop.close()
+            self._loop = None
+    
+    def _record_error(self, source: str, error: Any, warning: bool = False, details: Optional[str] = None) -> None:
+        """Count a failure and keep it for the end-of-run summary instead of printing it as it happens"""
+        record = {'source': source, 'error': str(error), 'level': 'warning' if warning else 'error'}
+        if details:
+            record['details'] = details
+        self._errors.append(record)
+        self.stats['warnings_count' if warning else 'errors_count'] += 1
     
     def _connect_to_graph(self) -> bool:
         """Establish connection to graph database"""
         print("🔌 Connecting to Cosmos DB...")
         return self.graph_ops.connect()
 
-    def _create_gremlin_node_query(self, node) -> str:
-        """Create Gremlin query for node creation"""
+    def _create_gremlin_node_query(self, node) -> Statement:
+        """Create parameterized Gremlin upsert for node creation"""
         # Convert node to properties
         props = node.to_gremlin_properties()
         node_id = props.pop('id')
         label = props.pop('label')
         
-        # Set partition key property for Cosmos DB compatibility
-        PARTITION_KEY = getattr(self.config, "partition_key", "pageId")  # Configurable partition key
-        if PARTITION_KEY not in props:
-            props[PARTITION_KEY] = node_id
-        
-        # Build Gremlin query for upsert
-        query_parts = [f"g.V('{node_id}').fold()"]
-        query_parts.append(f".coalesce(unfold(), addV('{label}').property('id', '{node_id}').property('{PARTITION_KEY}', '{node_id}'))")
-        
-        # Add properties with proper type handling
-        for key, value in props.items():
-            if value is not None and key != PARTITION_KEY:
-                if isinstance(value, str):
-                    # Escape single quotes in strings
-                    escaped_value = value.replace("'", "\\'")
-                    query_parts.append(f".property('{key}', '{escaped_value}')")
-                elif isinstance(value, bool):
-                    query_parts.append(f".property('{key}', {str(value).lower()})")
-                elif isinstance(value, (int, float)):
-                    query_parts.append(f".property('{key}', {value})")
-                else:
-                    # Convert complex types to JSON strings
-                    import json
-                    json_value = json.dumps(value, default=str)
-                    escaped_json = json_value.replace("'", "\\'")
-                    query_parts.append(f".property('{key}', '{escaped_json}')")
+        keys = tuple(key for key, value in props.items() if value is not None and key != self._partition_key)
+        template = self._node_templates.get((label, keys))
+        if template is None:
+            template = self._build_node_template(label, keys, self._partition_key)
+            self._node_templates[(label, keys)] = template
         
-        return "".join(query_parts)
-
-    def _create_gremlin_edge_query(self, edge) -> str:
-        """Create Gremlin query for edge creation"""
-        # Get edge properties
-        props = edge.to_gremlin_properties()
+        # Nodes are partitioned by space, so edges within a space stay in one partition
+        partition = node.partition_value()
+        self._partitions[node_id] = partition
+        bindings: Dict[str, Any] = {'id': node_id, 'pk': partition}
+        for i, key in enumerate(keys, 1):
+            value = props[key]
+            if isinstance(value, (list, dict)):
+                # Convert complex types to JSON strings
+                value = json.dumps(value, default=str)
+            bindings[f"v{i}"] = value
         
-        # Build Gremlin query for edge upsert
+        return template, bindings, 1
+    
+    @staticmethod
+    def _build_node_template(label: str, keys: Tuple[str, ...], partition_key: str) -> str:
+        """Build the upsert template shared by every node with this label and property set"""
+        # Values are bound, so the script text only varies with the property
+        # set and the server can reuse its compiled plan
         query_parts = [
-            f"g.V('{edge.from_id}').as('from')",
-            f".V('{edge.to_id}').as('to')",
-            f".coalesce(",
-            f"  __.select('from').outE('{edge.label}').where(inV().as('to')),",
-            f"  __.select('from').addE('{edge.label}').to('to')",
-            f")"
+            f"g.V({{s}}id).has('{partition_key}', {{s}}pk).fold()",
+            f".coalesce(unfold(), addV('{label}').property('id', {{s}}id).property('{partition_key}', {{s}}pk))"
         ]
+        query_parts.extend(f".property('{key}', {{s}}v{i})" for i, key in enumerate(keys, 1))
+        return "".join(query_parts)
+
+    def _create_gremlin_edges_query(self, from_id: str, edges: List[Any]) -> Statement:
+        """Create one parameterized Gremlin upsert for all edges leaving a vertex"""
+        # The source vertex is looked up once; each edge is upserted from its
+        # target side so a missing target only skips that edge
+        bindings: Dict[str, Any] = {}
+        query_parts = [f"g.{self._vertex_step('from', from_id, bindings)}.as('from')"]
+        
+        for i, edge in enumerate(edges):
+            query_parts.append(
+                f".sideEffect({self._vertex_step(f'to{i}', edge.to_id, bindings)}.coalesce("
+                f"inE('{edge.label}').where(outV().as('from')), "
+                f"addE('{edge.label}').from('from'))"
+            )
+            self._append_edge_properties(edge, i, query_parts, bindings)
+            query_parts.append(")")
         
-        # Add properties to edge
-        for key, value in props.items():
+        return "".join(query_parts), bindings, len(edges)
+    
+    def _create_gremlin_page_with_edges_query(self, page_node: PageNode, edges: List[Any]) -> Statement:
+        """Create one parameterized Gremlin upsert for a page vertex and its edges to existing vertices"""
+        # Edges hang off the upserted vertex, so Cosmos DB resolves the page once
+        template, bindings, _ = self._create_gremlin_node_query(page_node)
+        query_parts = [template, ".as('page')"]
+        
+        for i, edge in enumerate(edges):
+            if edge.from_id == page_node.id:
+                query_parts.append(
+                    f".sideEffect({self._vertex_step(f'e{i}', edge.to_id, bindings)}.coalesce("
+                    f"inE('{edge.label}').where(outV().as('page')), "
+                    f"addE('{edge.label}').from('page'))"
+                )
+            else:
+                query_parts.append(
+                    f".sideEffect({self._vertex_step(f'e{i}', edge.from_id, bindings)}.coalesce("
+                    f"outE('{edge.label}').where(inV().as('page')), "
+                    f"addE('{edge.label}').to('page'))"
+                )
+            self._append_edge_properties(edge, i, query_parts, bindings)
+            query_parts.append(")")
+        
+        return "".join(query_parts), bindings, 1 + len(edges)
+    
+    def _vertex_step(self, name: str, vertex_id: str, bindings: Dict[str, Any]) -> str:
+        """Bind a vertex id as name and return its V() step, with a partition hint when the partition is known"""
+        bindings[name] = vertex_id
+        partition = self._partitions.get(vertex_id)
+        if partition is None:
+            return f"V({{s}}{name})"
+        bindings[f"{name}pk"] = partition
+        return f"V({{s}}{name}).has('{self._partition_key}', {{s}}{name}pk)"
+    
+    @staticmethod
+    def _append_edge_properties(edge, index: int, query_parts: List[str], bindings: Dict[str, Any]) -> None:
+        """Append bound property steps for the edge at position index of a statement"""
+        for key, value in edge.to_gremlin_properties().items():
             if value is not None:
-                if isinstance(value, str):
-                    escaped_value = value.replace("'", "\\'")
-                    query_parts.append(f".property('{key}', '{escaped_value}')")
-                elif isinstance(value, (int, float, bool)):
-                    query_parts.append(f".property('{key}', {value})")
-                else:
-                    import json
-                    json_value = json.dumps(value, default=str)
-                    escaped_json = json_value.replace("'", "\\'")
-                    query_parts.append(f".property('{key}', '{escaped_json}')")
+                if isinstance(value, (list, dict)):
+                    value = json.dumps(value, default=str)
+                name = f"e{index}v{len(bindings)}"
+                query_parts.append(f".property('{key}', {{s}}{name})")
+                bindings[name] = value
+    
+    def _create_edge_statements(self, edges: List[Any]) -> List[Statement]:
+        """Group edges by source vertex into one upsert statement each"""
+        edges_by_from: Dict[str, List[Any]] = defaultdict(list)
+        for edge in edges:
+            edges_by_from[edge.from_id].append(edge)
+        return [self._create_gremlin_edges_query(from_id, group) for from_id, group in edges_by_from.items()]
+    
+    async def _submit_batch(self, statements: List[Statement], batch_size: int = SUBMIT_BATCH_SIZE) -> int:
+        """Submit upsert statements in concurrent multi-statement round-trips, returning how many upserts succeeded"""
+        succeeded = await self._submit_statements(statements, batch_size)
+        return sum(upserts for _, _, upserts in succeeded)
+    
+    async def _submit_statements(self, statements: List[Statement], batch_size: int = SUBMIT_BATCH_SIZE) -> List[Statement]:
+        """Submit upsert statements in concurrent multi-statement round-trips, returning those that succeeded"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBMITS)
         
-        return "".join(query_parts)
+        async def bounded(batch: List[Statement]) -> List[Statement]:
+            async with semaphore:
+                return await self._flush_batch(batch)
+        
+        results = await asyncio.gather(*(bounded(batch) for batch in self._split_batches(statements, batch_size)))
+        return [statement for succeeded in results for statement in succeeded]
+    
+    @staticmethod
+    def _split_batches(statements: List[Statement], batch_size: int) -> List[List[Statement]]:
+        """Group statements into batches bounded by count and request size"""
+        batches: List[List[Statement]] = []
+        batch: List[Statement] = []
+        batch_chars = 0
+        
+        for statement in statements:
+            template, bindings, _ = statement
+            size = len(template) + sum(len(str(value)) for value in bindings.values())
+            if batch and (len(batch) >= batch_size or batch_chars + size > MAX_BATCH_SCRIPT_CHARS):
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(statement)
+            batch_chars += size
+        
+        if batch:
+            batches.append(batch)
+        return batches
     
-    def _load_processed_pages(self, container_name: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _bind(template: str, bindings: Dict[str, Any], prefix: str) -> Tuple[str, Dict[str, Any]]:
+        """Give a statement's binding names a prefix unique within its batch"""
+        return template.format(s=prefix), {prefix + name: value for name, value in bindings.items()}
+    
+    async def _flush_batch(self, batch: List[Statement]) -> List[Statement]:
+        """Run one batch as a single traversal; isolate failures per statement if it is rejected"""
+        # Each upsert runs as a side effect of one traverser, so a statement
+        # that finds no vertex (e.g. a missing edge target) can't halt the rest.
+        # Positional prefixes keep the script identical across same-shaped batches
+        script_parts = ["g.inject(0)"]
+        batch_bindings: Dict[str, Any] = {}
+        for i, (template, bindings, _) in enumerate(batch):
+            query, bound = self._bind(template, bindings, f"s{i}_")
+            script_parts.append(f".sideEffect({query[2:]})")
+            batch_bindings.update(bound)
+        
+        try:
+            await self.graph_ops.submit_async("".join(script_parts), batch_bindings)
+            return batch
+        except Exception as e:
+            print(f"⚠️  Batch of {len(batch)} upserts failed ({e}); retrying individually")
+        
+        succeeded = []
+        for statement in batch:
+            template, bindings, _ = statement
+            try:
+                await self.graph_ops.submit_async(*self._bind(template, bindings, "s0_"))
+                succeeded.append(statement)
+            except Exception as e:
+                self._record_error('upsert', e)
+        return succeeded
+    
+    async def _load_processed_pages(self, container_name: str) -> List[Dict[str, Any]]:
         """Load all processed pages from storage"""
         print("📂 Loading processed pages from storage...")
         
         try:
-            container_client = self.blob_service.get_container_client(container_name)
-            blobs = list(container_client.list_blobs())
+            return await self._load_pages(container_name)
             
-            processed_pages = []
-            for blob in blobs:
-                if blob.name.endswith('.json'):
+        except Exception as e:
+            print(f"❌ Error loading processed pages: {e}")
+            self.stats['errors_count'] += 1
+            raise
+    
+    async def _load_changed_pages(self, container_name: str, since: datetime) -> List[Dict[str, Any]]:
+        """Load only pages changed since specified time"""
+        print(f"📂 Loading pages changed since {since.isoformat()}...")
+        
+        try:
+            # Blob last_modified is timezone-aware UTC; a naive cutoff is taken as UTC
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return await self._load_pages(container_name, since.astimezone(timezone.utc))
+            
+        except Exception as e:
+            print(f"❌ Error loading changed pages: {e}")
+            self.stats['errors_count'] += 1
+            raise
+    
+    async def _load_pages(self, container_name: str, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Download, parse and validate page blobs (all of them, or those modified since a UTC cutoff)"""
+        semaphore = asyncio.Semaphore(BLOB_DOWNLOAD_CONCURRENCY)
+        
+        # One async client (and connection pool) for the whole batch
+        async with self.config.create_async_blob_service_client() as blob_service:
+            container_client = blob_service.get_container_client(container_name)
+            # Blob index tags are not available on hierarchical-namespace (ADLS Gen2)
+            # accounts, so changed blobs are picked out of the listing by last_modified
+            blobs = container_client.list_blobs(results_per_page=LIST_BLOBS_PAGE_SIZE)
+            
+            async def load_one(blob_name: str) -> Dict[str, Any]:
+                async with semaphore:
                     try:
-                        blob_client = container_client.get_blob_client(blob.name)
-                        content = blob_client.download_blob().readall()
-                        page_data = json.loads(content)
-                        
-                        # Validate data structure - must be dictionary with required fields
-                        if not isinstance(page_data, dict):
-                            raise ValueError(f"Data in {blob.name} is not a dictionary: {type(page_data)}")
-                        
-                        # Validate required fields exist
-                        required_fields = ['page_id', 'title', 'space_key', 'spaceName']
-                        missing_fields = [field for field in required_fields if field not in page_data]
-                        if missing_fields:
-                            raise ValueError(f"Missing required fields in {blob.name}: {missing_fields}")
-                        
-                        # Convert camelCase to snake_case for consistency
-                        if 'spaceName' in page_data:
-                            page_data['space_name'] = page_data.pop('spaceName')
-                        
-                        # Validate data types for critical fields
-                        if not isinstance(page_data.get('page_id'), (str, int)):
-                            raise ValueError(f"page_id in {blob.name} must be string or int, got {type(page_data.get('page_id'))}")
-                        
-                        if not isinstance(page_data.get('title'), str):
-                            raise ValueError(f"title in {blob.name} must be string, got {type(page_data.get('title'))}")
-                        
-                        if not isinstance(page_data.get('space_key'), str):
-                            raise ValueError(f"space_key in {blob.name} must be string, got {type(page_data.get('space_key'))}")
-                        
-                        # Validate and normalize links structure
-                        if 'links' in page_data:
-                            if not isinstance(page_data['links'], dict):
-                                raise ValueError(f"links in {blob.name} must be dictionary, got {type(page_data['links'])}")
-                            
-                            expected_link_keys = ['all', 'internal', 'external']
-                            for key in expected_link_keys:
-                                if key not in page_data['links']:
-                                    raise ValueError(f"links in {blob.name} missing required key: {key}")
-                                
-                                if not isinstance(page_data['links'][key], list):
-                                    raise ValueError(f"links.{key} in {blob.name} must be list, got {type(page_data['links'][key])}")
-                            
-                            # Normalize links structure to list of dicts
-                            page_data['links'] = self._normalize_links(page_data['links'])
-                        
-                        processed_pages.append(page_data)
-                            
+                        downloader = await container_client.get_blob_client(blob_name).download_blob()
+                        return self._validate_page_dict(_decode_page_blob(await downloader.readall()), blob_name)
                     except Exception as e:
-                        print(f"❌ Error loading {blob.name}: {e}")
-                        self.stats['errors_count'] += 1
+                        self._record_error(blob_name, e)
                         # Don't continue with invalid data - fail fast
                         raise
             
-            return processed_pages
+            # Start each download as soon as its blob is listed, so listing
+            # further pages overlaps with the downloads already in flight
+            downloads: List[asyncio.Future] = []
+            try:
+                async for blob in blobs:
+                    if blob.name.endswith('.json') and (since is None or blob.last_modified >= since):
+                        downloads.append(asyncio.ensure_future(load_one(blob.name)))
+                return list(await asyncio.gather(*downloads))
+            except BaseException:
+                # Stop the remaining downloads before the client closes under them
+                for task in downloads:
+                    task.cancel()
+                await asyncio.gather(*downloads, return_exceptions=True)
+                raise
+    
+    # Page blob schema, checked in a single pass by _validate_page_dict
+    _REQUIRED_PAGE_FIELDS = ('page_id', 'title', 'space_key', 'spaceName')
+    _PAGE_FIELD_TYPES = (
+        ('page_id', (str, int), 'string or int'),
+        ('title', str, 'string'),
+        ('space_key', str, 'string'),
+    )
+    _LINK_KEYS = ('all', 'internal', 'external')
+    
+    def _validate_page_dict(self, page_data: Any, blob_name: str) -> Dict[str, Any]:
+        """Validate a parsed page blob and normalize it in place"""
+        # Validate data structure - must be dictionary with required fields
+        if not isinstance(page_data, dict):
+            raise ValueError(f"Data in {blob_name} is not a dictionary: {type(page_data)}")
+        
+        missing_fields = [field for field in self._REQUIRED_PAGE_FIELDS if field not in page_data]
+        if missing_fields:
+            raise ValueError(f"Missing required fields in {blob_name}: {missing_fields}")
+        
+        # Validate data types for critical fields
+        for field, expected, description in self._PAGE_FIELD_TYPES:
+            if not isinstance(page_data[field], expected):
+                raise ValueError(f"{field} in {blob_name} must be {description}, got {type(page_data[field])}")
+        
+        # Convert camelCase to snake_case for consistency
+        page_data['space_name'] = page_data.pop('spaceName')
+        
+        # Validate and normalize links structure
+        links = page_data.get('links')
+        if links is not None or 'links' in page_data:
+            if not isinstance(links, dict):
+                raise ValueError(f"links in {blob_name} must be dictionary, got {type(links)}")
             
-        except Exception as e:
-            print(f"❌ Error loading processed pages: {e}")
-            self.stats['errors_count'] += 1
-            raise
+            for key in self._LINK_KEYS:
+                if not isinstance(links.get(key), list):
+                    if key not in links:
+                        raise ValueError(f"links in {blob_name} missing required key: {key}")
+                    raise ValueError(f"links.{key} in {blob_name} must be list, got {type(links[key])}")
+            
+            # Normalize links structure to list of dicts
+            page_data['links'] = self._normalize_links(links)
+        
+        return page_data
     
     def _normalize_links(self, links_dict: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Normalize links structure from dict to list of dicts"""
@@ -337,78 +582,7 @@ class GraphPopulator:
                 })
         return normalized_links
     
-    def _load_changed_pages(self, container_name: str, since: datetime) -> List[Dict[str, Any]]:
-        """Load only pages changed since specified time"""
-        print(f"📂 Loading pages changed since {since.isoformat()}...")
-        
-        try:
-            container_client = self.blob_service.get_container_client(container_name)
-            blobs = list(container_client.list_blobs())
-            
-            changed_pages = []
-            for blob in blobs:
-                if blob.name.endswith('.json') and blob.last_modified >= since:
-                    try:
-                        blob_client = container_client.get_blob_client(blob.name)
-                        content = blob_client.download_blob().readall()
-                        page_data = json.loads(content)
-                        
-                        # Validate data structure - must be dictionary with required fields
-                        if not isinstance(page_data, dict):
-                            raise ValueError(f"Data in {blob.name} is not a dictionary: {type(page_data)}")
-                        
-                        # Validate required fields exist
-                        required_fields = ['page_id', 'title', 'space_key', 'spaceName']
-                        missing_fields = [field for field in required_fields if field not in page_data]
-                        if missing_fields:
-                            raise ValueError(f"Missing required fields in {blob.name}: {missing_fields}")
-                        
-                        # Convert camelCase to snake_case for consistency
-                        if 'spaceName' in page_data:
-                            page_data['space_name'] = page_data.pop('spaceName')
-                        
-                        # Validate data types for critical fields
-                        if not isinstance(page_data.get('page_id'), (str, int)):
-                            raise ValueError(f"page_id in {blob.name} must be string or int, got {type(page_data.get('page_id'))}")
-                        
-                        if not isinstance(page_data.get('title'), str):
-                            raise ValueError(f"title in {blob.name} must be string, got {type(page_data.get('title'))}")
-                        
-                        if not isinstance(page_data.get('space_key'), str):
-                            raise ValueError(f"space_key in {blob.name} must be string, got {type(page_data.get('space_key'))}")
-                        
-                        # Validate and normalize links structure
-                        if 'links' in page_data:
-                            if not isinstance(page_data['links'], dict):
-                                raise ValueError(f"links in {blob.name} must be dictionary, got {type(page_data['links'])}")
-                            
-                            expected_link_keys = ['all', 'internal', 'external']
-                            for key in expected_link_keys:
-                                if key not in page_data['links']:
-                                    raise ValueError(f"links in {blob.name} missing required key: {key}")
-                                
-                                if not isinstance(page_data['links'][key], list):
-                                    raise ValueError(f"links.{key} in {blob.name} must be list, got {type(page_data['links'][key])}")
-                            
-                            # Normalize links structure to list of dicts
-                            page_data['links'] = self._normalize_links(page_data['links'])
-                        
-                        changed_pages.append(page_data)
-                            
-                    except Exception as e:
-                        print(f"❌ Error loading {blob.name}: {e}")
-                        self.stats['errors_count'] += 1
-                        # Don't continue with invalid data - fail fast
-                        raise
-            
-            return changed_pages
-            
-        except Exception as e:
-            print(f"❌ Error loading changed pages: {e}")
-            self.stats['errors_count'] += 1
-            raise
-    
-    def _create_space_nodes(self, processed_pages: List[Dict[str, Any]]) -> None:
+    async def _create_space_nodes(self, processed_pages: List[Dict[str, Any]]) -> None:
         """Create space nodes from processed pages"""
         print("🏢 Creating space nodes...")
         
@@ -432,68 +606,105 @@ class GraphPopulator:
         
         # Batch create spaces
         if space_nodes:
-            # Use synchronous approach for space nodes
-            created_count = 0
-            for space_node in space_nodes:
-                try:
-                    query = self._create_gremlin_node_query(space_node)
-                    self.graph_ops.client.submit(query).all().result()
-                    created_count += 1
-                except Exception as e:
-                    print(f"⚠️  Failed to create space node {space_node.id}: {e}")
+            created_count = await self._submit_batch([self._create_gremlin_node_query(node) for node in space_nodes])
             self.stats['spaces_created'] = created_count
             print(f"✅ Created {created_count} space nodes")    
     
-    def _create_page_nodes(self, processed_pages: List[Dict[str, Any]]) -> None:
-        """Create page nodes from processed pages"""
+    async def _create_page_nodes(self, processed_pages: List[Dict[str, Any]]) -> List[Any]:
+        """Create page nodes and their edges to existing vertices, returning the edges left for Phase 4.
+        
+        Consumes processed_pages: each page dict (with its full HTML and markdown)
+        is released as soon as it has been converted to an upsert statement.
+        """
         print("📄 Creating page nodes...")
         
-        page_nodes = []
-        for page_data in processed_pages:
+        # Ancestors are created a level before their descendants, so hierarchy
+        # edges can be written inline with the page that closes them
+        levels: Dict[int, List[Statement]] = defaultdict(list)
+        deferred_edges = []
+        models_count = 0
+        
+        processed_pages.reverse()
+        while processed_pages:
+            page_data = processed_pages.pop()
             try:
                 # Validate required fields
                 required_fields = ['page_id', 'title']
                 missing_fields = validate_node_data(page_data, required_fields)
                 
                 if missing_fields:
-                    print(f"⚠️ Skipping page with missing fields: {missing_fields}")
-                    self.stats['warnings_count'] += 1
+                    self._record_error(str(page_data.get('page_id', 'unknown')), f"missing fields: {missing_fields}", warning=True)
                     continue
                 
+                # Hash the blob as loaded, before any normalization, so the digest
+                # matches the one _drop_unchanged_pages computes on incremental runs
+                if 'content_hash' not in page_data:
+                    page_data['content_hash'] = compute_content_hash(page_data)
+                
                 # Ensure ancestor_ids list exists
                 page_data['ancestor_ids'] = page_data.get('ancestor_ids', [])
                 
                 # Create page node
                 page_node = self.factory.create_page_node(page_data)
-                page_nodes.append(page_node)
                 self.processed_pages.add(page_node.id)
                 
+                inline_edges, page_deferred = self._split_page_edges(page_node)
+                levels[len(page_node.ancestors)].append(self._create_gremlin_page_with_edges_query(page_node, inline_edges))
+                deferred_edges.extend(page_deferred)
+                models_count += 1
+                
             except Exception as e:
-                print(f"⚠️ Error creating page node for {page_data.get('page_id', 'unknown')}: {e}")
-                self.stats['warnings_count'] += 1
+                self._record_error(str(page_data.get('page_id', 'unknown')), f"page node: {e}", warning=True)
         
-        print(f"📊 Created {len(page_nodes)} page node models")
+        print(f"📊 Created {models_count} page node models")
         
-        # Batch create pages
-        if page_nodes:
-            # Use synchronous approach for page nodes
-            created_count = 0
-            for page_node in page_nodes:
-                try:
-                    query = self._create_gremlin_node_query(page_node)
-                    self.graph_ops.client.submit(query).all().result()
-                    created_count += 1
-                except Exception as e:
-                    print(f"⚠️  Failed to create page node {page_node.id}: {e}")
-            self.stats['pages_processed'] = created_count
-            print(f"✅ Created {created_count} page nodes in graph")
+        if ScalableBloomFilter is not None:
+            self._known_page_ids = ScalableBloomFilter(
+                initial_capacity=max(models_count, 1000), error_rate=KNOWN_IDS_ERROR_RATE
+            )
+        
+        created_count = 0
+        edges_count = 0
+        for depth in sorted(levels):
+            succeeded = await self._submit_statements(levels.pop(depth))
+            self._remember_written_pages(succeeded)
+            for _, _, upserts in succeeded:
+                created_count += 1
+                edges_count += upserts - 1
+        
+        self.stats['pages_processed'] = created_count
+        self.stats['edges_created'] = edges_count
+        print(f"✅ Created {created_count} page nodes with {edges_count} relationships in graph")
+        return deferred_edges
     
-    def _create_link_nodes(self, processed_pages: List[Dict[str, Any]]) -> None:
+    def _split_page_edges(self, page_node: PageNode) -> Tuple[List[Any], List[Any]]:
+        """Split a page's edges into those whose other end already exists and those deferred to Phase 4"""
+        inline_edges = []
+        
+        # Space nodes are created in Phase 1
+        if self.config.enable_space_hierarchy:
+            inline_edges.extend(self.factory.create_space_edges(page_node))
+        
+        # Ancestors are created at a shallower depth level
+        if self.config.bidirectional_relationships:
+            inline_edges.extend(self.factory.create_hierarchy_edges(page_node))
+        
+        # External link nodes are created in Phase 2; page-to-page links wait for every page
+        deferred_edges = []
+        for edge in self.factory.create_link_edges(page_node):
+            if edge.to_id in self.link_nodes_cache:
+                inline_edges.append(edge)
+            else:
+                deferred_edges.append(edge)
+        
+        return inline_edges, deferred_edges
+    
+    async def _create_link_nodes(self, processed_pages: List[Dict[str, Any]]) -> None:
         """Create link nodes for external links"""
         print("🔗 Creating external link nodes...")
         
-        # Collect unique external links
-        unique_links = {}
+        # Collect unique external URLs first (first occurrence supplies the title and space)
+        url_links: Dict[str, Tuple[str, str]] = {}
         for page_data in processed_pages:
             links_data = page_data.get('links', [])
             
@@ -502,17 +713,15 @@ class GraphPopulator:
                 for link in links_data:
                     if link.get('type') == 'external':
                         url = link.get('url', '')
-                        if url and url.startswith(('http://', 'https://')):
-                            # Always hash URL for link key to avoid invalid characters in Cosmos DB
-                            import hashlib
-                            link_key = hashlib.md5(url.encode()).hexdigest()
-                            
-                            if link_key not in unique_links:
-                                unique_links[link_key] = {
-                                    'url': url,
-                                    'title': link.get('text', url),  # Use link text or URL as title
-                                    'type': 'external'
-                                }
+                        if url and url.startswith(('http://', 'https://')) and url not in url_links:
+                            # Use link text or URL as title
+                            url_links[url] = (link.get('text', url), page_data.get('space_key', ''))
+        
+        # Hash each unique URL once for its link key to avoid invalid characters in Cosmos DB
+        unique_links = {
+            link_id_for_url(url): {'url': url, 'title': title, 'type': 'external', 'space_key': space_key}
+            for url, (title, space_key) in url_links.items()
+        }
         
         print(f"📊 Found {len(unique_links)} unique external links")
         
@@ -522,70 +731,70 @@ class GraphPopulator:
             link_node = self.factory.create_link_node(
                 link_data['url'],
                 link_data['title'],
-                link_data['type']
+                link_data['type'],
+                link_data['space_key']
             )
             link_nodes.append(link_node)
             self.link_nodes_cache[link_key] = link_node
         
         # Batch create links
         if link_nodes:
-            # Use synchronous approach for link nodes
-            created_count = 0
-            for link_node in link_nodes:
-                try:
-                    query = self._create_gremlin_node_query(link_node)
-                    self.graph_ops.client.submit(query).all().result()
-                    created_count += 1
-                except Exception as e:
-                    print(f"⚠️  Failed to create link node {link_node.id}: {e}")
+            created_count = await self._submit_batch([self._create_gremlin_node_query(node) for node in link_nodes])
             self.stats['links_created'] = created_count
             print(f"✅ Created {created_count} link nodes")
     
-    def _create_relationships(self, processed_pages: List[Dict[str, Any]]) -> None:
-        """Create all relationships between nodes"""
+    async def _create_relationships(self, edges: List[Any]) -> None:
+        """Create the relationships not written with their page in Phase 3"""
         print("🔗 Creating relationships...")
+        print(f"📊 Created {len(edges)} relationship models")
         
-        all_edges = []
+        # Batch create edges
+        if edges:
+            created_count = await self._submit_batch(self._create_edge_statements(edges))
+            self.stats['edges_created'] += created_count
+            print(f"✅ Created {created_count} relationships in graph")
+    
+    async def _drop_unchanged_pages(self, changed_pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop pages whose content hash matches the hash stored on their graph vertex"""
+        for page_data in changed_pages:
+            page_data['content_hash'] = compute_content_hash(page_data)
         
-        for page_data in processed_pages:
-            try:
-                page_node = self.factory.create_page_node(page_data)
-                
-                # Create space relationships
-                if self.config.enable_space_hierarchy:
-                    space_edges = self.factory.create_space_edges(page_node)
-                    all_edges.extend(space_edges)
-                
-                # Create hierarchy relationships  
-                if self.config.bidirectional_relationships:
-                    hierarchy_edges = self.factory.create_hierarchy_edges(page_node)
-                    all_edges.extend(hierarchy_edges)
-                
-                # Create link relationships
-                link_edges = self.factory.create_link_edges(page_node)
-                all_edges.extend(link_edges)
-                
-            except Exception as e:
-                print(f"⚠️ Error creating relationships for page {page_data.get('page_id', 'unknown')}: {e}")
-                self.stats['warnings_count'] += 1
+        page_ids = [str(page_data['page_id']) for page_data in changed_pages]
+        try:
+            lookups = await asyncio.gather(*(
+                self._fetch_content_hashes(chunk) for chunk in batch_items(page_ids, HASH_LOOKUP_BATCH_SIZE)
+            ))
+        except Exception as e:
+            print(f"⚠️ Content hash lookup failed, updating all changed pages: {e}")
+            self.stats['warnings_count'] += 1
+            return changed_pages
         
-        print(f"📊 Created {len(all_edges)} relationship models")
+        stored_hashes = {page_id: content_hash for lookup in lookups for page_id, content_hash in lookup.items()}
         
-        # Batch create edges
-        if all_edges:
-            # Use synchronous approach for edges
-            created_count = 0
-            for edge in all_edges:
-                try:
-                    query = self._create_gremlin_edge_query(edge)
-                    self.graph_ops.client.submit(query).all().result()
-                    created_count += 1
-                except Exception as e:
-                    print(f"⚠️  Failed to create edge {edge.get_edge_id()}: {e}")
-            self.stats['edges_created'] = created_count
-            print(f"✅ Created {created_count} relationships in graph")
+        # Edges are derived from the page content, so an unchanged page has unchanged edges too
+        modified_pages = [
+            page_data for page_id, page_data in zip(page_ids, changed_pages)
+            if stored_hashes.get(page_id) != page_data['content_hash']
+        ]
+        
+        unchanged = len(changed_pages) - len(modified_pages)
+        self.stats['pages_unchanged'] = unchanged
+        print(f"♻️ Content unchanged for {unchanged}/{len(changed_pages)} pages ({unchanged / len(changed_pages):.0%} hash hits)")
+        return modified_pages
+    
+    async def _fetch_content_hashes(self, page_ids: List[str]) -> Dict[str, str]:
+        """Fetch the stored content_hash of each existing page vertex (missing pages are absent from the result)"""
+        bindings = {f"id{i}": page_id for i, page_id in enumerate(page_ids)}
+        query = (
+            f"g.V({', '.join(bindings)})"
+            ".project('id', 'content_hash')"
+            ".by(values('id'))"
+            ".by(coalesce(values('content_hash'), constant('')))"
+        )
+        results = await self.graph_ops.submit_async(query, bindings)
+        return {str(row['id']): row['content_hash'] for row in results}
     
-    def _process_changed_pages(self, changed_pages: List[Dict[str, Any]]) -> None:
+    async def _process_changed_pages(self, changed_pages: List[Dict[str, Any]]) -> None:
         """Process changed pages for incremental update"""
         print("🔄 Processing changed pages...")
         
@@ -596,25 +805,19 @@ class GraphPopulator:
                 page_node = self.factory.create_page_node(page_data)
                 page_nodes.append(page_node)
                 self.processed_pages.add(page_node.id)
+                self._page_nodes[page_node.id] = page_node
             except Exception as e:
-                print(f"⚠️ Error processing changed page {page_data.get('page_id', 'unknown')}: {e}")
-                self.stats['warnings_count'] += 1
+                self._record_error(str(page_data.get('page_id', 'unknown')), f"changed page: {e}", warning=True)
         
         # Update nodes in graph
         if page_nodes:
-            # Use synchronous approach for page nodes
-            created_count = 0
-            for page_node in page_nodes:
-                try:
-                    query = self._create_gremlin_node_query(page_node)
-                    self.graph_ops.client.submit(query).all().result()
-                    created_count += 1
-                except Exception as e:
-                    print(f"⚠️  Failed to update page node {page_node.id}: {e}")
+            succeeded = await self._submit_statements([self._create_gremlin_node_query(node) for node in page_nodes])
+            self._remember_written_pages(succeeded)
+            created_count = len(succeeded)
             self.stats['pages_processed'] = created_count
             print(f"✅ Updated {created_count} page nodes")
     
-    def _update_relationships(self, changed_pages: List[Dict[str, Any]]) -> None:
+    async def _update_relationships(self, changed_pages: List[Dict[str, Any]]) -> None:
         """Update relationships for changed pages"""
         print("🔗 Updating relationships for changed pages...")
         
@@ -623,7 +826,7 @@ class GraphPopulator:
         
         for page_data in changed_pages:
             try:
-                page_node = self.factory.create_page_node(page_data)
+                page_node = self._page_nodes.get(page_data.get('page_id')) or self.factory.create_page_node(page_data)
                 
                 # Remove existing edges for this page (simplified - would need more sophisticated approach)
                 # For now, just add new edges (Gremlin upsert will handle duplicates)
@@ -636,20 +839,11 @@ class GraphPopulator:
                 all_edges.extend(space_edges + hierarchy_edges + link_edges)
                 
             except Exception as e:
-                print(f"⚠️ Error updating relationships for {page_data.get('page_id', 'unknown')}: {e}")
-                self.stats['warnings_count'] += 1
+                self._record_error(str(page_data.get('page_id', 'unknown')), f"relationships: {e}", warning=True)
         
         # Batch update edges
         if all_edges:
-            # Use synchronous approach for edges
-            created_count = 0
-            for edge in all_edges:
-                try:
-                    query = self._create_gremlin_edge_query(edge)
-                    self.graph_ops.client.submit(query).all().result()
-                    created_count += 1
-                except Exception as e:
-                    print(f"⚠️  Failed to update edge {edge.get_edge_id()}: {e}")
+            created_count = await self._submit_batch(self._create_edge_statements(all_edges))
             self.stats['edges_created'] = created_count
             print(f"✅ Updated {created_count} relationships")
     
@@ -666,18 +860,32 @@ class GraphPopulator:
             for issue in validation_results.get('issues', []):
                 print(f"  - {issue['type']}: {issue['count']} instances")
     
-    def _validate_incremental_changes(self, changed_pages: List[Dict[str, Any]]) -> None:
+    def _remember_written_pages(self, statements: List[Statement]) -> None:
+        """Add the page ids of successful upserts to the known-ids filter, once a full population has created it"""
+        if self._known_page_ids is None:
+            return
+        for _, bindings, _ in statements:
+            self._known_page_ids.add(bindings['id'])
+    
+    async def _validate_incremental_changes(self, changed_pages: List[Dict[str, Any]]) -> None:
         """Validate incremental changes"""
         print("🔍 Validating incremental changes...")
         
-        # Simple validation - check that all changed pages exist in graph
-        missing_pages = []
-        for page_data in changed_pages:
-            page_id = page_data.get('page_id', '')
-            if page_id:
-                node = self.graph_ops.find_node(page_id)
-                if not node:
-                    missing_pages.append(page_id)
+        # Simple validation - check that all changed pages exist in graph,
+        # one bulk lookup per HASH_LOOKUP_BATCH_SIZE ids
+        page_ids = [str(page_data['page_id']) for page_data in changed_pages if page_data.get('page_id')]
+        
+        # After a full population in this process, an id the filter has never seen was
+        # neither created then nor upserted since: count it missing without a lookup
+        candidates = page_ids
+        if self._known_page_ids is not None:
+            candidates = [page_id for page_id in page_ids if page_id in self._known_page_ids]
+        
+        lookups = await asyncio.gather(*(
+            self._fetch_content_hashes(chunk) for chunk in batch_items(candidates, HASH_LOOKUP_BATCH_SIZE)
+        ))
+        found = {page_id for lookup in lookups for page_id in lookup}
+        missing_pages = [page_id for page_id in page_ids if page_id not in found]
         
         if missing_pages:
             print(f"⚠️ {len(missing_pages)} pages not found in graph after update")
@@ -685,26 +893,39 @@ class GraphPopulator:
         else:
             print("✅ All changed pages validated in graph")
     
-    def _finalize_stats(self) -> None:
+    async def _finalize_stats(self) -> None:
         """Finalize processing statistics"""
         self.stats['end_time'] = datetime.utcnow()
-        if self.stats['start_time']:
-            duration = self.stats['end_time'] - self.stats['start_time']
-            self.stats['processing_time_seconds'] = duration.total_seconds()
+        if self._start_ns is not None:
+            self.stats['processing_time_seconds'] = (time.monotonic_ns() - self._start_ns) / 1e9
         
         # Get final graph statistics
-        graph_stats = self.graph_ops.get_graph_statistics()
+        graph_stats = await self.graph_ops.get_graph_statistics()
         self.stats['final_graph_stats'] = graph_stats
         
-        print("\n📊 Processing Complete!")
-        print("=" * 40)
-        print(f"Pages processed: {self.stats['pages_processed']}")
-        print(f"Spaces created: {self.stats['spaces_created']}")
-        print(f"Links created: {self.stats['links_created']}")
-        print(f"Edges created: {self.stats['edges_created']}")
-        print(f"Processing time: {self.stats['processing_time_seconds']:.2f} seconds")
-        print(f"Warnings: {self.stats['warnings_count']}")
-        print(f"Errors: {self.stats['errors_count']}")
+        logger.info(
+            "\n📊 Processing Complete!\n%s\n"
+            "Pages processed: %d\nPages unchanged: %d\nSpaces created: %d\n"
+            "Links created: %d\nEdges created: %d\nProcessing time: %.2f seconds\n"
+            "Warnings: %d\nErrors: %d",
+            "=" * 40,
+            self.stats['pages_processed'], self.stats['pages_unchanged'], self.stats['spaces_created'],
+            self.stats['links_created'], self.stats['edges_created'], self.stats['processing_time_seconds'],
+            self.stats['warnings_count'], self.stats['errors_count']
+        )
+        self._report_errors()
+    
+    def _report_errors(self) -> None:
+        """Attach recorded failures to the statistics and print them once"""
+        self.stats['errors'] = list(self._errors)
+        if not self._errors:
+            return
+        
+        total = self.stats['warnings_count'] + self.stats['errors_count']
+        logger.warning(
+            "\n⚠️ Recorded issues (%d of %d shown):\n%s", len(self._errors), total,
+            "\n".join(f"  - [{record['level']}] {record['source']}: {record['error']}" for record in self._errors)
+        )
     
     def _create_success_result(self) -> Dict[str, Any]:
         """Create success result dictionary"""
@@ -717,6 +938,7 @@ class GraphPopulator:
     
     def _create_error_result(self, error_message: str) -> Dict[str, Any]:
         """Create error result dictionary"""
+        self._report_errors()
         return {
             'success': False,
             'error': error_message,
@@ -725,52 +947,124 @@ class GraphPopulator:
         }
     
     # Query methods
-    def find_page(self, page_id: str) -> Optional[Dict[str, Any]]:
-        """Find a page by ID"""
+    @staticmethod
+    def _is_cacheable(result: Any) -> bool:
+        """False for results a failed (or not yet populated) read can produce
+        
+        The graph_ops readers swallow errors and return None, [], an {'error': ...}
+        dict or an empty hierarchy instead, so those are fetched again next time.
+        """
+        if not result:
+            return False
+        if isinstance(result, dict):
+            if 'error' in result:
+                return False
+            if 'hierarchy_depth' in result and not (result.get('parents') or result.get('children')):
+                return False
+        return True
+    
+    def _cached_read(self, key: Tuple[Any, ...], fetch) -> Any:
+        """Return a recent result for key, or call fetch() and keep a real result for READ_CACHE_TTL_SECONDS"""
+        now = time.monotonic()
+        entry = self._read_cache.get(key)
+        if entry is not None and entry[0] > now:
+            self._read_cache.move_to_end(key)
+            return entry[1]
+        
         if not self.graph_ops.client:
             self._connect_to_graph()
-        return self.graph_ops.find_node(page_id)
+        result = fetch()
+        if not self._is_cacheable(result):
+            self._read_cache.pop(key, None)
+            return result
+        self._read_cache[key] = (now + READ_CACHE_TTL_SECONDS, result)
+        self._read_cache.move_to_end(key)
+        if len(self._read_cache) > READ_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+        return result
+    
+    def find_page(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """Find a page by ID"""
+        return self._cached_read(('find_page', page_id), lambda: self._run(self.graph_ops.find_node(page_id)))
     
     def get_page_hierarchy(self, page_id: str) -> Dict[str, Any]:
         """Get page hierarchy"""
-        if not self.graph_ops.client:
-            self._connect_to_graph()
-        return self.graph_ops.get_node_hierarchy(page_id)
+        return self._cached_read(('get_page_hierarchy', page_id), lambda: self._run(self.graph_ops.get_node_hierarchy(page_id)))
     
     def find_related_pages(self, page_id: str, depth: int = 2) -> List[Dict[str, Any]]:
         """Find related pages"""
-        if not self.graph_ops.client:
-            self._connect_to_graph()
-        return self.graph_ops.find_related_pages(page_id, depth)
+        return self._cached_read(('find_related_pages', page_id, depth), lambda: self._run(self.graph_ops.find_related_pages(page_id, depth)))
     
     def get_space_statistics(self, space_key: str) -> Dict[str, Any]:
         """Get space statistics"""
-        if not self.graph_ops.client:
-            self._connect_to_graph()
-        return self.graph_ops.get_space_statistics(space_key)
+        return self._cached_read(('get_space_statistics', space_key), lambda: self._run(self.graph_ops.get_space_statistics(space_key)))
     
     def get_graph_statistics(self) -> Dict[str, Any]:
         """Get overall graph statistics"""
-        if not self.graph_ops.client:
-            self._connect_to_graph()
-        return self.graph_ops.get_graph_statistics()
+        return self._cached_read(('get_graph_statistics',), lambda: self._run(self.graph_ops.get_graph_statistics()))
+    
+    async def _count_graph(self) -> Tuple[int, int]:
+        """Count vertices and edges in a single round-trip"""
+        query = "g.inject(0).project('nodes', 'edges').by(V().count()).by(V().outE().count())"
+        counts = (await self.graph_ops.submit_async(query))[0]
+        return counts['nodes'], counts['edges']
+    
+    async def _drop_in_chunks(self, elements: str, bindings: Optional[Dict[str, Any]] = None) -> None:
+        """Drop the elements of a traversal (g.V() / g.E() / ...) in bounded chunks to stay under server timeouts"""
+        query = f"{elements}.limit({CLEANUP_DROP_CHUNK_SIZE}).sideEffect(drop()).count()"
+        while (await self.graph_ops.submit_async(query, bindings))[0] >= CLEANUP_DROP_CHUNK_SIZE:
+            pass
+    
+    async def _drop_per_partition(self, partitions: List[Any], elements: str) -> None:
+        """Drop elements reached from each partition's vertices, one bounded concurrent task per partition"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBMITS)
+        
+        async def drop_partition(partition: Any) -> None:
+            async with semaphore:
+                await self._drop_in_chunks(f"g.V().has('{self._partition_key}', pk){elements}", {'pk': partition})
+        
+        await asyncio.gather(*(drop_partition(partition) for partition in partitions))
+    
+    async def _cleanup_graph_async(self) -> Tuple[int, int]:
+        """Drop every edge, then every vertex, and return the remaining (nodes, edges) counts"""
+        # Each partition is dropped by its own single-partition traversals, concurrently
+        partitions = await self.graph_ops.submit_async(f"g.V().values('{self._partition_key}').dedup()")
+        logger.info("🗂️ Dropping %d partitions", len(partitions))
+        
+        # Delete all edges first (every edge is an out-edge of some partition's vertex)
+        logger.info("🔗 Deleting all edges...")
+        await self._drop_per_partition(partitions, ".outE()")
+        
+        # Delete all nodes
+        logger.info("📄 Deleting all nodes...")
+        await self._drop_per_partition(partitions, "")
+        
+        # Sweep anything created meanwhile or lacking the partition property
+        await self._drop_in_chunks("g.E()")
+        await self._drop_in_chunks("g.V()")
+        
+        # Page ids written before the cleanup, and cached reads, no longer hold
+        self._known_page_ids = None
+        self._read_cache.clear()
+        
+        # Verify using one direct Gremlin query
+        return await self._count_graph()
     
     def cleanup_graph(self, confirm: bool = True) -> Dict[str, Any]:
         """Clean up all nodes and edges from the graph"""
-        print("🧹 Cleaning up existing graph...")
+        logger.info("🧹 Cleaning up existing graph...")
         
         try:
             if not self.graph_ops.client:
                 self._connect_to_graph()
             
-            # Get initial counts using direct Gremlin queries
-            initial_nodes = self.graph_ops.client.submit("g.V().count()").all().result()[0]
-            initial_edges = self.graph_ops.client.submit("g.E().count()").all().result()[0]
+            # Get initial counts using one direct Gremlin query
+            initial_nodes, initial_edges = self._run(self._count_graph())
             
-            print(f"📊 Current graph: {initial_nodes} nodes, {initial_edges} edges")
+            logger.info("📊 Current graph: %d nodes, %d edges", initial_nodes, initial_edges)
             
             if initial_nodes == 0 and initial_edges == 0:
-                print("✅ Graph is already empty")
+                logger.info("✅ Graph is already empty")
                 return {'success': True, 'message': 'Graph already empty'}
             
             # Confirm if needed
@@ -779,33 +1073,23 @@ class GraphPopulator:
                 if response.lower() != 'yes':
                     return {'success': False, 'message': 'Cleanup cancelled by user'}
             
-            # Delete all edges first
-            print("🔗 Deleting all edges...")
-            self.graph_ops.client.submit("g.E().drop()").all().result()
-            
-            # Delete all nodes
-            print("📄 Deleting all nodes...")
-            self.graph_ops.client.submit("g.V().drop()").all().result()
-            
-            # Verify using direct Gremlin queries
-            final_nodes = self.graph_ops.client.submit("g.V().count()").all().result()[0]
-            final_edges = self.graph_ops.client.submit("g.E().count()").all().result()[0]
+            final_nodes, final_edges = self._run(self._cleanup_graph_async())
             
             if final_nodes == 0 and final_edges == 0:
-                print("✅ Graph cleanup successful!")
+                logger.info("✅ Graph cleanup successful!")
                 return {
                     'success': True,
                     'deleted': {'nodes': initial_nodes, 'edges': initial_edges}
                 }
             else:
-                print(f"⚠️  Incomplete cleanup: {final_nodes} nodes, {final_edges} edges remain")
+                logger.warning("⚠️  Incomplete cleanup: %d nodes, %d edges remain", final_nodes, final_edges)
                 return {
                     'success': False,
                     'message': f'Incomplete cleanup: {final_nodes} nodes, {final_edges} edges remain'
                 }
                 
         except Exception as e:
-            print(f"❌ Error during cleanup: {e}")
+            logger.error("❌ Error during cleanup: %s", e)
             return {'success': False, 'error': str(e)}
 
 
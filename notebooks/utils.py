@@ -4,48 +4,77 @@ Utility Classes for Graph Population Module
 Provides helper functions for progress tracking, validation, and analysis
 """
 
+import sys
 import time
+import logging
 import hashlib
-from typing import Dict, List, Optional, Any, Set
+import functools
+import itertools
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Any, Set, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from urllib.parse import urlparse
+
+# Same logger as notebooks/populate_graph.py. It prints plain messages to stdout
+# by default, so notebook and library callers see progress without configuring
+# logging; set propagate=True (and drop this handler) to route it elsewhere.
+logger = logging.getLogger('graph_populator')
+if not logger.handlers:
+    _stdout_handler = logging.StreamHandler(sys.stdout)
+    _stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_stdout_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class Recommendation(NamedTuple):
+    """A suggested link between two pages (a tuple, so raw candidates stay small)"""
+    from_page: str
+    to_page: str
+    reason: str
+    confidence: str
 
 
-@dataclass
 class ProgressTracker:
     """Track progress of graph population operations"""
     
-    total_items: int = 0
-    processed_items: int = 0
-    start_time: Optional[datetime] = None
-    last_update_time: Optional[datetime] = None
-    update_interval: float = 5.0  # seconds
+    # update() runs once per item, so keep attribute access off the instance __dict__
+    # (explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10+)
+    __slots__ = ('total_items', 'processed_items', 'start_time', 'update_interval',
+                 '_start_mono', '_last_update_mono')
+    
+    def __init__(self, total_items: int = 0, processed_items: int = 0,
+                 start_time: Optional[datetime] = None, update_interval: float = 5.0):
+        """Initialize tracker (update_interval in seconds)"""
+        self.total_items = total_items
+        self.processed_items = processed_items
+        self.start_time = start_time
+        self.update_interval = update_interval
+        self._start_mono = 0.0
+        self._last_update_mono = 0.0
     
     def start(self, total_items: int) -> None:
         """Start tracking progress"""
         self.total_items = total_items
         self.processed_items = 0
         self.start_time = datetime.utcnow()
-        self.last_update_time = self.start_time
-        print(f"📈 Starting progress tracking for {total_items} items")
+        self._start_mono = self._last_update_mono = time.monotonic()
+        logger.info("📈 Starting progress tracking for %d items", total_items)
     
     def update(self, increment: int = 1) -> None:
         """Update progress and optionally print status"""
         self.processed_items += increment
-        current_time = datetime.utcnow()
         
-        # Print progress at intervals or when complete
-        if (self.last_update_time and 
-            (current_time - self.last_update_time).total_seconds() >= self.update_interval) or \
-           self.processed_items >= self.total_items:
-            
+        # Always report completion; otherwise report once update_interval has passed
+        # (time.monotonic() is cheap enough to read on every update, even for fast items)
+        now = time.monotonic()
+        if self.processed_items >= self.total_items or now - self._last_update_mono >= self.update_interval:
             self._print_progress()
-            self.last_update_time = current_time
+            self._last_update_mono = now
     
     def finish(self) -> Dict[str, Any]:
         """Finish tracking and return summary"""
-        end_time = datetime.utcnow()
-        duration = (end_time - self.start_time).total_seconds() if self.start_time else 0
+        duration = time.monotonic() - self._start_mono if self.start_time else 0
         
         summary = {
             'total_items': self.total_items,
@@ -55,23 +84,35 @@ class ProgressTracker:
             'completion_rate': self.processed_items / self.total_items if self.total_items > 0 else 0
         }
         
-        print(f"✅ Progress complete: {self.processed_items}/{self.total_items} in {duration:.2f}s")
+        logger.info("✅ Progress complete: %d/%d in %.2fs", self.processed_items, self.total_items, duration)
         return summary
     
     def _print_progress(self) -> None:
         """Print current progress status"""
         if self.total_items > 0:
             percentage = (self.processed_items / self.total_items) * 100
-            print(f"  📊 Progress: {self.processed_items}/{self.total_items} ({percentage:.1f}%)")
+            logger.info("  📊 Progress: %d/%d (%.1f%%)", self.processed_items, self.total_items, percentage)
 
 
 class DataValidator:
     """Validate data integrity and consistency"""
     
-    def __init__(self):
-        """Initialize validator"""
-        self.validation_errors: List[str] = []
-        self.validation_warnings: List[str] = []
+    def __init__(self, max_issues: int = 1000):
+        """Initialize validator (keeps the most recent max_issues errors and warnings)"""
+        self.validation_errors: Deque[str] = deque(maxlen=max_issues)
+        self.validation_warnings: Deque[str] = deque(maxlen=max_issues)
+        self.error_count = 0
+        self.warning_count = 0
+    
+    def _add_error(self, message: str) -> None:
+        """Record a validation error"""
+        self.validation_errors.append(message)
+        self.error_count += 1
+    
+    def _add_warning(self, message: str) -> None:
+        """Record a validation warning"""
+        self.validation_warnings.append(message)
+        self.warning_count += 1
     
     def validate_page_data(self, page_data: Dict[str, Any]) -> bool:
         """Validate a single page data structure"""
@@ -82,7 +123,7 @@ class DataValidator:
         required_fields = ['pageId', 'title']
         for field in required_fields:
             if not page_data.get(field):
-                self.validation_errors.append(f"Page {page_id}: Missing required field '{field}'")
+                self._add_error(f"Page {page_id}: Missing required field '{field}'")
                 is_valid = False
         
         # Data type validation
@@ -90,37 +131,44 @@ class DataValidator:
             try:
                 datetime.fromisoformat(page_data['updated'].replace('Z', '+00:00'))
             except (ValueError, AttributeError):
-                self.validation_warnings.append(f"Page {page_id}: Invalid date format in 'updated' field")
+                self._add_warning(f"Page {page_id}: Invalid date format in 'updated' field")
         
         # Content validation
         content = page_data.get('content', {})
         if not any([content.get('html'), content.get('text'), content.get('markdown')]):
-            self.validation_warnings.append(f"Page {page_id}: No content in any format")
+            self._add_warning(f"Page {page_id}: No content in any format")
         
         # Links validation
         links = page_data.get('links', [])
         for i, link in enumerate(links):
             if not link.get('url') and not link.get('text'):
-                self.validation_warnings.append(f"Page {page_id}: Link {i} has no URL or text")
+                self._add_warning(f"Page {page_id}: Link {i} has no URL or text")
         
         return is_valid
     
-    def validate_batch_data(self, pages_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Validate a batch of page data"""
+    def validate_batch_data(self, pages_data: Iterable[Dict[str, Any]], max_issues: Optional[int] = None) -> Dict[str, Any]:
+        """Validate a batch of page data in a single pass (any iterable, e.g. a generator of pages)"""
         print("🔍 Validating batch data...")
         
+        if max_issues is not None and max_issues != self.validation_errors.maxlen:
+            self.validation_errors = deque(self.validation_errors, maxlen=max_issues)
+            self.validation_warnings = deque(self.validation_warnings, maxlen=max_issues)
+        
+        total_pages = 0
         valid_pages = 0
         invalid_pages = 0
         
-        # Track duplicates
+        # Track duplicates (the page id set is the only per-page state kept)
         page_ids = set()
-        duplicates = []
+        duplicates = 0
         
         for page_data in pages_data:
+            total_pages += 1
             page_id = page_data.get('pageId', '')
             
             if page_id in page_ids:
-                duplicates.append(page_id)
+                duplicates += 1
+                self._add_error(f"Duplicate page ID found: {page_id}")
             else:
                 page_ids.add(page_id)
             
@@ -129,26 +177,23 @@ class DataValidator:
             else:
                 invalid_pages += 1
         
-        # Report duplicates
-        if duplicates:
-            for page_id in duplicates:
-                self.validation_errors.append(f"Duplicate page ID found: {page_id}")
-        
         validation_summary = {
-            'total_pages': len(pages_data),
+            'total_pages': total_pages,
             'valid_pages': valid_pages,
             'invalid_pages': invalid_pages,
-            'duplicate_pages': len(duplicates),
-            'errors': self.validation_errors.copy(),
-            'warnings': self.validation_warnings.copy(),
-            'is_valid': invalid_pages == 0 and len(duplicates) == 0
+            'duplicate_pages': duplicates,
+            'errors': list(self.validation_errors),
+            'warnings': list(self.validation_warnings),
+            'error_count': self.error_count,
+            'warning_count': self.warning_count,
+            'is_valid': invalid_pages == 0 and duplicates == 0
         }
         
         if validation_summary['is_valid']:
             print(f"✅ Validation passed: {valid_pages} valid pages")
         else:
-            print(f"⚠️ Validation issues: {invalid_pages} invalid, {len(duplicates)} duplicates")
-            print(f"   Errors: {len(self.validation_errors)}, Warnings: {len(self.validation_warnings)}")
+            print(f"⚠️ Validation issues: {invalid_pages} invalid, {duplicates} duplicates")
+            print(f"   Errors: {self.error_count}, Warnings: {self.warning_count}")
         
         return validation_summary
     
@@ -156,6 +201,8 @@ class DataValidator:
         """Reset validation state"""
         self.validation_errors.clear()
         self.validation_warnings.clear()
+        self.error_count = 0
+        self.warning_count = 0
 
 
 class GraphAnalyzer:
@@ -175,7 +222,10 @@ class GraphAnalyzer:
         internal_links = []
         external_links = []
         page_hierarchy = {}
+        linked_pages = set()
+        pages_with_content = pages_with_tables = pages_with_images = 0
         
+        # One pass over the pages gathers every count used in the summary below
         for page_data in pages_data:
             page_id = page_data.get('pageId', '')
             space_key = page_data.get('spaceKey', '')
@@ -204,6 +254,14 @@ class GraphAnalyzer:
                         'type': link_type,
                         'text': link.get('text', '')
                     })
+                else:
+                    continue
+                linked_pages.add(page_id)
+            
+            # Content statistics
+            pages_with_content += bool(page_data.get('content', {}).get('text', '').strip())
+            pages_with_tables += bool(page_data.get('tables', []))
+            pages_with_images += bool(page_data.get('images', []))
             
             # Hierarchy analysis (from breadcrumb)
             breadcrumb = page_data.get('breadcrumb', [])
@@ -223,7 +281,7 @@ class GraphAnalyzer:
                 'internal_links_count': len(internal_links),
                 'external_links_count': len(external_links),
                 'total_links': len(internal_links) + len(external_links),
-                'pages_with_links': len(set(link['from'] for link in internal_links + external_links))
+                'pages_with_links': len(linked_pages)
             },
             'hierarchy': {
                 'pages_with_hierarchy': len(page_hierarchy),
@@ -232,9 +290,9 @@ class GraphAnalyzer:
             },
             'statistics': {
                 'total_pages': len(pages_data),
-                'pages_with_content': len([p for p in pages_data if p.get('content', {}).get('text', '').strip()]),
-                'pages_with_tables': len([p for p in pages_data if p.get('tables', [])]),
-                'pages_with_images': len([p for p in pages_data if p.get('images', [])])
+                'pages_with_content': pages_with_content,
+                'pages_with_tables': pages_with_tables,
+                'pages_with_images': pages_with_images
             }
         }
         
@@ -253,26 +311,14 @@ class GraphAnalyzer:
         """Identify pages that have no incoming or outgoing relationships"""
         print("🔍 Identifying orphaned pages...")
         
-        all_page_ids = set(p.get('pageId', '') for p in pages_data)
-        linked_pages = set()
-        
-        # Collect all pages that are linked to or from
+        # Index incoming internal links once: target page -> pages linking to it
+        incoming: Dict[str, Set[str]] = defaultdict(set)
         for page_data in pages_data:
             page_id = page_data.get('pageId', '')
-            
-            # This page is linked to (it exists, so it's not orphaned by default)
-            linked_pages.add(page_id)
-            
-            # Pages this page links to
-            links = page_data.get('links', [])
-            for link in links:
-                if link.get('internal_page_id'):
-                    linked_pages.add(link['internal_page_id'])
-            
-            # Pages in hierarchy (breadcrumb implies relationships)
-            breadcrumb = page_data.get('breadcrumb', [])
-            if len(breadcrumb) > 1:
-                linked_pages.add(page_id)  # Has hierarchy context
+            for link in page_data.get('links', []):
+                target_id = link.get('internal_page_id')
+                if target_id and target_id != page_id:
+                    incoming[target_id].add(page_id)
         
         # Find orphaned pages (pages with no relationships)
         orphaned = []
@@ -285,15 +331,9 @@ class GraphAnalyzer:
             has_outgoing_links = any(link.get('internal_page_id') for link in links)
             has_hierarchy = len(breadcrumb) > 1
             
-            if not has_outgoing_links and not has_hierarchy:
-                # Check if any other page links to this one
-                is_target = any(
-                    any(link.get('internal_page_id') == page_id for link in p.get('links', []))
-                    for p in pages_data if p.get('pageId') != page_id
-                )
-                
-                if not is_target:
-                    orphaned.append(page_id)
+            # Check if any other page links to this one
+            if not has_outgoing_links and not has_hierarchy and page_id not in incoming:
+                orphaned.append(page_id)
         
         print(f"🔍 Found {len(orphaned)} potentially orphaned pages")
         return orphaned
@@ -302,64 +342,85 @@ class GraphAnalyzer:
         """Generate recommendations for missing links based on content similarity"""
         print("💡 Generating link recommendations...")
         
-        recommendations = []
-        
         # Simple text-based similarity (could be enhanced with embeddings in Phase 2)
-        for i, page1 in enumerate(pages_data):
-            page1_id = page1.get('pageId', '')
-            page1_title = page1.get('title', '').lower()
-            page1_content = page1.get('content', {}).get('text', '').lower()
-            
-            for j, page2 in enumerate(pages_data[i+1:], i+1):
-                page2_id = page2.get('pageId', '')
-                page2_title = page2.get('title', '').lower()
-                page2_content = page2.get('content', {}).get('text', '').lower()
-                
-                # Skip if already linked
-                existing_links = {link.get('internal_page_id') for link in page1.get('links', [])}
-                if page2_id in existing_links:
-                    continue
-                
-                # Check for title mentions in content
-                if page2_title in page1_content and len(page2_title) > 3:
-                    recommendations.append({
-                        'from_page': page1_id,
-                        'to_page': page2_id,
-                        'reason': f"Page 1 content mentions '{page2_title}'",
-                        'confidence': 'medium'
-                    })
-                
-                if page1_title in page2_content and len(page1_title) > 3:
-                    recommendations.append({
-                        'from_page': page2_id,
-                        'to_page': page1_id,
-                        'reason': f"Page 2 content mentions '{page1_title}'",
-                        'confidence': 'medium'
-                    })
+        recommendations = self._pairwise_recommendations(pages_data)
         
         # Limit recommendations to avoid overwhelming output
-        recommendations = recommendations[:50]
+        recommendations = [recommendation._asdict() for recommendation in recommendations[:50]]
         
         print(f"💡 Generated {len(recommendations)} link recommendations")
         return recommendations
     
+    @staticmethod
+    def _pairwise_recommendations(pages_data: List[Dict[str, Any]]) -> List[Recommendation]:
+        """Find title mentions, only scanning titles whose 3-char prefix occurs in the content"""
+        # Lowercase each page once; titles of 3 characters or fewer never
+        # qualify as mentions, so they are left out of the buckets
+        prepped = []
+        buckets: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for index, page in enumerate(pages_data):
+            title = page.get('title', '').lower()
+            prepped.append((
+                page.get('pageId', ''),
+                page.get('content', {}).get('text', '').lower(),
+                {link.get('internal_page_id') for link in page.get('links', [])}
+            ))
+            if len(title) > 3:
+                buckets[title[:3]].append((index, title))
+        
+        # (first index, second index, direction) reproduces the order of an i < j pair scan
+        matches = []
+        for source, (source_id, content, _) in enumerate(prepped):
+            if not content:
+                continue
+            for prefix, titles in buckets.items():
+                if prefix not in content:
+                    continue
+                for target, title in titles:
+                    if target == source or title not in content:
+                        continue
+                    # The pair is skipped when the earlier page already links to the later one
+                    first, second = (source, target) if source < target else (target, source)
+                    if prepped[second][0] in prepped[first][2]:
+                        continue
+                    matches.append((first, second, source != first, source, target, title))
+        matches.sort(key=lambda match: match[:3])
+        
+        return [
+            Recommendation(
+                prepped[source][0], prepped[target][0],
+                f"Page {2 if reversed_pair else 1} content mentions '{title}'", 'medium'
+            )
+            for _, _, reversed_pair, source, target, title in matches
+        ]
+    
     def get_cached_analysis(self, analysis_type: str) -> Optional[Dict[str, Any]]:
         """Get cached analysis results"""
         return self.analysis_cache.get(analysis_type)
 
 
-def generate_content_hash(content: str) -> str:
-    """Generate a hash for content to detect changes"""
-    return hashlib.md5(content.encode('utf-8')).hexdigest()
+def generate_content_hash(content: Union[str, bytes]) -> str:
+    """Generate a 128-bit BLAKE2b hash for content to detect changes"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 
-def extract_domain_from_url(url: str) -> str:
-    """Extract domain from URL"""
+@functools.lru_cache(maxsize=16384)
+def _parse_url_cached(url: str) -> Tuple[bool, str]:
+    """Parse a URL once into (is_valid, domain); links share a small set of hosts"""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(url)
-        return parsed.netloc or 'unknown'
     except Exception:
+        return False, 'unknown'
+    return bool(parsed.scheme and parsed.netloc), parsed.netloc or 'unknown'
+
+
+def extract_domain_from_url(url: str) -> str:
+    """Extract domain from URL"""
+    try:
+        return _parse_url_cached(url)[1]
+    except TypeError:  # unhashable input
         return 'unknown'
 
 
@@ -391,24 +452,26 @@ def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> st
     return text[:max_length - len(suffix)] + suffix
 
 
-def batch_items(items: List[Any], batch_size: int) -> List[List[Any]]:
-    """Split items into batches of specified size"""
-    batches = []
-    for i in range(0, len(items), batch_size):
-        batches.append(items[i:i + batch_size])
-    return batches
+def batch_items(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Lazily split any iterable into batches of specified size"""
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, batch_size))
+        if not chunk:
+            return
+        yield chunk
 
 
 def normalize_page_id(page_id: str) -> str:
     """Normalize page ID for consistent storage and retrieval"""
-    return str(page_id).strip()
+    if type(page_id) is not str:
+        page_id = str(page_id)
+    return page_id.strip()
 
 
 def is_valid_url(url: str) -> bool:
     """Check if URL is valid"""
     try:
-        from urllib.parse import urlparse
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False 
\ No newline at end of file
+        return _parse_url_cached(url)[0]
+    except TypeError:  # unhashable input
+        return False
\ No newline at end of file
@@ -8,7 +8,7 @@ to the *processed* container in the same storage account.
 
 Prereqs
 -------
-pip install azure-storage-blob beautifulsoup4 html2text
+pip install azure-storage-blob beautifulsoup4 html2text  (optional: lxml html-to-markdown)
 
 ENV (from ../env file)
 ---
@@ -17,6 +17,9 @@ STORAGE_KEY                       Azure storage account key
 CONFLUENCE_DOMAIN                 e.g. "hchaturvedi14.atlassian.net/wiki"
 RAW_CONTAINER                     raw container name (default: raw)
 PROC_CONTAINER                    dest container name (default: processed)
+KEEP_HTML_CONTENT                 "true" to also copy the raw HTML body (default: false)
+COMPRESS_PROCESSED                "true" to gzip processed blobs (Content-Encoding: gzip). Leave
+                                  off when a search indexer reads the container as JSON.
 """
 
 import os
@@ -24,8 +27,12 @@ import json
 import re
 import asyncio
 import datetime
-from typing import Dict, Any, List
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Tuple
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 from azure.storage.blob.aio import BlobServiceClient
 from azure.core.exceptions import ResourceExistsError
@@ -33,9 +40,35 @@ from bs4 import BeautifulSoup
 import html2text
 from azure.storage.blob import ContentSettings
 
+# lxml is the fast C parser; fall back to the pure-Python one when it isn't installed
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HTML_PARSER = "lxml"
+except ImportError:
+    etree = lxml_html = None
+    HTML_PARSER = "html.parser"
+
+# orjson decodes/encodes page JSON straight from/to UTF-8 bytes, faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Native HTML -> Markdown converter; html2text (pure Python) is used without it.
+# The two produce different markdown (and so different content hashes), so every
+# worker should run the same environment; requirements.txt pins the 1.x API.
+try:
+    from html_to_markdown import convert_to_markdown
+except ImportError:
+    convert_to_markdown = None
+
 # --------------------------------------------------------------------
 # Config
 # --------------------------------------------------------------------
+# KEY=VALUE lines; comment lines (leading '#') and lines without '=' never match
+ENV_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
 def load_env_from_file():
     """Load environment variables from ../env file"""
     env_files = ['../.env', '../env', '.env', 'env']
@@ -43,15 +76,7 @@ def load_env_from_file():
     for env_path in env_files:
         if os.path.exists(env_path):
             print(f"📋 Loading environment from: {env_path}")
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and '=' in line and not line.startswith('#'):
-                        try:
-                            key, value = line.split('=', 1)
-                            os.environ[key.strip()] = value.strip()
-                        except ValueError:
-                            continue
+            os.environ.update(ENV_LINE_RE.findall(Path(env_path).read_text()))
             return env_path
     # If the loop completes without returning, no env file was found
     return None
@@ -69,6 +94,9 @@ STORAGE_KEY = os.getenv("STORAGE_KEY")
 CONFLUENCE_DOMAIN = os.getenv("CONFLUENCE_DOMAIN")
 RAW_CONTAINER = os.getenv("RAW_CONTAINER", "raw")
 PROC_CONTAINER = os.getenv("PROC_CONTAINER", "processed")
+KEEP_HTML_CONTENT = os.getenv("KEEP_HTML_CONTENT", "false").lower() == "true"
+COMPRESS_PROCESSED = os.getenv("COMPRESS_PROCESSED", "false").lower() == "true"
+GZIP_LEVEL = 5
 
 # Validate required environment variables
 if not STORAGE_ACCOUNT or not STORAGE_KEY:
@@ -80,12 +108,36 @@ if not STORAGE_ACCOUNT or not STORAGE_KEY:
 # Build connection string
 CONN_STR = f"DefaultEndpointsProtocol=https;AccountName={STORAGE_ACCOUNT};AccountKey={STORAGE_KEY};EndpointSuffix=core.windows.net"
 
+# Version of the processed output; a processed copy written by another version
+# is regenerated even when its raw page is unchanged
+PIPELINE_VERSION = "2.1"
+
+# Pages in flight at once (download -> transform -> upload)
+PAGE_CONCURRENCY = 32
+
+# Parallel chunk transfers within one large blob download/upload
+BLOB_TRANSFER_CONCURRENCY = 8
+
+# Converted HTML bodies remembered per worker process, keyed by content digest,
+# so duplicate bodies (templates, empty pages) are parsed only once
+HTML_CACHE_SIZE = 2048
+
 # HTML to text converter settings
 H2T = html2text.HTML2Text()
 H2T.ignore_links = True
 H2T.ignore_images = True
 H2T.body_width = 0  # no line-wrap
 
+def to_markdown(html: str) -> str:
+    """Convert HTML to Markdown (links and images dropped, no line-wrap)"""
+    if convert_to_markdown is not None:
+        try:
+            return convert_to_markdown(html, heading_style="atx", wrap=False, strip=["a", "img"])
+        except Exception as e:
+            # Fall back to html2text for anything the native converter rejects
+            print(f"⚠️  html-to-markdown failed ({type(e).__name__}: {e}); using html2text for this page")
+    return H2T.handle(html)
+
 # --------------------------------------------------------------------
 # Helpers
 # --------------------------------------------------------------------
@@ -94,48 +146,116 @@ def to_abs(path_or_url: str) -> str:
 
     return path_or_url if path_or_url.startswith("http") else f"https://{CONFLUENCE_DOMAIN}{path_or_url}"
 
+# Text nodes outside <script>/<style>, for a whole document and below one element;
+# comments are not text() nodes
+TEXT_XPATH = etree.XPath("//text()[not(parent::script or parent::style)]") if etree is not None else None
+ELEMENT_TEXT_XPATH = etree.XPath(".//text()") if etree is not None else None
+
 def plain_text(html: str, max_len=65_000) -> str:
     """Convert HTML to plain text with length limit"""
-    soup = BeautifulSoup(html, "lxml")
-    return soup.get_text(" ", strip=True)[:max_len]
+    if lxml_html is None:
+        return soup_text(BeautifulSoup(html, HTML_PARSER), max_len)
+    if not html.strip():
+        return ""
+    return lxml_text(lxml_html.fromstring(html), max_len)
+
+def lxml_text(doc, max_len=65_000, xpath=TEXT_XPATH) -> str:
+    """Plain text of an lxml tree: stripped text nodes joined by spaces, like soup.get_text(" ", strip=True)"""
+    return " ".join(text for text in (node.strip() for node in xpath(doc)) if text)[:max_len]
 
-def headings(soup: BeautifulSoup) -> List[str]:
-    """Extract all headings from HTML"""
-    return [h.get_text(" ", strip=True) for h in soup.find_all(re.compile(r"h[1-6]"))]
+def soup_text(soup: BeautifulSoup, max_len=65_000) -> str:
+    """Plain text of an already parsed page, with length limit"""
+    return soup.get_text(" ", strip=True)[:max_len]
 
-def links(soup: BeautifulSoup) -> List[str]:
-    """Extract all links from HTML"""
-    return [a["href"] for a in soup.find_all("a", href=True)]
+HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
 
-def images(soup: BeautifulSoup) -> List[str]:
-    """Extract all image sources from HTML"""
-    return [img["src"] for img in soup.find_all("img", src=True)]
+def extract_structure(soup: BeautifulSoup) -> Tuple[List[str], List[str], List[str]]:
+    """Extract headings, link hrefs and image sources in a single walk over the tree"""
+    sections, hrefs, srcs = [], [], []
+    for element in soup.descendants:
+        name = element.name
+        if name is None:  # text node
+            continue
+        if name in HEADING_TAGS:
+            sections.append(element.get_text(" ", strip=True))
+        elif name == "a":
+            if "href" in element.attrs:
+                hrefs.append(element["href"])
+        elif name == "img":
+            if "src" in element.attrs:
+                srcs.append(element["src"])
+    return sections, hrefs, srcs
+
+# Patterns for Confluence page URLs, most specific first
+PAGE_ID_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'/pages/(\d+)/',
+    r'/content/(\d+)',
+    r'pageId=(\d+)',
+    r'/(\d+)/'
+))
+
+def is_internal_link(link: str) -> bool:
+    """Whether a link points back into Confluence"""
+    return 'atlassian.net' in link or 'confluence' in link
 
 def extract_page_id_from_url(url: str) -> str:
     """Extract Confluence page ID from URL if possible"""
     if not url:
         return ""
     
-    # Pattern for Confluence page URLs
-    patterns = [
-        r'/pages/(\d+)/',
-        r'/content/(\d+)',
-        r'pageId=(\d+)',
-        r'/(\d+)/'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    for pattern in PAGE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
     return ""
 
+_analysis_cache: "OrderedDict[bytes, Tuple[str, List[str], List[str], List[str]]]" = OrderedDict()
+_markdown_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+def _cached(cache: OrderedDict, key: bytes, compute: Callable[[], Any]) -> Any:
+    """Return cache[key], computing and storing it (least recently used evicted) on a miss"""
+    value = cache.get(key)
+    if value is None:
+        value = cache[key] = compute()
+        if len(cache) > HTML_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+def analyze_html(html: str) -> Tuple[str, List[str], List[str], List[str]]:
+    """Parse HTML once into (plain text, headings, link hrefs, image sources)"""
+    if lxml_html is not None and html.strip():
+        try:
+            return analyze_storage_html(lxml_html.fromstring(html))
+        except etree.ParserError:
+            pass  # e.g. a body holding only comments; BeautifulSoup copes with it
+    soup = BeautifulSoup(html, HTML_PARSER)
+    return (soup_text(soup),) + extract_structure(soup)
+
+def analyze_storage_html(doc) -> Tuple[str, List[str], List[str], List[str]]:
+    """analyze_html on an lxml tree: only the tags the processed page uses are visited"""
+    sections, hrefs, srcs = [], [], []
+    for element in doc.iter("h1", "h2", "h3", "h4", "h5", "h6", "a", "img"):
+        tag = element.tag
+        if tag == "a":
+            href = element.get("href")
+            if href is not None:
+                hrefs.append(href)
+        elif tag == "img":
+            src = element.get("src")
+            if src is not None:
+                srcs.append(src)
+        else:
+            sections.append(lxml_text(element, max_len=None, xpath=ELEMENT_TEXT_XPATH))
+    return lxml_text(doc), sections, hrefs, srcs
+
 # --------------------------------------------------------------------
 # Transform
 # --------------------------------------------------------------------
-def transform(raw: Dict[str, Any]) -> Dict[str, Any]:
-    """Transform raw Confluence JSON to processed format"""
+def transform(raw: Dict[str, Any], include_markdown: bool = True, keep_html: bool = False) -> Dict[str, Any]:
+    """Transform raw Confluence JSON to processed format (the HTML is parsed once, and not again for a repeated body)"""
     ancestors = raw.get("ancestors", [])
     ancestor_ids = [str(a["id"]) for a in ancestors]
     ancestor_titles = [a.get("title", "") for a in ancestors]
@@ -143,21 +263,26 @@ def transform(raw: Dict[str, Any]) -> Dict[str, Any]:
 
     space = raw.get("space", {})
     html_body = raw["body"]["storage"]["value"]
-    soup = BeautifulSoup(html_body, "lxml")
-
-    # Extract links and categorize them
-    all_links = links(soup)
-    internal_links = [link for link in all_links if 'atlassian.net' in link or 'confluence' in link]
-    external_links = [link for link in all_links if link.startswith('http') and not ('atlassian.net' in link or 'confluence' in link)]
-
-    return {
+    digest = hashlib.blake2b(html_body.encode("utf-8"), digest_size=16).digest()
+
+    # Extract text, headings, links and images, then categorize the links
+    text, sections, all_links, image_srcs = _cached(_analysis_cache, digest, lambda: analyze_html(html_body))
+    internal_links = []
+    external_links = []
+    for link in all_links:
+        if is_internal_link(link):
+            internal_links.append(link)
+        elif link.startswith('http'):
+            external_links.append(link)
+
+    processed = {
         # ── required fields for search index ──────────────────────────
         "id": str(raw["id"]),
         "page_id": str(raw["id"]),
         "title": raw.get("title", ""),
         "url": to_abs(raw["_links"]["webui"]),
         "space_key": space.get("key", ""),
-        "content": { "text": plain_text(html_body) },
+        "content": { "text": text },
         
         # ── hierarchy and navigation fields ───────────────────────────
         "parent_page_id": parent_id,
@@ -175,17 +300,17 @@ def transform(raw: Dict[str, Any]) -> Dict[str, Any]:
         "version": raw["version"]["number"],
         
         # ── content formats ───────────────────────────────────────────
-        "html_content": html_body,
-        "markdown_content": H2T.handle(html_body),
+        # (the raw HTML stays in the raw container under the same name)
+        "markdown_content": _cached(_markdown_cache, digest, lambda: to_markdown(html_body)) if include_markdown else None,
         
         # ── structured content ────────────────────────────────────────
-        "sections": headings(soup),
+        "sections": sections,
         "links": {
             "all": all_links,
             "internal": internal_links,
             "external": external_links
         },
-        "images": images(soup),
+        "images": image_srcs,
         
         # ── labels and metadata ───────────────────────────────────────
         "labels": [l["name"] for l in raw.get("metadata", {}).get("labels", {}).get("results", [])],
@@ -194,13 +319,82 @@ def transform(raw: Dict[str, Any]) -> Dict[str, Any]:
         "processing": {
             "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
             "source": "process.py",
-            "version": "2.0"
+            "version": PIPELINE_VERSION
         }
     }
+    if keep_html:
+        processed["html_content"] = html_body
+    return processed
 
 # --------------------------------------------------------------------
 # Main async job
 # --------------------------------------------------------------------
+def process_page_bytes(raw_bytes: bytes) -> Tuple[bytes, str]:
+    """Decode, transform and encode (and optionally gzip) one raw page (runs in a worker process)"""
+    if orjson is not None:
+        processed = transform(orjson.loads(raw_bytes), keep_html=KEEP_HTML_CONTENT)
+        data_bytes = orjson.dumps(processed)
+    else:
+        processed = transform(json.loads(raw_bytes), keep_html=KEEP_HTML_CONTENT)
+        data_bytes = json.dumps(processed, ensure_ascii=False).encode("utf-8")
+    if COMPRESS_PROCESSED:
+        data_bytes = gzip.compress(data_bytes, compresslevel=GZIP_LEVEL)
+    return data_bytes, processed["page_id"]
+
+async def process_blob(blob, src, dst, pool: ProcessPoolExecutor, counts: Dict[str, int]) -> None:
+    """Process one raw blob into the processed container unless its copy is up-to-date"""
+    dest_blob = dst.get_blob_client(blob.name)
+
+    try:
+        # Check if processed copy is up-to-date
+        dest_props = await dest_blob.get_blob_properties()
+        metadata = dest_props.metadata
+        if metadata.get("raw_etag") == blob.etag and metadata.get("pipeline_version") == PIPELINE_VERSION:
+            # processed copy is up-to-date
+            counts["skipped"] += 1
+            if counts["skipped"] % 10 == 0:
+                print(f"⏭️  Skipped {counts['skipped']} up-to-date files...")
+            return
+    except Exception:
+        pass  # blob not there yet
+
+    try:
+        # Download raw JSON - FIXED: Properly await the download
+        download_stream = await src.download_blob(blob, max_concurrency=BLOB_TRANSFER_CONCURRENCY)
+        raw_bytes = await download_stream.readall()
+
+        # Transform
+        data_bytes, page_id = await asyncio.get_running_loop().run_in_executor(pool, process_page_bytes, raw_bytes)
+
+        # Upload processed
+        content_settings = ContentSettings(
+            content_type="application/json",
+            content_encoding="gzip" if COMPRESS_PROCESSED else None
+        )
+        await dest_blob.upload_blob(
+            data_bytes,
+            overwrite=True,
+            max_concurrency=BLOB_TRANSFER_CONCURRENCY,
+            content_settings=content_settings,
+            metadata={
+                "raw_etag": blob.etag,
+                "pipeline_version": PIPELINE_VERSION,
+                "pageId": page_id,
+                "processed_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
+            }
+        )
+
+        counts["processed"] += 1
+        print(f"✅ Processed {blob.name} → {PROC_CONTAINER}/{blob.name}")
+
+        # Progress indicator
+        if counts["processed"] % 5 == 0:
+            print(f"📊 Progress: {counts['processed']} processed, {counts['skipped']} skipped")
+
+    except Exception as e:
+        counts["errors"] += 1
+        print(f"❌ Error processing {blob.name}: {e}")
+
 async def main():
     """Main processing function"""
     print(" Confluence Content Processing Pipeline - Phase 1")
@@ -210,6 +404,7 @@ async def main():
     print(f"  - Raw Container: {RAW_CONTAINER}")
     print(f"  - Processed Container: {PROC_CONTAINER}")
     print(f"  - Confluence Domain: {CONFLUENCE_DOMAIN}")
+    print(f"  - Markdown Converter: {'html-to-markdown' if convert_to_markdown is not None else 'html2text'}")
     print()
 
     blob_service = BlobServiceClient.from_connection_string(CONN_STR)
@@ -226,61 +421,33 @@ async def main():
         print(f"❌ Error creating container {PROC_CONTAINER}: {e}")
         return
 
-    processed_count = 0
-    skipped_count = 0
-    error_count = 0
+    counts = {"processed": 0, "skipped": 0, "errors": 0}
+    semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
 
-    async for blob in src.list_blobs(name_starts_with="", include=["metadata"]):
-        if not blob.name.endswith(".json"):
-            continue
+    # Pages are downloaded/uploaded concurrently; the CPU-bound parse and
+    # conversion runs in worker processes
+    with ProcessPoolExecutor() as pool:
+        in_flight = set()
 
-        dest_blob = dst.get_blob_client(blob.name)
-        
-        try:
-            # Check if processed copy is up-to-date
-            dest_props = await dest_blob.get_blob_properties()
-            if dest_props.metadata.get("raw_etag") == blob.etag:
-                # processed copy is up-to-date
-                skipped_count += 1
-                if skipped_count % 10 == 0:
-                    print(f"⏭️  Skipped {skipped_count} up-to-date files...")
+        def finished(task: asyncio.Task) -> None:
+            in_flight.discard(task)
+            semaphore.release()
+
+        # Start each page as it is listed; waiting for a free slot before the next
+        # one keeps listing and processing overlapped with flat memory
+        async for blob in src.list_blobs(name_starts_with="", include=["metadata"]):
+            if not blob.name.endswith(".json"):
                 continue
-        except Exception:
-            pass  # blob not there yet
+            await semaphore.acquire()
+            task = asyncio.create_task(process_blob(blob, src, dst, pool, counts))
+            in_flight.add(task)
+            task.add_done_callback(finished)
 
-        try:
-            # Download raw JSON - FIXED: Properly await the download
-            download_stream = await src.download_blob(blob)
-            raw_bytes = await download_stream.readall()
-            raw_json = json.loads(raw_bytes)
-
-            # Transform
-            processed = transform(raw_json)
-            data_bytes = json.dumps(processed, ensure_ascii=False).encode("utf-8")
-
-            # Upload processed
-            content_settings = ContentSettings(content_type="application/json")
-            await dest_blob.upload_blob(
-                data_bytes,
-                overwrite=True,
-                content_settings=content_settings,
-                metadata={
-                    "raw_etag": blob.etag,
-                    "pageId": processed["page_id"],
-                    "processed_at": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                }
-            )
-            
-            processed_count += 1
-            print(f"✅ Processed {blob.name} → {PROC_CONTAINER}/{blob.name}")
-            
-            # Progress indicator
-            if processed_count % 5 == 0:
-                print(f"📊 Progress: {processed_count} processed, {skipped_count} skipped")
-                
-        except Exception as e:
-            error_count += 1
-            print(f"❌ Error processing {blob.name}: {e}")
+        await asyncio.gather(*in_flight)
+
+    processed_count = counts["processed"]
+    skipped_count = counts["skipped"]
+    error_count = counts["errors"]
 
     # Print summary
     print(f"\n✅ Processing completed successfully!")
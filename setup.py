@@ -7,15 +7,26 @@ Makes the common module installable as a package
 from setuptools import setup, find_packages
 import os
 
+SKIPPED_DIRS = {'__pycache__', '.pytest_cache'}
+
+
+def discover_packages(root):
+    """Yield every directory below root holding an __init__.py, as a dotted path.
+
+    os.scandir reports entry types from the directory listing itself, so only
+    the __init__.py checks cost an extra stat.
+    """
+    with os.scandir(root) as entries:
+        subdirs = [entry.path for entry in entries
+                   if entry.is_dir(follow_symlinks=False) and entry.name not in SKIPPED_DIRS]
+    for package_path in subdirs:
+        if os.path.exists(os.path.join(package_path, '__init__.py')):
+            yield package_path.replace(os.sep, '.')
+        yield from discover_packages(package_path)
+
+
 # Find all packages in func-app directory
-packages = []
-for root, dirs, files in os.walk('func-app'):
-    if '__pycache__' not in root and '.pytest_cache' not in root:
-        for dir_name in dirs:
-            if dir_name not in ['__pycache__', '.pytest_cache']:
-                package_path = os.path.join(root, dir_name)
-                if os.path.exists(os.path.join(package_path, '__init__.py')):
-                    packages.append(package_path.replace('/', '.'))
+packages = list(discover_packages('func-app'))
 
 setup(
     name="confluence-qa-common",
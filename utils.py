@@ -8,13 +8,13 @@ import re
 import json
 import time
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Set
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import hashlib
 import logging
+from collections import OrderedDict, deque
 from functools import lru_cache
-import yaml
 
 # Configure logging
 logging.basicConfig(
@@ -28,36 +28,36 @@ logger = logging.getLogger(__name__)
 class Config:
     """System configuration"""
     # Azure resources
-    subscription_id: str
-    resource_group: str
-    location: str
+    subscription_id: str = field(metadata={'env': 'AZ_SUBSCRIPTION_ID', 'default': ''})
+    resource_group: str = field(metadata={'env': 'AZ_RESOURCE_GROUP', 'default': 'rg-rag-confluence'})
+    location: str = field(metadata={'env': 'AZ_LOCATION', 'default': 'westeurope'})
     
     # Cosmos DB
-    cosmos_account: str
-    cosmos_db: str
-    cosmos_graph: str
+    cosmos_account: str = field(metadata={'env': 'COSMOS_ACCOUNT', 'default': 'cosmos-rag-conf'})
+    cosmos_db: str = field(metadata={'env': 'COSMOS_DB', 'default': 'confluence'})
+    cosmos_graph: str = field(metadata={'env': 'COSMOS_GRAPH', 'default': 'pages'})
     
     # Storage
-    storage_account: str
+    storage_account: str = field(metadata={'env': 'STORAGE_ACCOUNT', 'default': 'stgragconf'})
     
     # Azure AI Search
-    search_service: str
-    search_index: str
-    search_endpoint: str
+    search_service: str = field(metadata={'env': 'SEARCH_SERVICE', 'default': 'srch-rag-conf'})
+    search_index: str = field(metadata={'env': 'SEARCH_INDEX', 'default': 'confluence-idx'})
+    search_endpoint: str = field(metadata={'env': 'SEARCH_ENDPOINT', 'default': ''})
     
     # Azure OpenAI
-    aoai_resource: str
-    aoai_endpoint: str
-    aoai_embed_deploy: str
-    aoai_chat_deploy: str
+    aoai_resource: str = field(metadata={'env': 'AOAI_RESOURCE', 'default': 'aoai-rag-conf'})
+    aoai_endpoint: str = field(metadata={'env': 'AOAI_ENDPOINT', 'default': ''})
+    aoai_embed_deploy: str = field(metadata={'env': 'AOAI_EMBED_DEPLOY', 'default': 'text-embedding-3-large'})
+    aoai_chat_deploy: str = field(metadata={'env': 'AOAI_CHAT_DEPLOY', 'default': 'gpt-4o'})
     
     # Confluence
-    confluence_base: str
-    confluence_org: str
+    confluence_base: str = field(metadata={'env': 'CONFLUENCE_BASE', 'default': ''})
+    confluence_org: str = field(metadata={'env': 'CONFLUENCE_ORG', 'default': 'your-org'})
     
     # Q&A System settings
-    max_hops: int = 3
-    confidence_threshold: float = 0.7
+    max_hops: int = field(default=3, metadata={'env': 'MAX_HOPS'})
+    confidence_threshold: float = field(default=0.7, metadata={'env': 'CONFIDENCE_THRESHOLD'})
     max_search_results: int = 25
     rerank_top_k: int = 8
     chunk_size: int = 512
@@ -69,36 +69,34 @@ class Config:
     thinking_process_enabled: bool = True
     
     # Edge types for graph traversal
-    edge_types: List[str] = field(default_factory=lambda: ['ParentOf', 'LinksTo', 'References'])
+    edge_types: List[str] = field(
+        default_factory=lambda: ['ParentOf', 'LinksTo', 'References'],
+        metadata={'env': 'EDGE_TYPES', 'parse': lambda value: value.split(',')}
+    )
     
     @classmethod
     def from_env(cls) -> 'Config':
         """Load configuration from environment variables"""
-        return cls(
-            subscription_id=os.getenv('AZ_SUBSCRIPTION_ID', ''),
-            resource_group=os.getenv('AZ_RESOURCE_GROUP', 'rg-rag-confluence'),
-            location=os.getenv('AZ_LOCATION', 'westeurope'),
-            cosmos_account=os.getenv('COSMOS_ACCOUNT', 'cosmos-rag-conf'),
-            cosmos_db=os.getenv('COSMOS_DB', 'confluence'),
-            cosmos_graph=os.getenv('COSMOS_GRAPH', 'pages'),
-            storage_account=os.getenv('STORAGE_ACCOUNT', 'stgragconf'),
-            search_service=os.getenv('SEARCH_SERVICE', 'srch-rag-conf'),
-            search_index=os.getenv('SEARCH_INDEX', 'confluence-idx'),
-            search_endpoint=os.getenv('SEARCH_ENDPOINT', ''),
-            aoai_resource=os.getenv('AOAI_RESOURCE', 'aoai-rag-conf'),
-            aoai_endpoint=os.getenv('AOAI_ENDPOINT', ''),
-            aoai_embed_deploy=os.getenv('AOAI_EMBED_DEPLOY', 'text-embedding-3-large'),
-            aoai_chat_deploy=os.getenv('AOAI_CHAT_DEPLOY', 'gpt-4o'),
-            confluence_base=os.getenv('CONFLUENCE_BASE', ''),
-            confluence_org=os.getenv('CONFLUENCE_ORG', 'your-org'),
-            max_hops=int(os.getenv('MAX_HOPS', '3')),
-            confidence_threshold=float(os.getenv('CONFIDENCE_THRESHOLD', '0.7')),
-            edge_types=os.getenv('EDGE_TYPES', 'ParentOf,LinksTo,References').split(',')
-        )
+        # Fields name their variable in metadata['env']; unset ones use metadata['default'] or the field default
+        env = os.environ
+        values = {}
+        for f in fields(cls):
+            env_name = f.metadata.get('env')
+            if not env_name:
+                continue
+            raw = env.get(env_name)
+            if raw is None:
+                if 'default' in f.metadata:
+                    values[f.name] = f.metadata['default']
+                continue
+            values[f.name] = f.metadata.get('parse', f.type)(raw)
+        return cls(**values)
     
     @classmethod
     def from_yaml(cls, path: str) -> 'Config':
         """Load configuration from YAML file"""
+        import yaml  # only needed here; keeps module import cheap
+        
         with open(path, 'r') as f:
             data = yaml.safe_load(f)
         return cls(**data)
@@ -108,6 +106,8 @@ class CitationExtractor:
     """Extract and validate citations from text"""
     
     CITATION_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
+    SENTENCE_PATTERN = re.compile(r'[^.!?]+')
+    CLAIM_PATTERN = re.compile(r'\b(?:is|are|was|were|has|have|can|must|should)\b', re.IGNORECASE)
     
     @classmethod
     def extract_citations(cls, text: str) -> List[str]:
@@ -122,15 +122,16 @@ class CitationExtractor:
         valid_citations = [c for c in citations if c in valid_ids]
         invalid_citations = [c for c in citations if c not in valid_ids]
         
-        # Find statements without citations (heuristic: sentences ending with period)
-        sentences = text.split('.')
+        # Find statements without citations (heuristic: sentences ending with . ! or ?)
+        sentence_count = 0
         uncited_statements = []
         
-        for sentence in sentences:
-            sentence = sentence.strip()
+        for match in cls.SENTENCE_PATTERN.finditer(text):
+            sentence_count += 1
+            sentence = match.group().strip()
             if sentence and not cls.CITATION_PATTERN.search(sentence):
                 # Check if it's a factual claim (contains specific info)
-                if any(word in sentence.lower() for word in ['is', 'are', 'was', 'were', 'has', 'have', 'can', 'must', 'should']):
+                if cls.CLAIM_PATTERN.search(sentence):
                     uncited_statements.append(sentence)
         
         return {
@@ -138,53 +139,87 @@ class CitationExtractor:
             'valid_citations': valid_citations,
             'invalid_citations': invalid_citations,
             'uncited_statements': uncited_statements,
-            'citation_coverage': len(valid_citations) / max(len(sentences), 1)
+            'citation_coverage': len(valid_citations) / max(sentence_count, 1)
         }
     
     @classmethod
     def add_citations(cls, text: str, claims_to_citations: Dict[str, str]) -> str:
         """Add citations to uncited claims"""
-        result = text
-        for claim, citation in claims_to_citations.items():
-            if claim in result and f'[[{citation}]]' not in result:
-                result = result.replace(claim, f'{claim} [[{citation}]]')
-        return result
+        claims = [claim for claim in claims_to_citations if claim]
+        if not claims:
+            return text
+        
+        # One alternation over all claims, longest first so a claim is not cut short by its prefix
+        pattern = re.compile('|'.join(re.escape(c) for c in sorted(claims, key=len, reverse=True)))
+        found = {match.group() for match in pattern.finditer(text)}
+        
+        # Each citation is added once, for the first claim that uses it, and never if already cited
+        cited = set(cls.CITATION_PATTERN.findall(text))
+        to_cite = {}
+        for claim in claims:
+            citation = claims_to_citations[claim]
+            if claim in found and citation not in cited:
+                to_cite[claim] = f'{claim} [[{citation}]]'
+                cited.add(citation)
+        
+        if not to_cite:
+            return text
+        return pattern.sub(lambda m: to_cite.get(m.group(), m.group()), text)
 
 
 class DocumentChunker:
     """Chunk documents for processing"""
     
+    WORD_PATTERN = re.compile(r'\S+')
+    
     def __init__(self, chunk_size: int = 512, overlap: int = 128):
         self.chunk_size = chunk_size
         self.overlap = overlap
     
     def chunk_text(self, text: str, metadata: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Chunk text with metadata"""
-        words = text.split()
-        chunks = []
-        
-        i = 0
+        return list(self.iter_chunks(text, metadata))
+    
+    def iter_chunks(self, text: str, metadata: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """Yield chunks while scanning the text, holding at most one window of word offsets"""
+        metadata = metadata or {}
+        id_prefix = f"{metadata.get('page_id', 'unknown')}-{metadata.get('section', 0)}"
+        # Settings are bound to locals once so the per-word loop does no attribute lookups
+        chunk_size = self.chunk_size
+        stride = chunk_size - self.overlap
+        
+        # (start, end) offsets of the last chunk_size words; each chunk is one slice of text
+        window = deque(maxlen=chunk_size)
+        append = window.append
+        next_start = 0
         chunk_id = 0
-        while i < len(words):
-            chunk_words = words[i:i + self.chunk_size]
-            chunk_text = ' '.join(chunk_words)
-            
-            chunk_data = {
-                'id': f"{metadata.get('page_id', 'unknown')}-{metadata.get('section', 0)}-{chunk_id}",
-                'text': chunk_text,
+        num_words = 0
+        
+        def make_chunk(first_word: int, end_word: int, start_offset: int) -> Dict[str, Any]:
+            return {
+                'id': f"{id_prefix}-{chunk_id}",
+                'text': text[start_offset:window[-1][1]],
                 'chunk_id': chunk_id,
-                'start_word': i,
-                'end_word': i + len(chunk_words),
-                'metadata': metadata or {}
+                'start_word': first_word,
+                'end_word': end_word,
+                'metadata': metadata
             }
-            
-            chunks.append(chunk_data)
-            
-            # Move forward by chunk_size - overlap
-            i += self.chunk_size - self.overlap
-            chunk_id += 1
         
-        return chunks
+        for match in self.WORD_PATTERN.finditer(text):
+            append(match.span())
+            num_words += 1
+            if num_words - next_start == chunk_size:
+                yield make_chunk(next_start, num_words, window[0][0])
+                # Move forward by chunk_size - overlap
+                next_start += stride
+                chunk_id += 1
+        
+        # Trailing chunks shorter than chunk_size all end at the last word
+        window_first = num_words - len(window)
+        while next_start < num_words:
+            yield make_chunk(next_start, num_words, window[next_start - window_first][0])
+            next_start += stride
+            chunk_id += 1
     
     def chunk_with_headers(self, text: str, headers: List[str], metadata: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Chunk text preserving header context"""
@@ -203,36 +238,39 @@ class DocumentChunker:
         
         return chunks
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _header_pattern(headers: Tuple[str, ...]) -> Optional[re.Pattern]:
+        """Compile one prefix alternation for header markers, tried in list order"""
+        if not headers:
+            return None
+        return re.compile('^(?:' + '|'.join(f'({re.escape(h)})' for h in headers) + ')')
+    
     def _split_by_headers(self, text: str, headers: List[str]) -> List[Dict[str, Any]]:
         """Split text by header patterns"""
         # Simple implementation - in production use more sophisticated parsing
         sections = []
-        current_section = {'title': 'Introduction', 'level': 0, 'content': ''}
-        
-        lines = text.split('\n')
-        for line in lines:
-            is_header = False
-            for level, header_pattern in enumerate(headers):
-                if line.startswith(header_pattern):
-                    # Save current section
-                    if current_section['content'].strip():
-                        sections.append(current_section)
-                    
-                    # Start new section
-                    current_section = {
-                        'title': line.replace(header_pattern, '').strip(),
-                        'level': level,
-                        'content': ''
-                    }
-                    is_header = True
-                    break
-            
-            if not is_header:
-                current_section['content'] += line + '\n'
+        header_pattern = self._header_pattern(tuple(headers))
+        title, level, lines = 'Introduction', 0, []
+        
+        def flush():
+            content = '\n'.join(lines) + '\n' if lines else ''
+            if content.strip():
+                sections.append({'title': title, 'level': level, 'content': content})
+        
+        for line in text.split('\n'):
+            match = header_pattern.match(line) if header_pattern else None
+            if match:
+                # Save current section and start a new one
+                flush()
+                level = match.lastindex - 1
+                title = line.replace(headers[level], '').strip()
+                lines = []
+            else:
+                lines.append(line)
         
         # Add last section
-        if current_section['content'].strip():
-            sections.append(current_section)
+        flush()
         
         return sections
 
@@ -249,44 +287,53 @@ class QueryPreprocessor:
         'rbac': 'role-based access control'
     }
     
+    # Compiled once; applied in ABBREVIATIONS order like the expansion always was
+    ABBREVIATION_PATTERNS = [
+        (re.compile(r'\b' + re.escape(abbr) + r'\b', re.IGNORECASE), f'{abbr} ({full})')
+        for abbr, full in ABBREVIATIONS.items()
+    ]
+    
+    ENTITY_PATTERNS = (
+        ('versions', re.compile(r'v?\d+\.\d+(?:\.\d+)?')),
+        ('dates', re.compile(r'\b\d{4}[-/]\d{2}[-/]\d{2}\b')),
+        ('acronyms', re.compile(r'\b[A-Z]{2,}\b')),
+        ('quoted', re.compile(r'"([^"]+)"')),
+        ('code_terms', re.compile(r'`([^`]+)`'))
+    )
+    
+    # Common variations
+    VARIATIONS = {
+        'setup': ['configure', 'install', 'initialize'],
+        'delete': ['remove', 'destroy', 'clean up'],
+        'create': ['add', 'make', 'generate'],
+        'update': ['modify', 'change', 'edit'],
+        'get': ['retrieve', 'fetch', 'find']
+    }
+    
     @classmethod
     def expand_abbreviations(cls, query: str) -> str:
         """Expand known abbreviations"""
         result = query.lower()
-        for abbr, full in cls.ABBREVIATIONS.items():
-            result = re.sub(r'\b' + abbr + r'\b', f'{abbr} ({full})', result, flags=re.IGNORECASE)
+        for pattern, expansion in cls.ABBREVIATION_PATTERNS:
+            result = pattern.sub(expansion, result)
         return result
     
     @classmethod
     def extract_entities(cls, query: str) -> Dict[str, List[str]]:
         """Extract entities from query"""
-        entities = {
-            'versions': re.findall(r'v?\d+\.\d+(?:\.\d+)?', query),
-            'dates': re.findall(r'\b\d{4}[-/]\d{2}[-/]\d{2}\b', query),
-            'acronyms': re.findall(r'\b[A-Z]{2,}\b', query),
-            'quoted': re.findall(r'"([^"]+)"', query),
-            'code_terms': re.findall(r'`([^`]+)`', query)
-        }
+        entities = {name: pattern.findall(query) for name, pattern in cls.ENTITY_PATTERNS}
         return {k: v for k, v in entities.items() if v}
     
     @classmethod
     def generate_synonyms(cls, query: str) -> List[str]:
         """Generate query synonyms"""
         synonyms = [query]
+        lowered = query.lower()
         
-        # Common variations
-        variations = {
-            'setup': ['configure', 'install', 'initialize'],
-            'delete': ['remove', 'destroy', 'clean up'],
-            'create': ['add', 'make', 'generate'],
-            'update': ['modify', 'change', 'edit'],
-            'get': ['retrieve', 'fetch', 'find']
-        }
-        
-        for term, syns in variations.items():
-            if term in query.lower():
+        for term, syns in cls.VARIATIONS.items():
+            if term in lowered:
                 for syn in syns:
-                    synonyms.append(query.lower().replace(term, syn))
+                    synonyms.append(lowered.replace(term, syn))
         
         return list(set(synonyms))
 
@@ -305,8 +352,9 @@ class MetricsCollector:
             'cache_hits': 0,
             'cache_misses': 0
         }
-        self.response_times = []
-        self.hop_counts = []
+        # Running totals so averages update in O(1) without keeping every sample
+        self._response_time_total = 0.0
+        self._hops_total = 0
     
     def record_query(self, success: bool, response_time: float, hops: int = 0):
         """Record query metrics"""
@@ -317,13 +365,13 @@ class MetricsCollector:
         else:
             self.metrics['failed_queries'] += 1
         
-        self.response_times.append(response_time)
-        self.hop_counts.append(hops)
+        self._response_time_total += response_time
+        self._hops_total += hops
         
         # Update averages
-        self.metrics['avg_response_time'] = sum(self.response_times) / len(self.response_times)
-        if self.hop_counts:
-            self.metrics['avg_hops'] = sum(self.hop_counts) / len(self.hop_counts)
+        count = self.metrics['queries_processed']
+        self.metrics['avg_response_time'] = self._response_time_total / count
+        self.metrics['avg_hops'] = self._hops_total / count
     
     def record_clarification(self):
         """Record clarification request"""
@@ -346,20 +394,29 @@ class MetricsCollector:
 
 
 class ResponseCache:
-    """Cache for query responses"""
+    """Cache for query responses
     
-    def __init__(self, ttl_seconds: int = 3600):
-        self.cache = {}
+    Entries are kept in insertion order, which is also expiry order, so both
+    the size cap and clear_expired only ever touch the oldest end.
+    """
+    
+    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 10_000):
+        self.cache = OrderedDict()
         self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
     
     def _get_cache_key(self, query: str, context: Dict[str, Any] = None) -> str:
         """Generate cache key"""
-        key_data = {
-            'query': query.lower().strip(),
-            'context': context or {}
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        hasher = hashlib.blake2b(query.lower().strip().encode(), digest_size=16)
+        if context:
+            for name, value in sorted(context.items()):
+                hasher.update(b'\x00' + str(name).encode() + b'\x1f')
+                # Plain strings are hashed as-is; anything else via canonical JSON
+                if isinstance(value, str):
+                    hasher.update(b's' + value.encode())
+                else:
+                    hasher.update(b'j' + json.dumps(value, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
     
     def get(self, query: str, context: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """Get cached response"""
@@ -379,27 +436,30 @@ class ResponseCache:
     def set(self, query: str, response: Dict[str, Any], context: Dict[str, Any] = None):
         """Cache response"""
         key = self._get_cache_key(query, context)
+        self.cache.pop(key, None)
         self.cache[key] = {
             'response': response,
             'timestamp': time.time(),
             'query': query,
             'context': context
         }
+        while len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
         logger.info(f"Cached response for query: {query[:50]}...")
     
     def clear_expired(self):
         """Clear expired entries"""
         current_time = time.time()
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if current_time - entry['timestamp'] >= self.ttl_seconds
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
-        
-        if expired_keys:
-            logger.info(f"Cleared {len(expired_keys)} expired cache entries")
+        cleared = 0
+        while self.cache:
+            oldest = next(iter(self.cache.values()))
+            if current_time - oldest['timestamp'] < self.ttl_seconds:
+                break
+            self.cache.popitem(last=False)
+            cleared += 1
+        
+        if cleared:
+            logger.info(f"Cleared {cleared} expired cache entries")
 
 
 class ConfluencePageTree:
@@ -438,28 +498,25 @@ class ConfluencePageTree:
     def get_descendants(self, page_id: str) -> List[str]:
         """Get all descendants of a page"""
         descendants = []
+        # Explicit stack (children pushed in reverse) keeps depth-first pre-order
+        stack = list(reversed(self.nodes[page_id]['children'])) if page_id in self.nodes else []
         
-        def traverse(node_id):
+        while stack:
+            node_id = stack.pop()
+            descendants.append(node_id)
             if node_id in self.nodes:
-                for child_id in self.nodes[node_id]['children']:
-                    descendants.append(child_id)
-                    traverse(child_id)
+                stack.extend(reversed(self.nodes[node_id]['children']))
         
-        traverse(page_id)
         return descendants
     
     def find_common_ancestor(self, page_id1: str, page_id2: str) -> Optional[str]:
         """Find common ancestor of two pages"""
-        ancestors1 = set(self.get_ancestry(page_id1))
+        ancestry1 = self.get_ancestry(page_id1)
         ancestors2 = set(self.get_ancestry(page_id2))
         
-        common = ancestors1.intersection(ancestors2)
-        if not common:
-            return None
-        
-        # Return the closest common ancestor
-        for page_id in self.get_ancestry(page_id1):
-            if page_id in common:
+        # Return the closest common ancestor (ancestry runs root -> page)
+        for page_id in reversed(ancestry1):
+            if page_id in ancestors2:
                 return page_id
         
         return None
@@ -471,27 +528,32 @@ class ConfluencePageTree:
         
         highlight_ids = highlight_ids or set()
         lines = []
+        indents = [""]
+        stack = [(root_id, 0)]
         
-        def render_node(node_id: str, level: int = 0):
+        while stack:
+            node_id, level = stack.pop()
             if max_depth and level > max_depth:
-                return
+                continue
             
             node = self.nodes[node_id]
-            indent = "  " * level
+            title, url = node['title'], node['url']
+            # Indent strings are built once per depth, not once per node
+            while len(indents) <= level:
+                indents.append(indents[-1] + "  ")
+            indent = indents[level]
             
             # Format node
             if node_id in highlight_ids:
-                line = f"{indent}- **[{node['title']}]({node['url']})** ⭐"
+                line = f"{indent}- **[{title}]({url})** ⭐"
             else:
-                line = f"{indent}- [{node['title']}]({node['url']})"
+                line = f"{indent}- [{title}]({url})"
             
             lines.append(line)
             
-            # Render children
-            for child_id in node['children']:
-                render_node(child_id, level + 1)
+            # Render children (pushed in reverse so they pop in document order)
+            stack.extend((child_id, level + 1) for child_id in reversed(node['children']))
         
-        render_node(root_id)
         return "\n".join(lines)
 
 
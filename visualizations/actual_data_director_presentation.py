@@ -5,97 +5,325 @@ Actual Data Director Presentation - Using Real 23 Pages
 
 This script creates director presentation using the actual structure
 of your 23 processed Confluence pages.
+
+The HTML outputs load plotly.js from the Plotly CDN rather than inlining the
+~3 MB bundle, so opening them requires network access.
 """
 
 import pandas as pd
 import networkx as nx
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 import json
+import hashlib
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+from functools import lru_cache
+
+# orjson serializes the Plotly figure JSON much faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Plotting libraries (plotly, matplotlib, seaborn) are imported where used, so
+# statistics and the WebGL network do not pay for the matplotlib stack at startup
+@lru_cache(maxsize=None)
+def _pyplot():
+    """matplotlib.pyplot on the headless backend with the presentation style, set up on first use"""
+    import matplotlib
+    matplotlib.use('Agg')  # headless backend; renders also run in worker processes
+    import matplotlib.pyplot as plt
+    plt.style.use('seaborn-v0_8')
+    return plt
+
+# Actual data from your processed 23 pages, defined once at import.
+# Based on your REAL ingestion results:
+# - Observability: 16 pages  
+# - Software Development: 4 pages
+# - Personal spaces: 3 pages (2 + 1)
+# Total: 23 pages
+
+# Observability space - 16 pages (your largest space)
+OBSERVABILITY_PAGES = (
+    {'pageId': '1376510', 'title': 'Observability', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2500, 'tables_count': 0, 'links_count': 3, 'sections_count': 2},
+    {'pageId': '1376560', 'title': 'Observability Programme!', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 3200, 'tables_count': 1, 'links_count': 4, 'sections_count': 3},
+    {'pageId': '1343493', 'title': 'Knowledge Materials', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 4100, 'tables_count': 1, 'links_count': 6, 'sections_count': 1},
+    {'pageId': '1343494', 'title': 'Core Training Videos', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 1800, 'tables_count': 0, 'links_count': 2, 'sections_count': 2},
+    {'pageId': '1343495', 'title': 'RACI Matrix', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2200, 'tables_count': 1, 'links_count': 1, 'sections_count': 2},
+    {'pageId': '1376561', 'title': 'Security Process (Synthetic)', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2800, 'tables_count': 1, 'links_count': 3, 'sections_count': 3},
+    {'pageId': '1376562', 'title': 'Monitoring Dashboard Setup', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2100, 'tables_count': 1, 'links_count': 2, 'sections_count': 2},
+    {'pageId': '1376563', 'title': 'Alert Configuration Guide', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2900, 'tables_count': 2, 'links_count': 4, 'sections_count': 3},
+    {'pageId': '1376564', 'title': 'SynthTrace Integration', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 3400, 'tables_count': 1, 'links_count': 5, 'sections_count': 4},
+    {'pageId': '1376565', 'title': 'Performance Metrics', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2600, 'tables_count': 2, 'links_count': 3, 'sections_count': 3},
+    {'pageId': '1376566', 'title': 'Incident Response Playbook', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 3100, 'tables_count': 1, 'links_count': 4, 'sections_count': 3},
+    {'pageId': '1376567', 'title': 'Logging Best Practices', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2700, 'tables_count': 1, 'links_count': 2, 'sections_count': 2},
+    {'pageId': '1376568', 'title': 'Service Level Objectives', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2400, 'tables_count': 1, 'links_count': 3, 'sections_count': 2},
+    {'pageId': '1376569', 'title': 'Capacity Planning', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2300, 'tables_count': 1, 'links_count': 2, 'sections_count': 2},
+    {'pageId': '1376570', 'title': 'Tool Integration Matrix', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 1900, 'tables_count': 1, 'links_count': 1, 'sections_count': 1},
+    {'pageId': '1376571', 'title': 'Team Onboarding Checklist', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2000, 'tables_count': 1, 'links_count': 2, 'sections_count': 2}
+)
+
+# Software Development space - 4 pages
+SOFTWARE_DEV_PAGES = (
+    {'pageId': '2001000', 'title': 'Software Development Home', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 1900, 'tables_count': 0, 'links_count': 3, 'sections_count': 2},
+    {'pageId': '2001001', 'title': 'Development Guidelines', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 3500, 'tables_count': 2, 'links_count': 5, 'sections_count': 4},
+    {'pageId': '2001002', 'title': 'Deployment Process', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 2700, 'tables_count': 1, 'links_count': 3, 'sections_count': 3},
+    {'pageId': '2001003', 'title': 'Code Review Checklist', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 1600, 'tables_count': 1, 'links_count': 2, 'sections_count': 2}
+)
+
+# Personal spaces - 3 pages (2 + 1 as per your actual data)
+PERSONAL_PAGES = (
+    {'pageId': '3001000', 'title': 'Himanshu Personal Workspace', 'spaceKey': '~701219d92d5ea59724bda98a71f1354f96d36', 'spaceName': 'Himanshu Chaturvedi', 'text_length': 800, 'tables_count': 0, 'links_count': 1, 'sections_count': 1},
+    {'pageId': '3001001', 'title': 'Project Development Notes', 'spaceKey': '~701219d92d5ea59724bda98a71f1354f96d36', 'spaceName': 'Himanshu Chaturvedi', 'text_length': 1200, 'tables_count': 0, 'links_count': 2, 'sections_count': 2},
+    {'pageId': '3002000', 'title': 'H.Chaturvedi Research', 'spaceKey': '~7120208e89e018f9a74fffbf79c1ed2b8de248', 'spaceName': 'h.chaturvedi14', 'text_length': 950, 'tables_count': 0, 'links_count': 1, 'sections_count': 1}
+)
+
+ACTUAL_PAGES = OBSERVABILITY_PAGES + SOFTWARE_DEV_PAGES + PERSONAL_PAGES
+
+
+# Executive report layout; generate_actual_executive_report fills it with format_map
+_REPORT_TMPL = """
+ACTUAL CONFLUENCE KNOWLEDGE GRAPH - EXECUTIVE ANALYSIS
+=====================================================
+
+DATE: {generated_at}
+DATA SOURCE: Real Processed Data (23 Pages)
+STATUS: Production Analysis from Actual System
+
+🎯 EXECUTIVE OVERVIEW
+--------------------
+This analysis represents the current state of your Confluence Knowledge Graph,
+based on the actual 23 pages that have been successfully ingested and processed.
+
+REAL KNOWLEDGE ASSETS: {total_pages} pages
+ACTUAL RELATIONSHIPS: {total_edges} connections  
+KNOWLEDGE DOMAINS: {num_spaces} spaces
+REAL CONTENT VOLUME: {total_content:,} characters
+
+📊 ACTUAL DATA INSIGHTS
+-----------------------
+CONNECTIVITY ANALYSIS:
+• Graph Density: {graph_density:.3f}
+• Network Components: {num_components}
+• Average Connections: {avg_degree:.1f} per page
+• Connectivity Status: {connectivity_status}
+
+CONTENT QUALITY METRICS:
+• Average Page Size: {avg_content:.0f} characters
+• Content Quality Level: {content_level}
+• Richest Content Page: {max_content:,} characters
+• Structured Elements: {total_tables} tables, {total_sections} sections
+
+🌐 REAL SPACE DISTRIBUTION
+--------------------------{space_lines}
+
+🔗 ACTUAL RELATIONSHIP ANALYSIS
+-------------------------------{edge_lines}
+
+⭐ TOP KNOWLEDGE HUBS (REAL DATA)
+---------------------------------{hub_lines}
+
+💡 STRATEGIC RECOMMENDATIONS (BASED ON ACTUAL SYSTEM)
+----------------------------------------------------
+IMMEDIATE OPPORTUNITIES:
+• Expand most successful spaces (Observability shows strong adoption)
+• Bridge knowledge gaps between Software Development and Observability
+• Enhance cross-space collaboration through linking
+
+SYSTEM OPTIMIZATION:
+• Content Quality: {content_quality}
+• Network Health: {network_health}
+• Knowledge Distribution: {knowledge_distribution}
+
+GROWTH STRATEGY:
+• Target areas with high engagement (Observability space shows 16 pages)
+• Develop cross-functional documentation patterns
+• Implement knowledge sharing workflows
+
+💰 ACTUAL BUSINESS VALUE
+-----------------------
+Current Investment Analysis:
+• Knowledge Assets: {total_pages} pages × $500 creation = ${asset_value:,}
+• Relationship Network: {total_edges} connections × $100 = ${relationship_value:,}
+• Total Knowledge Value: ${total_value:,}
 
-# Set up styling
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+Productivity Impact (Based on Actual Usage):
+• Search Efficiency: 60% improvement with graph navigation
+• Knowledge Discovery: {total_edges} relationships enable insights
+• Team Collaboration: {num_spaces} spaces provide comprehensive coverage
+• Content Reuse: {total_links} internal links promote sharing
+
+📈 REAL SYSTEM METRICS
+----------------------
+• Average Page Quality: {avg_content:.0f} characters (Industry benchmark: 1,500+)
+• Content Depth: {total_tables} structured tables for complex information
+• Navigation Links: {total_links} internal connections
+• Content Organization: {total_sections} structured sections
+
+🎯 ACTUAL SUCCESS INDICATORS
+---------------------------
+✅ System Operational: 23 pages successfully processed and stored
+✅ Content Quality: {avg_content:.0f} avg chars indicates {content_depth} depth
+✅ Network Formation: {graph_density:.3f} density shows {connectivity_strength} connectivity
+✅ Multi-domain Coverage: {num_spaces} spaces across organization
+
+🚀 NEXT STEPS (BASED ON ACTUAL DATA)
+-----------------------------------
+1. Scale successful patterns from Observability space (16 pages) to other areas
+2. Enhance cross-space linking (currently {cross_ref_edge_types} cross-references)
+3. Implement automated content quality monitoring
+4. Deploy advanced search and discovery features
+
+📊 RETURN ON INVESTMENT
+----------------------
+Conservative Annual Benefits:
+• Time Savings: 50 users × 1 hr/week × $65/hr × 50 weeks = $162,500
+• Knowledge Reuse: 25% efficiency gain = $40,625
+• Decision Speed: 15% improvement = $75,000
+• Training Efficiency: 20% reduction = $25,000
+
+TOTAL ANNUAL BENEFIT: $303,125
+IMPLEMENTATION COST: $35,000
+ROI: 766% return on investment
+
+---
+ANALYSIS COMPLETED: {generated_at}
+DATA SOURCE: Actual Production System (23 Real Pages)
+CONFIDENCE LEVEL: HIGH (Live System Data)
+
+This report reflects the true state of your knowledge graph system
+based on actual processed Confluence pages and provides realistic 
+insights for strategic decision-making.
+"""
+
+
+def _render_in_worker(snapshot: bytes, method_name: str, kwargs: Dict[str, Any]) -> str:
+    """Run one render method on a pickled presentation inside a worker process"""
+    presentation = pickle.loads(snapshot)
+    return getattr(presentation, method_name)(**kwargs)
 
 class ActualDataDirectorPresentation:
     """Director presentation using actual 23 pages data structure"""
     
+    # Color by space with distinct colors
+    SPACE_COLORS = {
+        'Observability': '#1f77b4',          # Blue
+        'Software Development': '#ff7f0e',   # Orange
+        'Himanshu Chaturvedi': '#2ca02c',    # Green  
+        'h.chaturvedi14': '#d62728'          # Red
+    }
+    
+    # Source nodes sampled for approximate betweenness centrality
+    BETWEENNESS_SAMPLES = 8
+    
+    # nx.spring_layout parameters for the network views (part of the layout memo key)
+    SPRING_LAYOUT = {'k': 4, 'iterations': 200, 'seed': 42}
+    
+    # Write buffer for report and HTML outputs (1 MiB)
+    WRITE_BUFFER = 1 << 20
+    
+    # Edge colors by relationship type
+    EDGE_COLORS = {
+        'ParentOf': '#2c3e50',
+        'ChildOf': '#34495e', 
+        'LinksTo': '#e74c3c',
+        'LinkedFrom': '#c0392b',
+        'BelongsTo': '#3498db',
+        'Contains': '#2980b9'
+    }
+    
     def __init__(self):
         self.output_dir = Path("actual_director_presentation")
         self.output_dir.mkdir(exist_ok=True)
         
         # Actual data from your processed 23 pages
         self.actual_pages = self.create_actual_data_structure()
+        # Columnar view of the same pages for vectorized aggregations
+        self.pages_df = pd.DataFrame(self.actual_pages)
+        self._page_ids = {page['pageId'] for page in self.actual_pages}
         self.nx_graph = None
         self.statistics = {}
         
+        # Layout and centrality results keyed by graph signature (and layout parameters)
+        self._layout_cache: Dict[tuple, dict] = {}
+        self._centrality_cache: Dict[str, dict] = {}
+        
+        # Matplotlib figure reused across PNG renders (created on first use)
+        self._fig = None
+        
         print("🎯 Actual Data Director Presentation Initialized")
         print(f"📊 Using real structure from your 23 processed pages")
         
     def create_actual_data_structure(self) -> List[Dict[str, Any]]:
         """Create data structure matching your actual 23 processed pages"""
-        
-        # Based on your REAL ingestion results:
-        # - Observability: 16 pages  
-        # - Software Development: 4 pages
-        # - Personal spaces: 3 pages (2 + 1)
-        # Total: 23 pages
-        
-        actual_pages = []
-        
-        # Observability space - 16 pages (your largest space)
-        observability_pages = [
-            {'pageId': '1376510', 'title': 'Observability', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2500, 'tables_count': 0, 'links_count': 3, 'sections_count': 2},
-            {'pageId': '1376560', 'title': 'Observability Programme!', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 3200, 'tables_count': 1, 'links_count': 4, 'sections_count': 3},
-            {'pageId': '1343493', 'title': 'Knowledge Materials', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 4100, 'tables_count': 1, 'links_count': 6, 'sections_count': 1},
-            {'pageId': '1343494', 'title': 'Core Training Videos', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 1800, 'tables_count': 0, 'links_count': 2, 'sections_count': 2},
-            {'pageId': '1343495', 'title': 'RACI Matrix', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2200, 'tables_count': 1, 'links_count': 1, 'sections_count': 2},
-            {'pageId': '1376561', 'title': 'Security Process (Synthetic)', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2800, 'tables_count': 1, 'links_count': 3, 'sections_count': 3},
-            {'pageId': '1376562', 'title': 'Monitoring Dashboard Setup', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2100, 'tables_count': 1, 'links_count': 2, 'sections_count': 2},
-            {'pageId': '1376563', 'title': 'Alert Configuration Guide', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2900, 'tables_count': 2, 'links_count': 4, 'sections_count': 3},
-            {'pageId': '1376564', 'title': 'SynthTrace Integration', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 3400, 'tables_count': 1, 'links_count': 5, 'sections_count': 4},
-            {'pageId': '1376565', 'title': 'Performance Metrics', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2600, 'tables_count': 2, 'links_count': 3, 'sections_count': 3},
-            {'pageId': '1376566', 'title': 'Incident Response Playbook', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 3100, 'tables_count': 1, 'links_count': 4, 'sections_count': 3},
-            {'pageId': '1376567', 'title': 'Logging Best Practices', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2700, 'tables_count': 1, 'links_count': 2, 'sections_count': 2},
-            {'pageId': '1376568', 'title': 'Service Level Objectives', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2400, 'tables_count': 1, 'links_count': 3, 'sections_count': 2},
-            {'pageId': '1376569', 'title': 'Capacity Planning', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2300, 'tables_count': 1, 'links_count': 2, 'sections_count': 2},
-            {'pageId': '1376570', 'title': 'Tool Integration Matrix', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 1900, 'tables_count': 1, 'links_count': 1, 'sections_count': 1},
-            {'pageId': '1376571', 'title': 'Team Onboarding Checklist', 'spaceKey': 'observability', 'spaceName': 'Observability', 'text_length': 2000, 'tables_count': 1, 'links_count': 2, 'sections_count': 2}
-        ]
-        
-        # Software Development space - 4 pages
-        software_dev_pages = [
-            {'pageId': '2001000', 'title': 'Software Development Home', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 1900, 'tables_count': 0, 'links_count': 3, 'sections_count': 2},
-            {'pageId': '2001001', 'title': 'Development Guidelines', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 3500, 'tables_count': 2, 'links_count': 5, 'sections_count': 4},
-            {'pageId': '2001002', 'title': 'Deployment Process', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 2700, 'tables_count': 1, 'links_count': 3, 'sections_count': 3},
-            {'pageId': '2001003', 'title': 'Code Review Checklist', 'spaceKey': 'SD', 'spaceName': 'Software Development', 'text_length': 1600, 'tables_count': 1, 'links_count': 2, 'sections_count': 2}
-        ]
-        
-        # Personal spaces - 3 pages (2 + 1 as per your actual data)
-        personal_pages = [
-            {'pageId': '3001000', 'title': 'Himanshu Personal Workspace', 'spaceKey': '~701219d92d5ea59724bda98a71f1354f96d36', 'spaceName': 'Himanshu Chaturvedi', 'text_length': 800, 'tables_count': 0, 'links_count': 1, 'sections_count': 1},
-            {'pageId': '3001001', 'title': 'Project Development Notes', 'spaceKey': '~701219d92d5ea59724bda98a71f1354f96d36', 'spaceName': 'Himanshu Chaturvedi', 'text_length': 1200, 'tables_count': 0, 'links_count': 2, 'sections_count': 2},
-            {'pageId': '3002000', 'title': 'H.Chaturvedi Research', 'spaceKey': '~7120208e89e018f9a74fffbf79c1ed2b8de248', 'spaceName': 'h.chaturvedi14', 'text_length': 950, 'tables_count': 0, 'links_count': 1, 'sections_count': 1}
-        ]
-        
-        # Combine all pages
-        actual_pages.extend(observability_pages)
-        actual_pages.extend(software_dev_pages)  
-        actual_pages.extend(personal_pages)
-        
-        return actual_pages
+        # Shallow copies: _add_metrics_to_pages adds keys to these per instance
+        return [dict(page) for page in ACTUAL_PAGES]
     
-    def create_relationships_from_actual_data(self) -> List[Dict[str, Any]]:
-        """Create relationships based on actual Confluence page structure"""
-        relationships = []
-        
+    @staticmethod
+    def _graph_signature(G) -> str:
+        """Stable digest of the graph's nodes and edges (hash() of str is salted per process)"""
+        key = repr((sorted(G.nodes()), sorted(G.edges())))
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _spring_layout(self, G) -> dict:
+        """Spring layout for G, computed once per distinct graph and layout parameters"""
+        key = (self._graph_signature(G), tuple(sorted(self.SPRING_LAYOUT.items())))
+        pos = self._layout_cache.get(key)
+        if pos is None:
+            pos = nx.spring_layout(G, weight=None, **self.SPRING_LAYOUT)
+            self._layout_cache[key] = pos
+        return pos
+    
+    @staticmethod
+    def _degree_centrality(G) -> Dict[str, float]:
+        """Degree centrality from sparse adjacency row/column sums, same values as nx.degree_centrality
+        
+        Falls back to NetworkX when scipy is not installed.
+        """
+        n = G.number_of_nodes()
+        if n <= 1:
+            return nx.degree_centrality(G)
+        try:
+            A = nx.to_scipy_sparse_array(G, format='csr', weight=None)
+        except ImportError:
+            return nx.degree_centrality(G)
+        
+        # Out-degree (row sums) plus in-degree (column sums) for directed graphs
+        degrees = np.asarray(A.sum(axis=1)).ravel()
+        if G.is_directed():
+            degrees = degrees + np.asarray(A.sum(axis=0)).ravel()
+        else:
+            # A self-loop adds 2 to an undirected node's degree but only 1 to its row
+            degrees = degrees + A.diagonal()
+        scores = degrees * (1.0 / (n - 1))
+        return dict(zip(G.nodes(), scores.tolist()))
+    
+    def _centrality(self, G) -> dict:
+        """Degree/betweenness centrality and clustering for G, computed once per distinct graph
+        
+        Betweenness is approximated from BETWEENNESS_SAMPLES source nodes (seeded, so
+        repeatable) instead of all pairs; only its top-10 ranking is reported.
+        """
+        sig = self._graph_signature(G)
+        cached = self._centrality_cache.get(sig)
+        if cached is None:
+            cached = {
+                'degree': self._degree_centrality(G),
+                'betweenness': nx.betweenness_centrality(
+                    G, k=min(G.number_of_nodes(), self.BETWEENNESS_SAMPLES), normalized=True, seed=42
+                ),
+                # Undirected view instead of a copy of the graph
+                'clustering': nx.average_clustering(G.to_undirected(as_view=True)) if G.number_of_nodes() > 1 else 0
+            }
+            self._centrality_cache[sig] = cached
+        return cached
+    
+    def create_relationships_from_actual_data(self) -> Iterator[Dict[str, Any]]:
+        """Yield relationships based on actual Confluence page structure"""
         # Hierarchical relationships within spaces
         space_hierarchies = {
             'observability': [
@@ -128,16 +356,16 @@ class ActualDataDirectorPresentation:
         # Create hierarchical relationships
         for space, hierarchy in space_hierarchies.items():
             for parent, child in hierarchy:
-                relationships.append({
+                yield {
                     'source': parent,
                     'target': child,
                     'type': 'ParentOf'
-                })
-                relationships.append({
+                }
+                yield {
                     'source': child,
                     'target': parent,
                     'type': 'ChildOf'
-                })
+                }
         
         # Cross-space relationships (realistic connections)
         cross_space_links = [
@@ -149,32 +377,30 @@ class ActualDataDirectorPresentation:
         ]
         
         for source, target in cross_space_links:
-            relationships.append({
+            yield {
                 'source': source,
                 'target': target,
                 'type': 'LinksTo'
-            })
-            relationships.append({
+            }
+            yield {
                 'source': target,
                 'target': source,
                 'type': 'LinkedFrom'
-            })
+            }
         
         # Space membership relationships
         for page in self.actual_pages:
             space_id = f"space_{page['spaceKey']}"
-            relationships.append({
+            yield {
                 'source': page['pageId'],
                 'target': space_id,
                 'type': 'BelongsTo'
-            })
-            relationships.append({
+            }
+            yield {
                 'source': space_id,
                 'target': page['pageId'],
                 'type': 'Contains'
-            })
-        
-        return relationships
+            }
     
     def create_networkx_from_actual_data(self):
         """Create NetworkX graph from actual data"""
@@ -183,40 +409,38 @@ class ActualDataDirectorPresentation:
         self.nx_graph = nx.DiGraph()
         
         # Add page nodes
-        for page in self.actual_pages:
-            self.nx_graph.add_node(
-                page['pageId'],
-                label='Page',
-                title=page['title'],
-                space_key=page['spaceKey'],
-                space_name=page['spaceName'],
-                content_length=page['text_length'],
-                tables_count=page['tables_count'],
-                links_count=page['links_count'],
-                sections_count=page['sections_count']
-            )
+        self.nx_graph.add_nodes_from(
+            (page['pageId'], {
+                'label': 'Page',
+                'title': page['title'],
+                'space_key': page['spaceKey'],
+                'space_name': page['spaceName'],
+                'content_length': page['text_length'],
+                'tables_count': page['tables_count'],
+                'links_count': page['links_count'],
+                'sections_count': page['sections_count']
+            })
+            for page in self.actual_pages
+        )
         
         # Add space nodes
         unique_spaces = set((page['spaceKey'], page['spaceName']) for page in self.actual_pages)
-        for space_key, space_name in unique_spaces:
-            space_id = f"space_{space_key}"
-            self.nx_graph.add_node(
-                space_id,
-                label='Space',
-                title=space_name,
-                space_key=space_key,
-                space_name=space_name,
-                content_length=0
-            )
+        self.nx_graph.add_nodes_from(
+            (f"space_{space_key}", {
+                'label': 'Space',
+                'title': space_name,
+                'space_key': space_key,
+                'space_name': space_name,
+                'content_length': 0
+            })
+            for space_key, space_name in unique_spaces
+        )
         
-        # Add relationships
-        relationships = self.create_relationships_from_actual_data()
-        for rel in relationships:
-            self.nx_graph.add_edge(
-                rel['source'],
-                rel['target'],
-                relation_type=rel['type']
-            )
+        # Add relationships (streamed; the full list is never materialized)
+        self.nx_graph.add_edges_from(
+            (rel['source'], rel['target'], {'relation_type': rel['type']})
+            for rel in self.create_relationships_from_actual_data()
+        )
         
         print(f"✅ NetworkX graph created from actual data:")
         print(f"   📊 Nodes: {self.nx_graph.number_of_nodes()}")
@@ -235,43 +459,36 @@ class ActualDataDirectorPresentation:
         
         G = self.nx_graph
         
+        df = self.pages_df
+        
         # Basic statistics
-        total_content = sum(page['text_length'] for page in self.actual_pages)
-        total_tables = sum(page['tables_count'] for page in self.actual_pages)
-        total_links = sum(page['links_count'] for page in self.actual_pages)
-        total_sections = sum(page['sections_count'] for page in self.actual_pages)
+        totals = {column: int(total) for column, total in
+                  df[['text_length', 'tables_count', 'links_count', 'sections_count']].sum().items()}
         
-        # Space distribution
-        spaces = {}
-        for page in self.actual_pages:
-            space = page['spaceName']
-            spaces[space] = spaces.get(space, 0) + 1
+        # Space distribution (in order of first appearance)
+        spaces = {space: int(count) for space, count in df.groupby('spaceName', sort=False).size().items()}
         
         # Content analysis
-        content_lengths = [page['text_length'] for page in self.actual_pages]
+        content_lengths = df['text_length']
         
         # Edge types
-        edge_types = {}
-        for _, _, data in G.edges(data=True):
-            edge_type = data.get('relation_type', 'Unknown')
-            edge_types[edge_type] = edge_types.get(edge_type, 0) + 1
+        edge_types = Counter(edge_type for _, _, edge_type in G.edges(data='relation_type', default='Unknown'))
         
         # Centrality analysis
         centrality = {}
+        avg_degree = 0
+        cached_metrics = self._centrality(G) if G.number_of_nodes() > 0 else {'clustering': 0}
         if G.number_of_nodes() > 0:
-            degree_centrality = nx.degree_centrality(G)
-            betweenness_centrality = nx.betweenness_centrality(G)
+            degree_centrality = cached_metrics['degree']
+            betweenness_centrality = cached_metrics['betweenness']
             
-            # Get top pages only (not spaces)
-            page_ids = {page['pageId'] for page in self.actual_pages}
+            # degree_centrality is degree / (V - 1), so the mean degree needs no second pass over G
+            degree_values = np.fromiter(degree_centrality.values(), dtype=np.float64, count=len(degree_centrality))
+            avg_degree = float(degree_values.mean()) * (G.number_of_nodes() - 1)
             
-            top_degree = [(node, G.nodes[node].get('title', node), score) 
-                         for node, score in sorted(degree_centrality.items(), key=lambda x: x[1], reverse=True)
-                         if node in page_ids][:10]
-            
-            top_betweenness = [(node, G.nodes[node].get('title', node), score)
-                              for node, score in sorted(betweenness_centrality.items(), key=lambda x: x[1], reverse=True) 
-                              if node in page_ids][:10]
+            # Get top pages only (not spaces)
+            top_degree = self._top_pages(G, degree_centrality)
+            top_betweenness = self._top_pages(G, betweenness_centrality)
             
             centrality = {
                 'top_degree': top_degree,
@@ -284,43 +501,84 @@ class ActualDataDirectorPresentation:
                 'total_edges': G.number_of_edges(),
                 'total_pages': len(self.actual_pages),
                 'graph_density': nx.density(G),
-                'avg_degree': sum(dict(G.degree()).values()) / G.number_of_nodes() if G.number_of_nodes() > 0 else 0,
+                'avg_degree': avg_degree,
                 'is_connected': nx.is_weakly_connected(G),
                 'num_components': nx.number_weakly_connected_components(G)
             },
             'content': {
-                'total_content': total_content,
-                'avg_content': np.mean(content_lengths),
-                'median_content': np.median(content_lengths),
-                'max_content': max(content_lengths),
-                'min_content': min(content_lengths),
-                'total_tables': total_tables,
-                'total_links': total_links,
-                'total_sections': total_sections
+                'total_content': totals['text_length'],
+                'avg_content': float(content_lengths.mean()),
+                'median_content': float(content_lengths.median()),
+                'max_content': int(content_lengths.max()),
+                'min_content': int(content_lengths.min()),
+                'total_tables': totals['tables_count'],
+                'total_links': totals['links_count'],
+                'total_sections': totals['sections_count']
             },
             'spaces': spaces,
             'edge_types': edge_types,
             'centrality': centrality,
             'network': {
-                'clustering': nx.average_clustering(G.to_undirected()) if G.number_of_nodes() > 1 else 0
+                'clustering': cached_metrics['clustering']
+            },
+            'derived': {
+                'cross_ref_edge_types': sum(1 for edge_type in edge_types if 'Links' in edge_type)
             }
         }
         
         print("✅ Actual data statistics calculated")
         return self.statistics
     
-    def create_actual_network_visualization(self):
-        """Create network visualization from actual 23 pages"""
+    def _top_pages(self, G, scores: Dict[str, float], k: int = 10) -> List[tuple]:
+        """Top-k page nodes by score as (node, title, score), same order as a stable descending sort
+        
+        np.partition finds the k-th largest score in O(V); only the k winners are sorted
+        and turned into tuples. Ties at the cut-off keep their original order.
+        """
+        nodes = [node for node in scores if node in self._page_ids]
+        if not nodes:
+            return []
+        values = np.fromiter((scores[node] for node in nodes), dtype=np.float64, count=len(nodes))
+        
+        if len(nodes) > k:
+            kth = np.partition(values, -k)[-k]
+            above = np.flatnonzero(values > kth)
+            ties = np.flatnonzero(values == kth)[:k - len(above)]
+            idx = np.sort(np.concatenate([above, ties]))
+        else:
+            idx = np.arange(len(nodes))
+        idx = idx[np.argsort(-values[idx], kind='stable')]
+        
+        return [(nodes[i], G.nodes[nodes[i]].get('title', nodes[i]), float(values[i])) for i in idx]
+    
+    def _write_html(self, fig, filename, full_html: bool = True):
+        """Render a Plotly figure to a string and write it through one large buffered handle"""
+        if orjson is not None:
+            import plotly.io as pio
+            pio.json.config.default_engine = 'orjson'
+        html = fig.to_html(include_plotlyjs='cdn', full_html=full_html, validate=False)
+        with open(filename, 'w', buffering=self.WRITE_BUFFER, encoding='utf-8') as f:
+            f.write(html)
+    
+    def create_actual_network_visualization(self, backend: str = 'webgl', dpi: int = 150):
+        """Create network visualization from actual 23 pages
+        
+        backend='webgl' writes an interactive Plotly Scattergl page rendered on the GPU;
+        backend='mpl' writes a static matplotlib PNG for offline export at the given dpi
+        (150 suits slides; pass 300 for print).
+        """
         print("🎨 Creating network visualization from actual 23 pages...")
         
         G = self.nx_graph
         
-        # Create large figure
-        plt.figure(figsize=(24, 18), dpi=300)
-        
-        # Separate page nodes from space nodes for better layout
-        page_nodes = [node for node in G.nodes() if G.nodes[node].get('label') == 'Page']
-        space_nodes = [node for node in G.nodes() if G.nodes[node].get('label') == 'Space']
+        # Separate page nodes from space nodes for better layout (one pass over the nodes)
+        page_nodes = []
+        space_nodes = []
+        for node, label in G.nodes(data='label'):
+            if label == 'Page':
+                page_nodes.append(node)
+            elif label == 'Space':
+                space_nodes.append(node)
         
         print(f"🔍 Visualizing: {len(page_nodes)} page nodes + {len(space_nodes)} space nodes = {G.number_of_nodes()} total")
         
@@ -328,30 +586,192 @@ class ActualDataDirectorPresentation:
             print(f"⚠️  Warning: Expected 23 page nodes, found {len(page_nodes)}")
             print(f"📄 Page nodes: {[G.nodes[node].get('title', node) for node in page_nodes]}")
         
-        # Calculate positions with better spacing for all nodes
-        pos = nx.spring_layout(G, k=4, iterations=200, seed=42, weight=None)
+        # Calculate positions with better spacing for all nodes (cached per graph)
+        pos = self._spring_layout(G)
         
-        # Color by space with distinct colors
-        space_colors = {
-            'Observability': '#1f77b4',          # Blue
-            'Software Development': '#ff7f0e',   # Orange
-            'Himanshu Chaturvedi': '#2ca02c',    # Green  
-            'h.chaturvedi14': '#d62728'          # Red
-        }
+        # Page counts per space for the title, legend and stats box
+        space_counts = Counter(G.nodes[node].get('space_name', 'Unknown') for node in page_nodes)
         
-        # Draw page nodes
-        page_colors = []
-        page_sizes = []
+        if backend == 'mpl':
+            filename = self._save_network_png(G, pos, page_nodes, space_nodes, space_counts, dpi)
+        else:
+            filename = self._save_network_webgl(G, pos, page_nodes, space_nodes, space_counts)
+        
+        print(f"✅ Actual network visualization with ALL {len(page_nodes)} pages saved: {filename}")
+        return str(filename)
+    
+    def _network_title(self, page_nodes: List[str], space_counts: Dict[str, int]) -> List[str]:
+        """Title lines shared by both network renderers"""
+        personal_count = sum(count for space, count in space_counts.items() if 'Chaturvedi' in space)
+        return [
+            f'Actual Confluence Knowledge Graph - All {len(page_nodes)} Pages',
+            f'Real Data: Observability ({space_counts.get("Observability", 0)} pages) | '
+            f'Software Dev ({space_counts.get("Software Development", 0)} pages) | '
+            f'Personal ({personal_count} pages)',
+            f'Content: {self.statistics["content"]["total_content"]:,} chars | '
+            f'Tables: {self.statistics["content"]["total_tables"]} | '
+            f'Links: {self.statistics["content"]["total_links"]} | '
+            f'Relationships: {self.statistics["basic"]["total_edges"]}'
+        ]
+    
+    def _network_stats_text(self, G, page_nodes: List[str], space_counts: Dict[str, int]) -> str:
+        """Statistics box text shared by both network renderers"""
+        personal_count = space_counts.get('Himanshu Chaturvedi', 0) + space_counts.get('h.chaturvedi14', 0)
+        stats_text = f"""ACTUAL DATA VERIFICATION
+        
+PAGE COUNT VERIFICATION:
+• Total Pages: {len(page_nodes)} ✓
+• Expected: 23 pages
+• Observability: {space_counts.get('Observability', 0)} pages
+• Software Dev: {space_counts.get('Software Development', 0)} pages  
+• Personal: {personal_count} pages
+
+CONTENT METRICS:
+• Total Characters: {self.statistics['content']['total_content']:,}
+• Average Page: {self.statistics['content']['avg_content']:.0f} chars
+• Tables: {self.statistics['content']['total_tables']}
+• Links: {self.statistics['content']['total_links']}
+• Sections: {self.statistics['content']['total_sections']}
+
+NETWORK ANALYSIS:
+• Total Nodes: {G.number_of_nodes()}
+• Total Edges: {G.number_of_edges()}
+• Density: {self.statistics['basic']['graph_density']:.3f}
+• Components: {self.statistics['basic']['num_components']}
+
+TOP KNOWLEDGE HUBS:"""
+        
+        lines = [stats_text]
+        for i, (node, title, score) in enumerate(self.statistics['centrality']['top_degree'][:5], 1):
+            title_short = title[:20] + "..." if len(title) > 20 else title
+            lines.append(f"{i}. {title_short} ({score:.3f})")
         
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _page_node_sizes(G, nodes: List[str]) -> np.ndarray:
+        """Marker areas scaled by content length, clamped to 800-2000"""
+        content_lengths = np.fromiter((G.nodes[n].get('content_length', 0) for n in nodes),
+                                      dtype=np.float64, count=len(nodes))
+        return np.clip(content_lengths * 0.4 + 400, 800, 2000)
+    
+    def _save_network_webgl(self, G, pos, page_nodes: List[str], space_nodes: List[str],
+                            space_counts: Dict[str, int]) -> Path:
+        """Render the network as WebGL (Scattergl) traces in a standalone HTML page"""
+        import plotly.graph_objects as go
+        
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        coords = np.array([pos[node] for node in nodes], dtype=float)
+        
+        fig = go.Figure()
+        
+        # One trace per edge type: segments separated by NaN gaps draw in a single GL call
+        for edge_type, color in self.EDGE_COLORS.items():
+            edges_of_type = [(index[u], index[v]) for u, v, d in G.edges(data=True)
+                             if d.get('relation_type') == edge_type]
+            if not edges_of_type:
+                continue
+            src, dst = np.array(edges_of_type).T
+            xs = np.full(3 * len(src), np.nan)
+            ys = np.full(3 * len(src), np.nan)
+            xs[0::3], xs[1::3] = coords[src, 0], coords[dst, 0]
+            ys[0::3], ys[1::3] = coords[src, 1], coords[dst, 1]
+            fig.add_trace(go.Scattergl(
+                x=xs, y=ys,
+                mode='lines',
+                line=dict(color=color, width=1.5),
+                opacity=0.3 if edge_type in ['BelongsTo', 'Contains'] else 0.7,
+                hoverinfo='skip',
+                name=edge_type
+            ))
+        
+        # Page nodes, one trace per space so the legend shows per-space counts
+        pages_by_space = defaultdict(list)
         for node in page_nodes:
-            data = G.nodes[node]
-            space_name = data.get('space_name', 'Unknown')
-            page_colors.append(space_colors.get(space_name, '#95A5A6'))
-            
-            # Size by content length
-            content_length = data.get('content_length', 0)
-            size = max(800, min(2000, content_length * 0.4 + 400))
-            page_sizes.append(size)
+            pages_by_space[G.nodes[node].get('space_name')].append(node)
+        
+        for space_name, color in self.SPACE_COLORS.items():
+            space_pages = pages_by_space.get(space_name)
+            if not space_pages:
+                continue
+            page_idx = [index[n] for n in space_pages]
+            titles = [G.nodes[n].get('title', str(n)) for n in space_pages]
+            # Same content-length scaling as the PNG, converted from area to diameter
+            sizes = np.sqrt(self._page_node_sizes(G, space_pages))
+            fig.add_trace(go.Scattergl(
+                x=coords[page_idx, 0], y=coords[page_idx, 1],
+                mode='markers+text',
+                marker=dict(size=sizes, color=color, opacity=0.8, line=dict(width=2, color='black')),
+                text=[t[:16] + "..." if len(t) > 18 else t for t in titles],
+                textposition='top center',
+                hovertext=titles,
+                hoverinfo='text',
+                name=f'{space_name} ({len(space_pages)} pages)'
+            ))
+        
+        if space_nodes:
+            space_idx = [index[n] for n in space_nodes]
+            fig.add_trace(go.Scattergl(
+                x=coords[space_idx, 0], y=coords[space_idx, 1],
+                mode='markers+text',
+                marker=dict(size=55, color='#9467bd', symbol='square', opacity=0.7,
+                            line=dict(width=2, color='black')),
+                text=[f"[{G.nodes[n].get('title', str(n))}]" for n in space_nodes],
+                textposition='middle center',
+                hoverinfo='text',
+                name=f'Space Nodes ({len(space_nodes)})'
+            ))
+        
+        fig.add_annotation(
+            text=self._network_stats_text(G, page_nodes, space_counts).replace('\n', '<br>'),
+            xref='paper', yref='paper', x=0.01, y=0.5,
+            xanchor='left', yanchor='middle', align='left', showarrow=False,
+            bgcolor='lightyellow', opacity=0.9, font=dict(size=11)
+        )
+        
+        fig.update_layout(
+            title={'text': '<br>'.join(self._network_title(page_nodes, space_counts)), 'x': 0.5},
+            xaxis=dict(visible=False),
+            yaxis=dict(visible=False),
+            height=1000,
+            template='plotly_white',
+            legend=dict(x=0.01, y=0.99)
+        )
+        
+        # Save with timestamp to ensure new version
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = self.output_dir / f'actual_network_visualization_{timestamp}.html'
+        self._write_html(fig, filename)
+        return filename
+    
+    def _network_figure(self, dpi: int):
+        """Return the shared 24x18in figure, cleared and made current for pyplot calls"""
+        plt = _pyplot()
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig = plt.figure(figsize=(24, 18), dpi=dpi)
+        else:
+            self._fig.clear()
+            self._fig.set_dpi(dpi)
+            plt.figure(self._fig.number)
+        return self._fig
+    
+    def _save_network_png(self, G, pos, page_nodes: List[str], space_nodes: List[str],
+                          space_counts: Dict[str, int], dpi: int = 150) -> Path:
+        """Render the network as a static matplotlib PNG"""
+        plt = _pyplot()
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba
+        import seaborn as sns
+        sns.set_palette("husl")
+        
+        # Large figure, reused between renders
+        fig = self._network_figure(dpi)
+        
+        # Color by space, size by content length
+        page_colors = [self.SPACE_COLORS.get(G.nodes[node].get('space_name', 'Unknown'), '#95A5A6')
+                       for node in page_nodes]
+        page_sizes = self._page_node_sizes(G, page_nodes).tolist()
         
         # Draw page nodes
         nx.draw_networkx_nodes(G, pos, nodelist=page_nodes,
@@ -371,23 +791,19 @@ class ActualDataDirectorPresentation:
                                  linewidths=3,
                                  edgecolors='black')
         
-        # Draw edges by type with different colors
-        edge_colors = {
-            'ParentOf': '#2c3e50',
-            'ChildOf': '#34495e', 
-            'LinksTo': '#e74c3c',
-            'LinkedFrom': '#c0392b',
-            'BelongsTo': '#3498db',
-            'Contains': '#2980b9'
-        }
-        
-        for edge_type, color in edge_colors.items():
-            edges_of_type = [(u, v) for u, v, d in G.edges(data=True) if d.get('relation_type') == edge_type]
-            if edges_of_type:
-                alpha = 0.3 if edge_type in ['BelongsTo', 'Contains'] else 0.7
-                nx.draw_networkx_edges(G, pos, edgelist=edges_of_type,
-                                     edge_color=color, alpha=alpha,
-                                     arrows=True, arrowsize=20)
+        # Draw all edges as one collection, colored by type, beneath the nodes.
+        # Every relationship is stored in both directions, so arrowheads are omitted.
+        edge_rgba = {edge_type: to_rgba(color, 0.3 if edge_type in ['BelongsTo', 'Contains'] else 0.7)
+                     for edge_type, color in self.EDGE_COLORS.items()}
+        segments = []
+        segment_colors = []
+        for u, v, edge_type in G.edges(data='relation_type'):
+            if edge_type in edge_rgba:
+                segments.append((pos[u], pos[v]))
+                segment_colors.append(edge_rgba[edge_type])
+        if segments:
+            plt.gca().add_collection(LineCollection(np.asarray(segments), colors=segment_colors,
+                                                    linewidths=1, zorder=0))
         
         # Labels for ALL 23 page nodes
         page_labels = {}
@@ -414,68 +830,26 @@ class ActualDataDirectorPresentation:
                                   font_weight='bold', font_color='yellow')
         
         # Comprehensive title showing actual counts
-        plt.title(f'Actual Confluence Knowledge Graph - All {len(page_nodes)} Pages\n' +
-                 f'Real Data: Observability ({len([n for n in page_nodes if G.nodes[n].get("space_name") == "Observability"])} pages) | ' +
-                 f'Software Dev ({len([n for n in page_nodes if G.nodes[n].get("space_name") == "Software Development"])} pages) | ' +
-                 f'Personal ({len([n for n in page_nodes if "Chaturvedi" in G.nodes[n].get("space_name", "")])} pages)\n' +
-                 f'Content: {self.statistics["content"]["total_content"]:,} chars | ' +
-                 f'Tables: {self.statistics["content"]["total_tables"]} | ' +
-                 f'Links: {self.statistics["content"]["total_links"]} | ' +
-                 f'Relationships: {self.statistics["basic"]["total_edges"]}',
+        plt.title('\n'.join(self._network_title(page_nodes, space_counts)),
                  fontsize=18, fontweight='bold', pad=30)
         
         # Enhanced legend with actual counts
-        obs_count = len([n for n in page_nodes if G.nodes[n].get('space_name') == 'Observability'])
-        sd_count = len([n for n in page_nodes if G.nodes[n].get('space_name') == 'Software Development'])
-        hc_count = len([n for n in page_nodes if G.nodes[n].get('space_name') == 'Himanshu Chaturvedi'])
-        h14_count = len([n for n in page_nodes if G.nodes[n].get('space_name') == 'h.chaturvedi14'])
-        
         legend_elements = [
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#1f77b4', 
-                      markersize=15, label=f'Observability ({obs_count} pages)'),
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#ff7f0e', 
-                      markersize=15, label=f'Software Development ({sd_count} pages)'),
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#2ca02c', 
-                      markersize=15, label=f'Himanshu Chaturvedi ({hc_count} pages)'),
-            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='#d62728', 
-                      markersize=15, label=f'h.chaturvedi14 ({h14_count} page)'),
-            plt.Line2D([0], [0], marker='s', color='w', markerfacecolor='#9467bd', 
-                      markersize=15, label=f'Space Nodes ({len(space_nodes)})'),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor=color, 
+                      markersize=15, label=f'{space_name} ({space_counts.get(space_name, 0)} pages)')
+            for space_name, color in self.SPACE_COLORS.items()
         ]
+        legend_elements.append(
+            plt.Line2D([0], [0], marker='s', color='w', markerfacecolor='#9467bd', 
+                      markersize=15, label=f'Space Nodes ({len(space_nodes)})')
+        )
         
         plt.legend(handles=legend_elements, loc='upper left', fontsize=12,
                   bbox_to_anchor=(0.02, 0.98))
         
         # Enhanced statistics box with verification
-        stats_text = f"""ACTUAL DATA VERIFICATION
-        
-PAGE COUNT VERIFICATION:
-• Total Pages: {len(page_nodes)} ✓
-• Expected: 23 pages
-• Observability: {obs_count} pages
-• Software Dev: {sd_count} pages  
-• Personal: {hc_count + h14_count} pages
-
-CONTENT METRICS:
-• Total Characters: {self.statistics['content']['total_content']:,}
-• Average Page: {self.statistics['content']['avg_content']:.0f} chars
-• Tables: {self.statistics['content']['total_tables']}
-• Links: {self.statistics['content']['total_links']}
-• Sections: {self.statistics['content']['total_sections']}
-
-NETWORK ANALYSIS:
-• Total Nodes: {G.number_of_nodes()}
-• Total Edges: {G.number_of_edges()}
-• Density: {self.statistics['basic']['graph_density']:.3f}
-• Components: {self.statistics['basic']['num_components']}
-
-TOP KNOWLEDGE HUBS:"""
-        
-        for i, (node, title, score) in enumerate(self.statistics['centrality']['top_degree'][:5], 1):
-            title_short = title[:20] + "..." if len(title) > 20 else title
-            stats_text += f"\n{i}. {title_short} ({score:.3f})"
-        
-        plt.text(0.02, 0.5, stats_text, transform=plt.gca().transAxes,
+        plt.text(0.02, 0.5, self._network_stats_text(G, page_nodes, space_counts),
+                transform=plt.gca().transAxes,
                 fontsize=11, verticalalignment='top',
                 bbox=dict(boxstyle='round,pad=1', facecolor='lightyellow', alpha=0.9))
         
@@ -485,15 +859,15 @@ TOP KNOWLEDGE HUBS:"""
         # Save with timestamp to ensure new version
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = self.output_dir / f'actual_network_visualization_{timestamp}.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        
-        print(f"✅ Actual network visualization with ALL {len(page_nodes)} pages saved: {filename}")
-        return str(filename)
+        fig.savefig(filename, dpi=dpi, bbox_inches='tight',
+                    facecolor='white', edgecolor='none')
+        return filename
     
     def create_actual_dashboard(self):
         """Create interactive dashboard from actual data"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         print("📊 Creating interactive dashboard from actual 23 pages...")
         
         stats = self.statistics
@@ -531,9 +905,8 @@ TOP KNOWLEDGE HUBS:"""
         ), row=1, col=2)
         
         # 3. Content distribution
-        content_lengths = [page['text_length'] for page in self.actual_pages]
         fig.add_trace(go.Histogram(
-            x=content_lengths,
+            x=self.pages_df['text_length'],
             nbinsx=8,
             name="Content Length",
             marker_color='skyblue'
@@ -564,16 +937,12 @@ TOP KNOWLEDGE HUBS:"""
             ), row=3, col=1)
         
         # 6. Space performance
-        space_stats = []
-        for space, count in stats['spaces'].items():
-            space_pages = [p for p in self.actual_pages if p['spaceName'] == space]
-            avg_content = np.mean([p['text_length'] for p in space_pages])
-            space_stats.append({'space': space, 'avg_content': avg_content})
+        space_stats = self.pages_df.groupby('spaceName', sort=False)['text_length'].agg(['mean', 'count'])
         
-        if space_stats:
+        if not space_stats.empty:
             fig.add_trace(go.Pie(
-                labels=[s['space'] for s in space_stats],
-                values=[s['avg_content'] for s in space_stats],
+                labels=space_stats.index.tolist(),
+                values=space_stats['mean'].tolist(),
                 name="Avg Content"
             ), row=3, col=2)
         
@@ -593,7 +962,7 @@ TOP KNOWLEDGE HUBS:"""
         
         # Save
         filename = self.output_dir / 'actual_interactive_dashboard.html'
-        fig.write_html(filename)
+        self._write_html(fig, filename)
         
         print(f"✅ Actual dashboard saved: {filename}")
         return str(filename)
@@ -604,143 +973,57 @@ TOP KNOWLEDGE HUBS:"""
         
         stats = self.statistics
         
-        report = f"""
-ACTUAL CONFLUENCE KNOWLEDGE GRAPH - EXECUTIVE ANALYSIS
-=====================================================
-
-DATE: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-DATA SOURCE: Real Processed Data (23 Pages)
-STATUS: Production Analysis from Actual System
-
-🎯 EXECUTIVE OVERVIEW
---------------------
-This analysis represents the current state of your Confluence Knowledge Graph,
-based on the actual 23 pages that have been successfully ingested and processed.
-
-REAL KNOWLEDGE ASSETS: {stats['basic']['total_pages']} pages
-ACTUAL RELATIONSHIPS: {stats['basic']['total_edges']} connections  
-KNOWLEDGE DOMAINS: {len(stats['spaces'])} spaces
-REAL CONTENT VOLUME: {stats['content']['total_content']:,} characters
-
-📊 ACTUAL DATA INSIGHTS
------------------------
-CONNECTIVITY ANALYSIS:
-• Graph Density: {stats['basic']['graph_density']:.3f}
-• Network Components: {stats['basic']['num_components']}
-• Average Connections: {stats['basic']['avg_degree']:.1f} per page
-• Connectivity Status: {'EXCELLENT' if stats['basic']['is_connected'] else 'GOOD'}
-
-CONTENT QUALITY METRICS:
-• Average Page Size: {stats['content']['avg_content']:.0f} characters
-• Content Quality Level: {'HIGH' if stats['content']['avg_content'] > 2000 else 'MEDIUM' if stats['content']['avg_content'] > 1000 else 'BASIC'}
-• Richest Content Page: {stats['content']['max_content']:,} characters
-• Structured Elements: {stats['content']['total_tables']} tables, {stats['content']['total_sections']} sections
-
-🌐 REAL SPACE DISTRIBUTION
---------------------------"""
-        
+        avg_content = stats['content']['avg_content']
+        graph_density = stats['basic']['graph_density']
         total_pages = stats['basic']['total_pages']
-        for space, count in stats['spaces'].items():
-            percentage = (count / total_pages) * 100 if total_pages > 0 else 0
-            report += f"\n• {space}: {count} pages ({percentage:.1f}%)"
-        
-        report += f"""
-
-🔗 ACTUAL RELATIONSHIP ANALYSIS
--------------------------------"""
-        
         total_edges = stats['basic']['total_edges']
-        for edge_type, count in stats['edge_types'].items():
-            percentage = (count / total_edges) * 100 if total_edges > 0 else 0
-            report += f"\n• {edge_type}: {count} relationships ({percentage:.1f}%)"
-        
-        report += f"""
-
-⭐ TOP KNOWLEDGE HUBS (REAL DATA)
----------------------------------"""
-        
-        for i, (node_id, title, score) in enumerate(stats['centrality']['top_degree'][:10], 1):
-            report += f"\n{i}. {title} (connectivity: {score:.3f})"
-        
-        report += f"""
-
-💡 STRATEGIC RECOMMENDATIONS (BASED ON ACTUAL SYSTEM)
-----------------------------------------------------
-IMMEDIATE OPPORTUNITIES:
-• Expand most successful spaces (Observability shows strong adoption)
-• Bridge knowledge gaps between Software Development and Observability
-• Enhance cross-space collaboration through linking
-
-SYSTEM OPTIMIZATION:
-• Content Quality: {'Excellent foundation' if stats['content']['avg_content'] > 2000 else 'Room for enhancement'}
-• Network Health: {'Strong connectivity' if stats['basic']['graph_density'] > 0.1 else 'Opportunity to improve linking'}
-• Knowledge Distribution: {'Well-balanced' if len(stats['spaces']) >= 3 else 'Concentrate on core areas'}
-
-GROWTH STRATEGY:
-• Target areas with high engagement (Observability space shows 16 pages)
-• Develop cross-functional documentation patterns
-• Implement knowledge sharing workflows
-
-💰 ACTUAL BUSINESS VALUE
------------------------
-Current Investment Analysis:
-• Knowledge Assets: {stats['basic']['total_pages']} pages × $500 creation = ${stats['basic']['total_pages'] * 500:,}
-• Relationship Network: {stats['basic']['total_edges']} connections × $100 = ${stats['basic']['total_edges'] * 100:,}
-• Total Knowledge Value: ${(stats['basic']['total_pages'] * 500) + (stats['basic']['total_edges'] * 100):,}
-
-Productivity Impact (Based on Actual Usage):
-• Search Efficiency: 60% improvement with graph navigation
-• Knowledge Discovery: {stats['basic']['total_edges']} relationships enable insights
-• Team Collaboration: {len(stats['spaces'])} spaces provide comprehensive coverage
-• Content Reuse: {stats['content']['total_links']} internal links promote sharing
-
-📈 REAL SYSTEM METRICS
-----------------------
-• Average Page Quality: {stats['content']['avg_content']:.0f} characters (Industry benchmark: 1,500+)
-• Content Depth: {stats['content']['total_tables']} structured tables for complex information
-• Navigation Links: {stats['content']['total_links']} internal connections
-• Content Organization: {stats['content']['total_sections']} structured sections
-
-🎯 ACTUAL SUCCESS INDICATORS
----------------------------
-✅ System Operational: 23 pages successfully processed and stored
-✅ Content Quality: {stats['content']['avg_content']:.0f} avg chars indicates {'excellent' if stats['content']['avg_content'] > 2500 else 'good'} depth
-✅ Network Formation: {stats['basic']['graph_density']:.3f} density shows {'strong' if stats['basic']['graph_density'] > 0.05 else 'emerging'} connectivity
-✅ Multi-domain Coverage: {len(stats['spaces'])} spaces across organization
-
-🚀 NEXT STEPS (BASED ON ACTUAL DATA)
------------------------------------
-1. Scale successful patterns from Observability space (16 pages) to other areas
-2. Enhance cross-space linking (currently {len([e for e in stats['edge_types'] if 'Links' in e])} cross-references)
-3. Implement automated content quality monitoring
-4. Deploy advanced search and discovery features
-
-📊 RETURN ON INVESTMENT
-----------------------
-Conservative Annual Benefits:
-• Time Savings: 50 users × 1 hr/week × $65/hr × 50 weeks = $162,500
-• Knowledge Reuse: 25% efficiency gain = $40,625
-• Decision Speed: 15% improvement = $75,000
-• Training Efficiency: 20% reduction = $25,000
-
-TOTAL ANNUAL BENEFIT: $303,125
-IMPLEMENTATION COST: $35,000
-ROI: 766% return on investment
-
----
-ANALYSIS COMPLETED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-DATA SOURCE: Actual Production System (23 Real Pages)
-CONFIDENCE LEVEL: HIGH (Live System Data)
-
-This report reflects the true state of your knowledge graph system
-based on actual processed Confluence pages and provides realistic 
-insights for strategic decision-making.
-"""
+        num_spaces = len(stats['spaces'])
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Every derived value is computed once; the template only formats them
+        ctx = {
+            'generated_at': generated_at,
+            'total_pages': total_pages,
+            'total_edges': total_edges,
+            'num_spaces': num_spaces,
+            'total_content': stats['content']['total_content'],
+            'graph_density': graph_density,
+            'num_components': stats['basic']['num_components'],
+            'avg_degree': stats['basic']['avg_degree'],
+            'connectivity_status': 'EXCELLENT' if stats['basic']['is_connected'] else 'GOOD',
+            'avg_content': avg_content,
+            'content_level': 'HIGH' if avg_content > 2000 else 'MEDIUM' if avg_content > 1000 else 'BASIC',
+            'max_content': stats['content']['max_content'],
+            'total_tables': stats['content']['total_tables'],
+            'total_sections': stats['content']['total_sections'],
+            'total_links': stats['content']['total_links'],
+            'content_quality': 'Excellent foundation' if avg_content > 2000 else 'Room for enhancement',
+            'network_health': 'Strong connectivity' if graph_density > 0.1 else 'Opportunity to improve linking',
+            'knowledge_distribution': 'Well-balanced' if num_spaces >= 3 else 'Concentrate on core areas',
+            'asset_value': total_pages * 500,
+            'relationship_value': total_edges * 100,
+            'total_value': total_pages * 500 + total_edges * 100,
+            'content_depth': 'excellent' if avg_content > 2500 else 'good',
+            'connectivity_strength': 'strong' if graph_density > 0.05 else 'emerging',
+            'cross_ref_edge_types': stats['derived']['cross_ref_edge_types'],
+            'space_lines': "".join(
+                f"\n• {space}: {count} pages ({(count / total_pages) * 100 if total_pages > 0 else 0:.1f}%)"
+                for space, count in stats['spaces'].items()
+            ),
+            'edge_lines': "".join(
+                f"\n• {edge_type}: {count} relationships ({(count / total_edges) * 100 if total_edges > 0 else 0:.1f}%)"
+                for edge_type, count in stats['edge_types'].items()
+            ),
+            'hub_lines': "".join(
+                f"\n{i}. {title} (connectivity: {score:.3f})"
+                for i, (node_id, title, score) in enumerate(stats['centrality']['top_degree'][:10], 1)
+            )
+        }
         
         # Save report
         filename = self.output_dir / 'actual_executive_report.txt'
-        with open(filename, 'w') as f:
-            f.write(report)
+        with open(filename, 'w', buffering=self.WRITE_BUFFER, encoding='utf-8') as f:
+            f.write(_REPORT_TMPL.format_map(ctx))
             
         print(f"✅ Actual executive report saved: {filename}")
         return str(filename)
@@ -786,6 +1069,9 @@ insights for strategic decision-making.
     
     def create_metrics_visualization(self):
         """Create visualizations for new graph metrics (hierarchy_depth, child_count, centrality)"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         print("\n📊 Creating Graph Metrics Visualizations...")
         
         # Add metrics to actual pages data
@@ -804,71 +1090,63 @@ insights for strategic decision-making.
                    [{"type": "bar"}, {"type": "scatter"}]]
         )
         
-        # 1. Hierarchy Depth Distribution
-        depth_counts = {}
-        for page in self.actual_pages:
-            depth = page.get('hierarchy_depth', 0)
-            depth_counts[depth] = depth_counts.get(depth, 0) + 1
+        # Per-page metric columns, shared by the subplots below
+        pages = self.actual_pages
+        depths = np.fromiter((p.get('hierarchy_depth', 0) for p in pages), dtype=np.int32, count=len(pages))
+        child_counts = np.fromiter((p.get('child_count', 0) for p in pages), dtype=np.int32, count=len(pages))
+        centralities = np.fromiter((p.get('graph_centrality_score', 0) for p in pages), dtype=float, count=len(pages))
+        space_keys = np.array([p['spaceKey'] for p in pages])
+        titles = np.array([p['title'] for p in pages], dtype=np.str_)
+        
+        # 1. Hierarchy Depth Distribution (only depths that occur)
+        depth_counts = np.bincount(depths)
+        present_depths = np.flatnonzero(depth_counts)
         
         fig.add_trace(
             go.Bar(
-                x=list(depth_counts.keys()),
-                y=list(depth_counts.values()),
+                x=present_depths,
+                y=depth_counts[present_depths],
                 name='Pages per Depth',
                 marker_color='rgb(55, 83, 109)',
-                text=list(depth_counts.values()),
+                text=depth_counts[present_depths],
                 textposition='outside'
             ),
             row=1, col=1
         )
         
         # 2. Child Count by Page Type
-        space_child_counts = {}
-        for page in self.actual_pages:
-            space = page['space_key']
-            child_count = page.get('child_count', 0)
-            if space not in space_child_counts:
-                space_child_counts[space] = []
-            space_child_counts[space].append(child_count)
-        
-        for space, counts in space_child_counts.items():
-            fig.add_trace(
-                go.Box(
-                    y=counts,
-                    name=space,
-                    boxpoints='all',
-                    jitter=0.3,
-                    pointpos=-1.8
-                ),
-                row=1, col=2
-            )
+        # One Box trace grouped by x: Plotly buckets the per-page space keys itself
+        fig.add_trace(
+            go.Box(
+                x=space_keys,
+                y=child_counts,
+                name='Child Count',
+                boxpoints='all',
+                jitter=0.3,
+                pointpos=-1.8
+            ),
+            row=1, col=2
+        )
         
-        # 3. Top 10 Pages by Centrality Score
-        sorted_pages = sorted(
-            self.actual_pages, 
-            key=lambda x: x.get('graph_centrality_score', 0), 
-            reverse=True
-        )[:10]
+        # 3. Top 10 Pages by Centrality Score (stable, like sorted(..., reverse=True))
+        top = np.argsort(-centralities, kind='stable')[:10]
+        top_titles = titles[top]
         
         fig.add_trace(
             go.Bar(
-                x=[p.get('graph_centrality_score', 0) for p in sorted_pages],
-                y=[p['title'][:30] + '...' if len(p['title']) > 30 else p['title'] 
-                   for p in sorted_pages],
+                x=centralities[top],
+                y=np.where(np.char.str_len(top_titles) > 30,
+                           np.char.add(top_titles.astype('<U30'), '...'), top_titles),
                 orientation='h',
                 name='Centrality Score',
                 marker_color='rgb(26, 118, 255)',
-                text=[f"{p.get('graph_centrality_score', 0):.4f}" for p in sorted_pages],
+                text=np.char.mod('%.4f', centralities[top]),
                 textposition='outside'
             ),
             row=2, col=1
         )
         
         # 4. Metrics Correlation
-        depths = [p.get('hierarchy_depth', 0) for p in self.actual_pages]
-        child_counts = [p.get('child_count', 0) for p in self.actual_pages]
-        centralities = [p.get('graph_centrality_score', 0) for p in self.actual_pages]
-        
         fig.add_trace(
             go.Scatter(
                 x=depths,
@@ -876,44 +1154,48 @@ insights for strategic decision-making.
                 mode='markers',
                 name='Depth vs Centrality',
                 marker=dict(
-                    size=[c*10 + 5 for c in child_counts],
+                    size=child_counts * 10 + 5,
                     color=child_counts,
                     colorscale='Viridis',
                     showscale=True,
                     colorbar=dict(title="Child Count")
                 ),
-                text=[p['title'][:20] + '...' for p in self.actual_pages],
+                text=np.char.add(titles.astype('<U20'), '...'),
                 hovertemplate='%{text}<br>Depth: %{x}<br>Centrality: %{y:.4f}<extra></extra>'
             ),
             row=2, col=2
         )
         
-        # Update layout
-        fig.update_layout(
-            title='Graph Metrics Analysis - Enhanced with ML Metrics',
-            height=800,
-            showlegend=False
-        )
-        
-        fig.update_xaxes(title_text="Hierarchy Depth", row=1, col=1)
-        fig.update_yaxes(title_text="Number of Pages", row=1, col=1)
-        
-        fig.update_yaxes(title_text="Child Count", row=1, col=2)
-        
-        fig.update_xaxes(title_text="Centrality Score", row=2, col=1)
-        
-        fig.update_xaxes(title_text="Hierarchy Depth", row=2, col=2)
-        fig.update_yaxes(title_text="Centrality Score", row=2, col=2)
+        # Update layout (batched so the layout is updated once, not per call)
+        with fig.batch_update():
+            fig.update_layout(
+                title='Graph Metrics Analysis - Enhanced with ML Metrics',
+                height=800,
+                showlegend=False
+            )
+            
+            fig.update_xaxes(title_text="Hierarchy Depth", row=1, col=1)
+            fig.update_yaxes(title_text="Number of Pages", row=1, col=1)
+            
+            fig.update_yaxes(title_text="Child Count", row=1, col=2)
+            
+            fig.update_xaxes(title_text="Centrality Score", row=2, col=1)
+            
+            fig.update_xaxes(title_text="Hierarchy Depth", row=2, col=2)
+            fig.update_yaxes(title_text="Centrality Score", row=2, col=2)
         
         # Save
         output_file = self.output_dir / "graph_metrics_analysis.html"
-        fig.write_html(str(output_file))
+        self._write_html(fig, output_file)
         print(f"   ✅ Graph metrics visualization saved: {output_file}")
         
         return str(output_file)
     
     def create_search_enhancement_visualization(self):
         """Visualize how metrics enhance search capabilities"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         print("\n🔍 Creating Search Enhancement Visualizations...")
         
         # Create search scenarios
@@ -985,38 +1267,43 @@ insights for strategic decision-making.
         
         # 3. Content Discovery Treemap
         # Show how content is organized by metrics
-        labels = []
-        parents = []
-        values = []
-        colors = []
+        # Spaces are the roots (pages counted in one pass, in order of first appearance)
+        space_sizes = Counter(p['spaceKey'] for p in self.actual_pages)
+        space_names = {p['spaceKey']: p['spaceName'] for p in self.actual_pages}
+        treemap_spaces = list(space_sizes)
+        treemap_pages = self.actual_pages[:15]  # Top 15 for clarity
+        n_spaces = len(treemap_spaces)
+        
+        # Nodes are keyed by space key / page id, so parents always resolve and
+        # truncated titles cannot collide
+        ids = treemap_spaces + [page['pageId'] for page in treemap_pages]
+        labels = [space_names[space] for space in treemap_spaces] + [page['title'][:20] for page in treemap_pages]
+        parents = [""] * n_spaces + [page['spaceKey'] for page in treemap_pages]
+        values = np.empty(n_spaces + len(treemap_pages), dtype=np.int64)
+        colors = np.empty(n_spaces + len(treemap_pages), dtype=np.float64)
         
         # Add spaces
-        for space in ['observability', 'softdev', 'personal']:
-            labels.append(space)
-            parents.append("")
-            space_pages = [p for p in self.actual_pages if p['space_key'] == space]
-            values.append(len(space_pages))
-            colors.append(0.5)  # Medium centrality for spaces
+        values[:n_spaces] = [space_sizes[space] for space in treemap_spaces]
+        colors[:n_spaces] = 0.5  # Medium centrality for spaces
         
         # Add pages
-        for page in self.actual_pages[:15]:  # Top 15 for clarity
-            labels.append(page['title'][:20])
-            parents.append(page['space_key'])
-            values.append(page.get('child_count', 0) + 1)
-            colors.append(page.get('graph_centrality_score', 0.001))
+        values[n_spaces:] = [page.get('child_count', 0) + 1 for page in treemap_pages]
+        colors[n_spaces:] = [page.get('graph_centrality_score', 0.001) for page in treemap_pages]
         
         fig.add_trace(
             go.Treemap(
+                ids=ids,
                 labels=labels,
                 parents=parents,
                 values=values,
                 marker=dict(
+                    colors=colors,
                     colorscale='RdYlBu',
                     cmid=0.02,
                     colorbar=dict(title="Centrality"),
                     line=dict(width=2)
                 ),
-                text=[f"Children: {v-1}" if v > 1 else "" for v in values],
+                text=np.where(values > 1, np.char.add("Children: ", (values - 1).astype(str)), ""),
                 textinfo="label+text",
                 hovertemplate='<b>%{label}</b><br>Size: %{value}<br>Centrality: %{color:.4f}<extra></extra>'
             ),
@@ -1028,19 +1315,15 @@ insights for strategic decision-making.
         n_points = 50
         query_types = ['Overview', 'How-to', 'Reference', 'Troubleshooting', 'Best Practices']
         
-        x_all, y_all, z_all, colors_all, texts_all = [], [], [], [], []
-        
-        for i, qtype in enumerate(query_types):
-            # Simulate query vectors in 3D space
-            x = np.random.normal(i * 2, 0.5, n_points // 5)
-            y = np.random.normal(i, 0.8, n_points // 5)
-            z = np.random.normal(5 - i, 0.6, n_points // 5)
-            
-            x_all.extend(x)
-            y_all.extend(y)
-            z_all.extend(z)
-            colors_all.extend([i] * (n_points // 5))
-            texts_all.extend([qtype] * (n_points // 5))
+        # Simulate query vectors in 3D space: one (query type, point) block per axis
+        n_per = n_points // len(query_types)
+        type_idx = np.arange(len(query_types))[:, None]
+        rng = np.random.default_rng(42)
+        x_all = rng.normal(type_idx * 2, 0.5, (len(query_types), n_per)).ravel()
+        y_all = rng.normal(type_idx, 0.8, (len(query_types), n_per)).ravel()
+        z_all = rng.normal(5 - type_idx, 0.6, (len(query_types), n_per)).ravel()
+        colors_all = np.repeat(np.arange(len(query_types)), n_per)
+        texts_all = np.repeat(query_types, n_per).tolist()
         
         fig.add_trace(
             go.Scatter3d(
@@ -1058,57 +1341,106 @@ insights for strategic decision-making.
             row=2, col=2
         )
         
-        # Update layout
-        fig.update_layout(
-            title='Search Enhancement with Graph Metrics',
-            height=900,
-            showlegend=True
-        )
-        
-        fig.update_xaxes(title_text="Page", row=1, col=1)
-        fig.update_yaxes(title_text="Rank (lower is better)", row=1, col=1)
-        
-        fig.update_scenes(
-            xaxis_title="Hierarchy Depth",
-            yaxis_title="Content Complexity", 
-            zaxis_title="Specificity Level",
-            row=2, col=2
-        )
+        # Update layout (batched so the layout is updated once, not per call)
+        with fig.batch_update():
+            fig.update_layout(
+                title='Search Enhancement with Graph Metrics',
+                height=900,
+                showlegend=True
+            )
+            
+            fig.update_xaxes(title_text="Page", row=1, col=1)
+            fig.update_yaxes(title_text="Rank (lower is better)", row=1, col=1)
+            
+            fig.update_scenes(
+                xaxis_title="Hierarchy Depth",
+                yaxis_title="Content Complexity", 
+                zaxis_title="Specificity Level",
+                row=2, col=2
+            )
         
         # Save
         output_file = self.output_dir / "search_enhancement_metrics.html"
-        fig.write_html(str(output_file))
+        self._write_html(fig, output_file)
         print(f"   ✅ Search enhancement visualization saved: {output_file}")
         
         return str(output_file)
     
     def _add_metrics_to_pages(self):
         """Add simulated metrics to pages for visualization"""
-        # Simulate metrics based on page structure
-        for page in self.actual_pages:
-            # Hierarchy depth based on ancestors
-            page['hierarchy_depth'] = len(page.get('ancestors', []))
-            
-            # Child count - simulate based on space and title
-            if 'overview' in page['title'].lower():
-                page['child_count'] = np.random.randint(5, 15)
-            elif 'index' in page['title'].lower():
-                page['child_count'] = np.random.randint(3, 10)
-            else:
-                page['child_count'] = np.random.randint(0, 3)
-            
-            # Centrality score - higher for overview pages, spaces roots
-            base_score = 0.001
-            if page['hierarchy_depth'] == 0:
-                base_score = 0.04 + np.random.uniform(0, 0.02)
-            elif page['hierarchy_depth'] == 1:
-                base_score = 0.02 + np.random.uniform(0, 0.01)
-            elif page['child_count'] > 5:
-                base_score = 0.03 + np.random.uniform(0, 0.01)
-            else:
-                base_score = np.random.uniform(0.001, 0.01)
-            
-            page['graph_centrality_score'] = round(base_score, 6)
+        pages = self.actual_pages
+        if not pages:
+            return
+        n = len(pages)
+        
+        # All random draws come from one seeded generator, one full-length array per
+        # distribution, so repeated runs simulate the same metrics
+        rng = np.random.default_rng(42)
+        ri_overview = rng.integers(5, 15, n)
+        ri_index = rng.integers(3, 10, n)
+        ri_other = rng.integers(0, 3, n)
+        u_root = rng.uniform(0, 0.02, n)
+        u_first_level = rng.uniform(0, 0.01, n)
+        u_hub = rng.uniform(0, 0.01, n)
+        u_other = rng.uniform(0.001, 0.01, n)
+        
+        # Simulate metrics based on page structure, one column at a time
+        # Hierarchy depth based on ancestors
+        depths = np.fromiter((len(page.get('ancestors', [])) for page in pages), dtype=np.int32, count=n)
+        
+        # Child count - simulate based on space and title
+        titles = np.char.lower(np.array([page['title'] for page in pages], dtype=np.str_))
+        is_overview = np.char.find(titles, 'overview') >= 0
+        is_index = np.char.find(titles, 'index') >= 0
+        # 'overview' wins over 'index' because np.select takes the first matching condition
+        child_counts = np.select([is_overview, is_index], [ri_overview, ri_index], default=ri_other)
+        
+        # Centrality score - higher for overview pages, spaces roots
+        scores = np.select(
+            [depths == 0, depths == 1, child_counts > 5],
+            [0.04 + u_root,
+             0.02 + u_first_level,
+             0.03 + u_hub],
+            default=u_other
+        ).round(6)
+        
+        # Write back to the page records once, as plain Python numbers
+        for page, depth, child_count, score in zip(pages, depths.tolist(), child_counts.tolist(), scores.tolist()):
+            page['hierarchy_depth'] = depth
+            page['child_count'] = child_count
+            page['graph_centrality_score'] = score
+    
+    # Independent outputs that only read the graph and statistics
+    PARALLEL_RENDERS = (
+        'create_actual_network_visualization',
+        'create_actual_dashboard',
+        'generate_actual_executive_report'
+    )
+    
+    def __getstate__(self):
+        # The live matplotlib figure stays with this process; workers create their own
+        state = self.__dict__.copy()
+        state['_fig'] = None
+        return state
+    
+    def render_all(self, backend: str = 'webgl', dpi: int = 150, max_workers: int = 3) -> Dict[str, str]:
+        """Render the network, dashboard and report; returns {method_name: output file}
+        
+        The WebGL network, dashboard and report each render in well under a second,
+        less than a worker process takes to start and re-import pandas/networkx/plotly,
+        so they run serially. Only the matplotlib export (backend='mpl') is slow enough
+        to overlap in worker processes, from one pickled snapshot of the presentation.
+        """
+        kwargs = {name: {} for name in self.PARALLEL_RENDERS}
+        kwargs['create_actual_network_visualization'] = {'backend': backend, 'dpi': dpi}
+        if backend != 'mpl':
+            return {name: getattr(self, name)(**kwargs[name]) for name in self.PARALLEL_RENDERS}
+        
+        snapshot = pickle.dumps(self)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(_render_in_worker, snapshot, name, kwargs[name])
+                       for name in self.PARALLEL_RENDERS}
+            return {name: future.result() for name, future in futures.items()}
     
     def create_complete_actual_presentation(self):
         """Create complete director presentation using actual 23 pages data"""
@@ -1124,16 +1456,17 @@ insights for strategic decision-making.
         # Print summary
         self.print_actual_statistics()
         
-        # Create visualizations
-        network_file = self.create_actual_network_visualization()
+        # Create visualizations (network, dashboard and report)
+        rendered = self.render_all()
+        network_file = rendered['create_actual_network_visualization']
         if network_file:
             files_created.append(network_file)
             
-        dashboard_file = self.create_actual_dashboard()
+        dashboard_file = rendered['create_actual_dashboard']
         if dashboard_file:
             files_created.append(dashboard_file)
             
-        # Create new metrics visualizations
+        # Create new metrics visualizations (these share simulated page metrics)
         metrics_file = self.create_metrics_visualization()
         if metrics_file:
             files_created.append(metrics_file)
@@ -1142,7 +1475,7 @@ insights for strategic decision-making.
         if search_file:
             files_created.append(search_file)
             
-        report_file = self.generate_actual_executive_report()
+        report_file = rendered['generate_actual_executive_report']
         if report_file:
             files_created.append(report_file)
         